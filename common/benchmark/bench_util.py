@@ -0,0 +1,154 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Micro-benchmarks of to_str and to_bytes.
+
+The converters run on the arguments of every Virtualization Libs call and on
+the schemas and plugin configuration the tools load, which on Python 3 are
+almost always text already. The cases convert schema-shaped dicts of
+several sizes and variables maps like the ones passed to run_bash, both when
+they already have the right type and when every string needs converting.
+
+For every case it reports the time per call, the minimum over a number of
+repeats. Since to_str and to_bytes convert dicts in place, every call gets a
+fresh copy of its input, made before the timing starts.
+
+Usage:
+    python benchmark/bench_util.py [--number N] [--repeat R] [--json]
+                                   [case ...]
+
+Cases are selected by a prefix of their name, for example to_str.
+"""
+
+import argparse
+import copy
+import json
+import sys
+import time
+
+from dlpx.virtualization.common.util import to_bytes, to_str
+
+_PROPERTY_COUNTS = (10, 100, 1000)
+_VARIABLE_COUNTS = (10, 1000, 10000)
+_DEPTH = 5000
+
+
+def _schema(properties):
+    """Returns a dict shaped like a plugin's schemas.json with the given
+    number of properties in each of its definitions."""
+    definition = {
+        'type': 'object',
+        'additionalProperties': False,
+        'required': ['name{}'.format(index)
+                     for index in range(0, properties, 10)],
+        'properties': {
+            'name{}'.format(index): {
+                'type': 'string',
+                'prettyName': 'Name {}'.format(index),
+                'description': 'The name of item {}.'.format(index),
+                'enum': ['a', 'b', 'c'],
+                'default': 'a'
+            } for index in range(properties)
+        },
+        'ordering': ['name{}'.format(index) for index in range(properties)]
+    }
+    return {name: copy.deepcopy(definition)
+            for name in ('repositoryDefinition', 'sourceConfigDefinition',
+                         'virtualSourceDefinition', 'linkedSourceDefinition',
+                         'snapshotDefinition')}
+
+
+def _variables(count):
+    return {'VARIABLE_{}'.format(index): 'value {}'.format(index)
+            for index in range(count)}
+
+
+def _encoded(value):
+    """Returns a copy of value with every string encoded to bytes."""
+    if isinstance(value, dict):
+        return {key: _encoded(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_encoded(item) for item in value]
+    if isinstance(value, str):
+        return value.encode('utf-8')
+    return value
+
+
+def _nested(depth, leaf):
+    value = leaf
+    for _ in range(depth):
+        value = [value]
+    return value
+
+
+def _cases():
+    """Returns (name, function, factory) for every benchmark case. The
+    function is called with a value returned by the factory."""
+    cases = []
+    inputs = [('schema properties={}'.format(count), _schema(count))
+              for count in _PROPERTY_COUNTS]
+    inputs += [('variables count={}'.format(count), _variables(count))
+               for count in _VARIABLE_COUNTS]
+    for name, value in inputs:
+        encoded = _encoded(value)
+        cases.append(('to_str unchanged {}'.format(name), to_str,
+                      lambda value=value: value))
+        cases.append(('to_str converted {}'.format(name), to_str,
+                      lambda encoded=encoded: copy.deepcopy(encoded)))
+        cases.append(('to_bytes unchanged {}'.format(name), to_bytes,
+                      lambda encoded=encoded: encoded))
+        cases.append(('to_bytes converted {}'.format(name), to_bytes,
+                      lambda value=value: copy.deepcopy(value)))
+    nested = _nested(_DEPTH, 'leaf')
+    cases.append(('to_str unchanged depth={}'.format(_DEPTH), to_str,
+                  lambda: nested))
+    return cases
+
+
+def _time(function, factory, number, repeat):
+    best = None
+    for _ in range(repeat):
+        values = [factory() for _ in range(number)]
+        start = time.perf_counter()
+        for value in values:
+            function(value)
+        elapsed = (time.perf_counter() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Measures the time to_str and to_bytes take per call.')
+    parser.add_argument('cases', nargs='*',
+                        help='Prefixes of the names of the cases to run.')
+    parser.add_argument('--number', type=int, default=100,
+                        help='Number of calls per repeat.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of repeats; the fastest one is reported.')
+    parser.add_argument('--json', action='store_true',
+                        help='Print the results as JSON.')
+    args = parser.parse_args(argv)
+
+    results = []
+    for name, function, factory in _cases():
+        if args.cases and not any(name.startswith(prefix)
+                                  for prefix in args.cases):
+            continue
+        seconds = _time(function, factory, args.number, args.repeat)
+        results.append({'case': name, 'microseconds': seconds * 1e6})
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return
+    width = max([len(result['case']) for result in results] + [4])
+    print('{:<{}} {:>12}'.format('case', width, 'us/call'))
+    for result in results:
+        print('{:<{}} {:>12.2f}'.format(result['case'], width,
+                                        result['microseconds']))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,7 +2,10 @@
 # Copyright (c) 2019, 2021 by Delphix. All rights reserved.
 #
 
+import collections
+import threading
 from abc import ABCMeta
+
 import six
 from dlpx.virtualization.api import common_pb2, libs_pb2
 from dlpx.virtualization.common.exceptions import IncorrectTypeError
@@ -25,7 +28,65 @@ __all__ = [
     "KeyPairCredentials"]
 
 
-class RemoteConnection(object):
+#
+# The objects returned by the from_proto methods of the Remote classes are
+# interned: converting a protobuf whose fields match an object converted
+# earlier returns that object. The connections of the requests for the same
+# host and user therefore share one object. Each class keeps the
+# _INTERN_SIZE objects it returned most recently, keyed by their reference.
+#
+_INTERN_SIZE = 256
+_intern_lock = threading.Lock()
+
+
+def _intern(cls, key, fields):
+    """Returns the interned object of class cls for key if its fields are the
+    given ones, and otherwise creates the object from the fields and interns
+    it in place of the old one."""
+    interned_objects = cls._interned_objects
+    with _intern_lock:
+        interned = interned_objects.get(key)
+        if interned is not None and interned._fields() == fields:
+            interned_objects.move_to_end(key)
+            return interned
+
+    interned = cls(*fields)
+    with _intern_lock:
+        interned_objects[key] = interned
+        interned_objects.move_to_end(key)
+        while len(interned_objects) > _INTERN_SIZE:
+            interned_objects.popitem(last=False)
+    return interned
+
+
+class _Remote(object):
+    """Base class of the Remote classes.
+
+    Instances are immutable, and equal and hash alike when all their fields
+    are equal, so they can be used as dict keys. Subclasses define _fields(),
+    which returns the tuple of their fields.
+    """
+    __slots__ = ()
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return hash(self._fields())
+
+    def __repr__(self):
+        return '{}{!r}'.format(type(self).__name__, self._fields())
+
+
+class RemoteConnection(_Remote):
     """Plugin class for RemoteConnection to be used for plugin operations
     and library functions.
 
@@ -37,6 +98,10 @@ class RemoteConnection(object):
         user: RemoteUser of this RemoteConnection.
 
     """
+    __slots__ = ('__environment', '__user', '__proto')
+
+    _interned_objects = collections.OrderedDict()
+
     def __init__(self, environment, user):
         if isinstance(environment, RemoteEnvironment):
             self.__environment = environment
@@ -55,6 +120,7 @@ class RemoteConnection(object):
                 'user',
                 type(user),
                 RemoteUser)
+        self.__proto = None
 
     @property
     def environment(self):
@@ -64,13 +130,31 @@ class RemoteConnection(object):
     def user(self):
         return self.__user
 
+    def _fields(self):
+        return self.__environment, self.__user
+
+    def _proto(self):
+        """Returns the protobuf form of the connection.
+
+        The message is built on the first call and the same message is
+        returned by every later call, so it must not be modified. Library
+        functions copy it into their requests with CopyFrom, which is much
+        cheaper than building it again for every call.
+        """
+        remote_connection = self.__proto
+        if remote_connection is None:
+            remote_connection = common_pb2.RemoteConnection()
+            remote_connection.environment.CopyFrom(self.environment.to_proto())
+            remote_connection.user.CopyFrom(self.user.to_proto())
+            self.__proto = remote_connection
+        return remote_connection
+
     def to_proto(self):
         """Converts plugin class RemoteConnection to protobuf class
         common_pb2.RemoteConnection
         """
         remote_connection = common_pb2.RemoteConnection()
-        remote_connection.environment.CopyFrom(self.environment.to_proto())
-        remote_connection.user.CopyFrom(self.user.to_proto())
+        remote_connection.CopyFrom(self._proto())
         return remote_connection
 
     @staticmethod
@@ -86,10 +170,12 @@ class RemoteConnection(object):
                 common_pb2.RemoteConnection)
         environment = RemoteEnvironment.from_proto(connection.environment)
         user = RemoteUser.from_proto(connection.user)
-        return RemoteConnection(environment=environment, user=user)
+        return _intern(RemoteConnection,
+                       (environment.reference, user.reference),
+                       (environment, user))
 
 
-class RemoteEnvironment(object):
+class RemoteEnvironment(_Remote):
     """Plugin class for RemoteEnvironment to be used for plugin operations
     and library functions.
 
@@ -102,6 +188,10 @@ class RemoteEnvironment(object):
         host: RemoteHost of the RemoteEnvironment.
 
     """
+    __slots__ = ('__name', '__reference', '__host')
+
+    _interned_objects = collections.OrderedDict()
+
     def __init__(self, name, reference, host):
         if not isinstance(name, six.string_types):
             raise IncorrectTypeError(
@@ -119,7 +209,7 @@ class RemoteEnvironment(object):
         self.__reference = reference
 
         if isinstance(host, RemoteHost):
-            self.host = host
+            self.__host = host
         else:
             raise IncorrectTypeError(
                 RemoteEnvironment,
@@ -135,6 +225,13 @@ class RemoteEnvironment(object):
     def reference(self):
         return self.__reference
 
+    @property
+    def host(self):
+        return self.__host
+
+    def _fields(self):
+        return self.__name, self.__reference, self.__host
+
     def to_proto(self):
         """
         Converts plugin class RemoteEnvironment to protobuf
@@ -158,12 +255,14 @@ class RemoteEnvironment(object):
                 'environment',
                 type(environment),
                 common_pb2.RemoteEnvironment)
-        return RemoteEnvironment(name=environment.name,
-                                 reference=environment.reference,
-                                 host=RemoteHost.from_proto(environment.host))
+        return _intern(RemoteEnvironment,
+                       environment.reference,
+                       (environment.name,
+                        environment.reference,
+                        RemoteHost.from_proto(environment.host)))
 
 
-class RemoteHost(object):
+class RemoteHost(_Remote):
     """Plugin class for RemoteHost to be used for plugin operations
     and library functions.
 
@@ -177,6 +276,10 @@ class RemoteHost(object):
         scratch_path: scratch path of the RemoteHost.
 
     """
+    __slots__ = ('__name', '__reference', '__binary_path', '__scratch_path')
+
+    _interned_objects = collections.OrderedDict()
+
     def __init__(self, name, reference, binary_path, scratch_path):
         if not isinstance(name, six.string_types):
             raise IncorrectTypeError(
@@ -223,6 +326,10 @@ class RemoteHost(object):
     def scratch_path(self):
         return self.__scratch_path
 
+    def _fields(self):
+        return (self.__name, self.__reference, self.__binary_path,
+                self.__scratch_path)
+
     def to_proto(self):
         """Converts plugin class RemoteHost to protobuf class common_pb2.RemoteHost
         """
@@ -243,13 +350,15 @@ class RemoteHost(object):
                 'host',
                 type(host),
                 common_pb2.RemoteHost)
-        return RemoteHost(name=host.name,
-                          reference=host.reference,
-                          binary_path=host.binary_path,
-                          scratch_path=host.scratch_path)
+        return _intern(RemoteHost,
+                       host.reference,
+                       (host.name,
+                        host.reference,
+                        host.binary_path,
+                        host.scratch_path))
 
 
-class RemoteUser(object):
+class RemoteUser(_Remote):
     """Plugin class for RemoteUser to be used for plugin operations
     and library functions.
 
@@ -260,6 +369,10 @@ class RemoteUser(object):
         name: Name of the RemoteUser.
         reference: Reference of the RemoteUser.
     """
+    __slots__ = ('__name', '__reference')
+
+    _interned_objects = collections.OrderedDict()
+
     def __init__(self, name, reference):
         if not isinstance(name, six.string_types):
             raise IncorrectTypeError(
@@ -284,6 +397,9 @@ class RemoteUser(object):
     def reference(self):
         return self.__reference
 
+    def _fields(self):
+        return self.__name, self.__reference
+
     def to_proto(self):
         """Converts plugin class RemoteUser to protobuf class common_pb2.RemoteUser
         """
@@ -302,8 +418,7 @@ class RemoteUser(object):
                 'user',
                 type(user),
                 common_pb2.RemoteUser)
-        remote_user = RemoteUser(name=user.name, reference=user.reference)
-        return remote_user
+        return _intern(RemoteUser, user.reference, (user.name, user.reference))
 
 
 class Credentials(object):
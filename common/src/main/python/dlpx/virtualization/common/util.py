@@ -9,11 +9,118 @@ Utility functions to convert between unicode and bytes.
 
 import six
 
+#
+# The containers whose elements to_str and to_bytes convert. Tuples and other
+# iterables are returned as they are.
+#
+_CONTAINERS = (dict, list, set)
+
+
+class _Frame(object):
+    """A container that _convert is walking, with its progress so far.
+
+    For a dict, output holds the values that changed, keyed by their key. For
+    a list or a set, it holds the converted elements once the first element
+    changed, and is None until then.
+    """
+    __slots__ = ('value', 'key', 'elements', 'items', 'output')
+
+    def __init__(self, value, key=None):
+        self.value = value
+        self.key = key
+        self.output = None
+        if isinstance(value, dict):
+            self.elements = None
+            self.items = iter(value.items())
+        else:
+            self.elements = value if isinstance(value, list) else list(value)
+            self.items = enumerate(self.elements)
+
+    def add(self, key, item, result):
+        if self.elements is None:
+            if result is not item:
+                if self.output is None:
+                    self.output = {}
+                self.output[key] = result
+        elif self.output is not None:
+            self.output.append(result)
+        elif result is not item:
+            self.output = self.elements[:key]
+            self.output.append(result)
+
+    def result(self):
+        if self.output is None:
+            return self.value
+        if self.elements is None:
+            self.value.update(self.output)
+            return self.value
+        if isinstance(self.value, list):
+            return self.output
+        return set(self.output)
+
+
+def _convert(value, source_type, target_type, convert):
+    """Converts every source_type value in value with convert.
+
+    Dicts, lists and sets are walked with an explicit stack, so arbitrarily
+    deep nesting does not hit the recursion limit. The values of a dict are
+    converted in place and its keys are left as they are. A list or a set is
+    only copied if one of its elements changed; otherwise, like any value
+    that needs no conversion, it is returned as it is. Values of exactly
+    target_type, which are the bulk of most payloads, are skipped with a
+    single type check.
+    """
+    if isinstance(value, source_type):
+        return convert(value)
+    if not isinstance(value, _CONTAINERS):
+        return value
+
+    stack = [_Frame(value)]
+    while True:
+        frame = stack[-1]
+        child = None
+        if frame.elements is None:
+            for key, item in frame.items:
+                if type(item) is target_type:
+                    continue
+                if isinstance(item, source_type):
+                    if frame.output is None:
+                        frame.output = {}
+                    frame.output[key] = convert(item)
+                elif isinstance(item, _CONTAINERS):
+                    child = _Frame(item, key)
+                    break
+        else:
+            output = frame.output
+            for index, item in frame.items:
+                if type(item) is not target_type:
+                    if isinstance(item, source_type):
+                        item = convert(item)
+                        if output is None:
+                            output = frame.output = frame.elements[:index]
+                    elif isinstance(item, _CONTAINERS):
+                        child = _Frame(item, index)
+                        break
+                if output is not None:
+                    output.append(item)
+
+        if child is not None:
+            stack.append(child)
+            continue
+        stack.pop()
+        result = frame.result()
+        if not stack:
+            return result
+        stack[-1].add(frame.key, frame.value, result)
+
 
 def to_bytes(string, encoding="utf-8"):
     """
     Converts the given object to binary object, bytes (Py3) or str (Py2).
 
+    Strings nested in dicts, lists and sets are converted too. Objects that
+    need no conversion are returned as they are.
+
     :param string: The string like object to convert to bytes
     :type string: ``object``
     :param encoding: The encoding to encode the string with.
@@ -21,24 +128,7 @@ def to_bytes(string, encoding="utf-8"):
     :returns: The encoded string.
     :rtype: ``bytes``
     """
-    if string is None:
-        return
-
-    if isinstance(string, dict):
-        for k, v in string.items():
-            string[k] = to_bytes(v, encoding=encoding)
-        return string
-
-    if isinstance(string, list):
-        return [to_bytes(i, encoding=encoding) for i in string]
-
-    if isinstance(string, set):
-        return {to_bytes(i, encoding=encoding) for i in string}
-
-    if isinstance(string, str):
-        return _to_bytes(string, encoding)
-
-    return string
+    return _convert(string, str, bytes, lambda s: _to_bytes(s, encoding))
 
 
 def _to_bytes(string, encoding):
@@ -58,6 +148,9 @@ def to_str(b, encoding="utf-8"):
     """
     Converts the given object to a text object, unicode (Py2) or str (Py3).
 
+    Bytes nested in dicts, lists and sets are converted too. Objects that need
+    no conversion are returned as they are.
+
     :param b: The object to convert
     :type b: ``object``
     :param encoding: The encoding to encode the string with.
@@ -65,23 +158,7 @@ def to_str(b, encoding="utf-8"):
     :returns: The decoded string.
     :rtype: ``str``
     """
-    if b is None:
-        return
-
-    if isinstance(b, dict):
-        for k, v in b.items():
-            b[k] = to_str(v, encoding=encoding)
-        return b
-
-    if isinstance(b, list):
-        return [to_str(i, encoding=encoding) for i in b]
-
-    if isinstance(b, set):
-        return {to_str(i, encoding=encoding) for i in b}
-
-    if isinstance(b, bytes):
-        return _to_str(b, encoding=encoding)
-    return b
+    return _convert(b, bytes, str, lambda b: _to_str(b, encoding=encoding))
 
 
 def _to_str(b, encoding):
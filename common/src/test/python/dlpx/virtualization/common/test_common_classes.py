@@ -5,6 +5,7 @@
 import pytest
 import six
 from dlpx.virtualization.api import common_pb2
+from dlpx.virtualization.common import _common_classes
 from dlpx.virtualization.common._common_classes import (
     KeyPairCredentials, PasswordCredentials, RemoteConnection, RemoteEnvironment,
     RemoteHost, RemoteUser)
@@ -68,6 +69,17 @@ class TestRemoteConnection:
         remote_connection_proto = remote_connection.to_proto()
         assert isinstance(remote_connection_proto, common_pb2.RemoteConnection)
 
+    @staticmethod
+    def test_remote_connection_to_proto_copy(remote_user, remote_environment):
+        remote_connection = RemoteConnection(remote_environment, remote_user)
+        remote_connection_proto = remote_connection.to_proto()
+        remote_connection_proto.user.name = 'other'
+
+        assert remote_connection.to_proto().user.name == 'user'
+        assert remote_connection.to_proto() is not remote_connection.to_proto()
+        assert remote_connection._proto() is remote_connection._proto()
+        assert remote_connection._proto() == remote_connection.to_proto()
+
     @staticmethod
     def test_remote_connection_from_proto_success():
         remote_conn_proto_buf = common_pb2.RemoteConnection()
@@ -89,6 +101,52 @@ class TestRemoteConnection:
                 " class 'str' but should be of class 'dlpx.virtualization.api"
                 ".common_pb2.RemoteConnection'.")
 
+    @staticmethod
+    def test_remote_connection_from_proto_interned(remote_user,
+                                                   remote_environment):
+        connection = RemoteConnection(remote_environment, remote_user)
+
+        first = RemoteConnection.from_proto(connection.to_proto())
+        second = RemoteConnection.from_proto(connection.to_proto())
+
+        assert first is second
+        assert first == connection
+        assert {connection: 'value'}[first] == 'value'
+
+    @staticmethod
+    def test_remote_connection_from_proto_changed_fields(remote_user,
+                                                         remote_environment):
+        proto = RemoteConnection(remote_environment, remote_user).to_proto()
+        first = RemoteConnection.from_proto(proto)
+        proto.environment.host.scratch_path = 'other_scratch_path'
+
+        second = RemoteConnection.from_proto(proto)
+
+        assert second is not first
+        assert second != first
+        assert second.environment.host.scratch_path == 'other_scratch_path'
+        assert RemoteConnection.from_proto(proto) is second
+
+    @staticmethod
+    def test_remote_connection_interned_objects_bounded(remote_user):
+        for index in range(_common_classes._INTERN_SIZE + 10):
+            host = RemoteHost('host', 'host-{}'.format(index), '', '')
+            RemoteHost.from_proto(host.to_proto())
+
+        assert (len(RemoteHost._interned_objects) ==
+                _common_classes._INTERN_SIZE)
+
+    @staticmethod
+    def test_remote_connection_immutable(remote_user, remote_environment):
+        connection = RemoteConnection(remote_environment, remote_user)
+
+        with pytest.raises(AttributeError):
+            connection.user = remote_user
+        with pytest.raises(AttributeError):
+            remote_environment.host = None
+        with pytest.raises(AttributeError):
+            connection.other = 'value'
+
 
 class TestRemoteEnvironment:
     @staticmethod
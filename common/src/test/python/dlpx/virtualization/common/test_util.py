@@ -0,0 +1,83 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import sys
+
+import pytest
+from dlpx.virtualization.common.util import to_bytes, to_str
+
+
+class TestToStr:
+    @staticmethod
+    def test_to_str():
+        assert to_str(b'value') == 'value'
+        assert to_str(None) is None
+        assert to_str(1) == 1
+
+    @staticmethod
+    def test_to_str_nested():
+        value = {'key': [b'a', 'b', {b'c'}], 'other': {'nested': b'd'}}
+
+        result = to_str(value)
+
+        assert result is value
+        assert result == {'key': ['a', 'b', {'c'}], 'other': {'nested': 'd'}}
+
+    @staticmethod
+    def test_to_str_unchanged():
+        value = {'key': ['a', {'b'}, ('c', b'd')], 'other': {'nested': 1}}
+        items = value['key']
+
+        assert to_str(value) is value
+        assert value['key'] is items
+        assert to_str(items) is items
+
+    @staticmethod
+    def test_to_str_copies_changed_lists():
+        value = ['a', b'b', 'c']
+
+        result = to_str(value)
+
+        assert result == ['a', 'b', 'c']
+        assert value == ['a', b'b', 'c']
+
+    @staticmethod
+    def test_to_str_deep():
+        value = b'leaf'
+        for _ in range(sys.getrecursionlimit() * 2):
+            value = [value]
+
+        result = to_str(value)
+
+        for _ in range(sys.getrecursionlimit() * 2):
+            result = result[0]
+        assert result == 'leaf'
+
+    @staticmethod
+    def test_to_str_invalid():
+        with pytest.raises(UnicodeError):
+            to_str([b'\xff'])
+
+
+class TestToBytes:
+    @staticmethod
+    def test_to_bytes():
+        assert to_bytes('value') == b'value'
+        assert to_bytes(None) is None
+        assert to_bytes(b'value') == b'value'
+
+    @staticmethod
+    def test_to_bytes_nested():
+        value = {'key': ['a', b'b'], 'other': {'nested': 'c'}}
+
+        result = to_bytes(value)
+
+        assert result is value
+        assert result == {'key': [b'a', b'b'], 'other': {'nested': b'c'}}
+
+    @staticmethod
+    def test_to_bytes_unchanged():
+        value = [b'a', {b'b'}, [1, None]]
+
+        assert to_bytes(value) is value
@@ -0,0 +1,191 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Micro-benchmarks of the overhead of the Virtualization Libs API wrappers.
+
+Every wrapper converts and validates its arguments, builds a request message
+and unpacks the response. This script measures what that costs per call by
+running the wrappers against an engine stub that returns prebuilt responses
+without doing any work, for several numbers of variables and output sizes.
+
+For every case it reports the time per call, the minimum over a number of
+repeats, and the peak memory the call allocates, as measured by tracemalloc.
+Memory that the protobuf runtime allocates outside of the Python allocator,
+such as the storage of the request messages, is not included.
+
+Usage:
+    python benchmark/bench_libs.py [--number N] [--repeat R] [--json]
+                                   [case ...]
+
+Cases are selected by a prefix of their name, for example run_bash.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+import tracemalloc
+
+from dlpx.virtualization.api import libs_pb2
+from dlpx.virtualization import libs
+from dlpx.virtualization.common._common_classes import (RemoteConnection,
+                                                        RemoteEnvironment,
+                                                        RemoteHost, RemoteUser)
+from dlpx.virtualization.libs import libs as wrappers
+from dlpx.virtualization.libs.fake_engine import FakeEngine
+
+_VARIABLE_COUNTS = (0, 10, 100, 1000)
+_OUTPUT_SIZES = (0, 4 * 1024, 1024 * 1024)
+_PATH_COUNTS = (0, 10, 100, 1000)
+_MESSAGE_SIZES = (100, 64 * 1024)
+
+
+class _NoopEngine(FakeEngine):
+    """An engine whose operations return the same prebuilt response on every
+    call, so that only the cost of the wrappers is measured."""
+    def __init__(self, output_size=0):
+        super(_NoopEngine, self).__init__()
+        output = u'x' * output_size
+        self.__responses = {}
+        for name, response_class in (
+                ('run_bash', libs_pb2.RunBashResponse),
+                ('run_powershell', libs_pb2.RunPowerShellResponse),
+                ('run_expect', libs_pb2.RunExpectResponse)):
+            response = response_class()
+            response.return_value.exit_code = 0
+            response.return_value.stdout = output
+            response.return_value.stderr = u''
+            self.__responses[name] = response
+        self.__responses['run_sync'] = libs_pb2.RunSyncResponse()
+        self.__responses['log'] = libs_pb2.LogResponse()
+
+    def run_bash(self, request):
+        return self.__responses['run_bash']
+
+    def run_powershell(self, request):
+        return self.__responses['run_powershell']
+
+    def run_expect(self, request):
+        return self.__responses['run_expect']
+
+    def run_sync(self, request):
+        return self.__responses['run_sync']
+
+    def log(self, request):
+        return self.__responses['log']
+
+
+def _remote_connection():
+    host = RemoteHost('host', 'host-reference', 'binary_path', 'scratch_path')
+    environment = RemoteEnvironment('environment', 'environment-reference',
+                                    host)
+    return RemoteConnection(environment, RemoteUser('user', 'user-reference'))
+
+
+def _cases():
+    """Returns (name, output size, function) for every benchmark case."""
+    connection = _remote_connection()
+    cases = []
+    for operation in ('run_bash', 'run_powershell', 'run_expect'):
+        function = getattr(libs, operation)
+        for count in _VARIABLE_COUNTS:
+            variables = {'VARIABLE_{}'.format(index): 'value'
+                         for index in range(count)}
+            cases.append((
+                '{} variables={}'.format(operation, count), 0,
+                lambda function=function, variables=variables: function(
+                    connection, 'true', variables=variables)))
+        for size in _OUTPUT_SIZES[1:]:
+            cases.append((
+                '{} output={}'.format(operation, size), size,
+                lambda function=function: function(connection, 'true').stdout))
+    for count in _PATH_COUNTS:
+        paths = ['path/{}'.format(index) for index in range(count)]
+        cases.append((
+            'run_sync exclude_paths={}'.format(count), 0,
+            lambda paths=paths: libs.run_sync(connection, '/data',
+                                              exclude_paths=paths)))
+    for size in _MESSAGE_SIZES:
+        message = u'x' * size
+        cases.append((
+            '_log_request message={}'.format(size), 0,
+            lambda message=message: wrappers._log_request(message,
+                                                          logging.INFO)))
+    return cases
+
+
+def _time(function, number, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = (time.perf_counter() - start) / number
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _peak_memory(function, number):
+    """Returns the largest amount of memory allocated during a single call,
+    in bytes."""
+    function()
+    tracemalloc.start()
+    try:
+        peak = 0
+        for _ in range(number):
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+            function()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+        return peak
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Measures the per call overhead of the Virtualization'
+                    ' Libs API wrappers.')
+    parser.add_argument('cases', nargs='*',
+                        help='Prefixes of the names of the cases to run.')
+    parser.add_argument('--number', type=int, default=1000,
+                        help='Number of calls per repeat.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of repeats; the fastest one is reported.')
+    parser.add_argument('--json', action='store_true',
+                        help='Print the results as JSON.')
+    args = parser.parse_args(argv)
+
+    results = []
+    engines = {}
+    for name, output_size, function in _cases():
+        if args.cases and not any(name.startswith(prefix)
+                                  for prefix in args.cases):
+            continue
+        engine = engines.get(output_size)
+        if engine is None:
+            engine = engines[output_size] = _NoopEngine(output_size)
+        with engine:
+            seconds = _time(function, args.number, args.repeat)
+            peak = _peak_memory(function, min(args.number, 100))
+        results.append({'case': name,
+                        'microseconds': seconds * 1e6,
+                        'peak_bytes': peak})
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return
+    width = max([len(result['case']) for result in results] + [4])
+    print('{:<{}} {:>12} {:>12}'.format('case', width, 'us/call',
+                                        'peak bytes'))
+    for result in results:
+        print('{:<{}} {:>12.2f} {:>12}'.format(result['case'], width,
+                                               result['microseconds'],
+                                               result['peak_bytes']))
+
+
+if __name__ == '__main__':
+    main()
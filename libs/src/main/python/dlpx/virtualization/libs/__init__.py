@@ -6,3 +6,18 @@ __path__ = __import__('pkgutil').extend_path(__path__, __name__)
 
 from dlpx.virtualization.libs.libs import *  # noqa
 from dlpx.virtualization.libs._logging import *  # noqa
+from dlpx.virtualization.libs._result import *  # noqa
+from dlpx.virtualization.libs._credentials_cache import *  # noqa
+from dlpx.virtualization.libs._login_env import *  # noqa
+from dlpx.virtualization.libs._batch import *  # noqa
+from dlpx.virtualization.libs._fanout import *  # noqa
+from dlpx.virtualization.libs._stream import *  # noqa
+from dlpx.virtualization.libs._script_cache import *  # noqa
+from dlpx.virtualization.libs._session import *  # noqa
+from dlpx.virtualization.libs._files import *  # noqa
+from dlpx.virtualization.libs._query import *  # noqa
+from dlpx.virtualization.libs._sync import *  # noqa
+from dlpx.virtualization.libs._hash import *  # noqa
+from dlpx.virtualization.libs._pipe import *  # noqa
+from dlpx.virtualization.libs import aio  # noqa
+from dlpx.virtualization.libs import metrics  # noqa
@@ -0,0 +1,311 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Batched remote execution.
+
+Running many small commands with run_bash or run_powershell costs one engine
+callback and one remote round trip per command. The batch wrappers in this
+module combine a list of commands into a single generated script, run it with
+one library call and split the output back into per-command results.
+"""
+
+import six
+
+from dlpx.virtualization.common._common_classes import RemoteConnection
+from dlpx.virtualization.common.util import to_str
+from dlpx.virtualization.libs import libs
+from dlpx.virtualization.libs._shell import (new_marker, quote_ps, quote_sh,
+                                             split_frames)
+from dlpx.virtualization.libs.exceptions import (IncorrectArgumentTypeError,
+                                                 PluginScriptError)
+
+__all__ = [
+    "BatchItemResult",
+    "run_bash_batch",
+    "run_powershell_batch"
+]
+
+
+class BatchItemResult(object):
+    """The result of a single command of a batch.
+
+    Args:
+        index (int): Position of the command in the batch.
+        exit_code (int): Exit code of the command.
+        stdout (str): Stdout of the command.
+        stderr (str): Stderr of the command.
+        start_time (float): Time the command started at, in seconds since the
+            epoch, as measured on the remote host.
+        duration (float): Time the command took, in seconds.
+    """
+    def __init__(self, index, exit_code, stdout, stderr, start_time, duration):
+        self.__index = index
+        self.__exit_code = exit_code
+        self.__stdout = stdout
+        self.__stderr = stderr
+        self.__start_time = start_time
+        self.__duration = duration
+
+    @property
+    def index(self):
+        return self.__index
+
+    @property
+    def exit_code(self):
+        return self.__exit_code
+
+    @property
+    def stdout(self):
+        return self.__stdout
+
+    @property
+    def stderr(self):
+        return self.__stderr
+
+    @property
+    def start_time(self):
+        return self.__start_time
+
+    @property
+    def duration(self):
+        return self.__duration
+
+
+_BASH_PROLOGUE = u"""\
+__dlpx_m={marker}
+__dlpx_d=$(mktemp -d {scratch}/dlpx-batch.XXXXXX) || exit 1
+trap 'rm -rf "$__dlpx_d"' EXIT
+__dlpx_now() {{
+    if [ -n "$EPOCHREALTIME" ]; then echo "$EPOCHREALTIME"; else date +%s; fi
+}}
+__dlpx_run() {{
+    __dlpx_s=$(__dlpx_now)
+    eval "$2" >"$__dlpx_d/out" 2>"$__dlpx_d/err" </dev/null
+    __dlpx_rc=$?
+    __dlpx_e=$(__dlpx_now)
+    printf '%s %s %s %s %s\\n' "$__dlpx_m" "$1" "$__dlpx_rc" "$__dlpx_s" \\
+        "$__dlpx_e"
+    cat "$__dlpx_d/out"
+    printf '\\n%s stderr\\n' "$__dlpx_m"
+    cat "$__dlpx_d/err"
+    printf '\\n'
+    return $__dlpx_rc
+}}
+"""
+
+_POWERSHELL_PROLOGUE = u"""\
+$__dlpxM = {marker}
+$__dlpxEpoch = New-Object DateTime 1970, 1, 1, 0, 0, 0, ([DateTimeKind]::Utc)
+$__dlpxInv = [Globalization.CultureInfo]::InvariantCulture
+function __DlpxRun([int]$Index, [string]$Command, [hashtable]$Variables) {{
+    $saved = @{{}}
+    foreach ($name in $Variables.Keys) {{
+        $saved[$name] = [Environment]::GetEnvironmentVariable($name)
+        [Environment]::SetEnvironmentVariable($name, $Variables[$name])
+    }}
+    $out = New-Object System.Text.StringBuilder
+    $err = New-Object System.Text.StringBuilder
+    $failed = $false
+    $global:LASTEXITCODE = 0
+    $start = ([DateTime]::UtcNow - $__dlpxEpoch).TotalSeconds
+    $watch = [Diagnostics.Stopwatch]::StartNew()
+    try {{
+        & ([scriptblock]::Create($Command)) 2>&1 | ForEach-Object {{
+            if ($_ -is [Management.Automation.ErrorRecord]) {{
+                [void]$err.AppendLine(($_ | Out-String).TrimEnd())
+            }} else {{
+                [void]$out.AppendLine(($_ | Out-String).TrimEnd())
+            }}
+        }}
+    }} catch {{
+        $failed = $true
+        [void]$err.AppendLine(($_ | Out-String).TrimEnd())
+    }}
+    $watch.Stop()
+    $rc = $global:LASTEXITCODE
+    if ($rc -eq $null) {{ $rc = 0 }}
+    if ($rc -eq 0 -and $failed) {{ $rc = 1 }}
+    foreach ($name in $saved.Keys) {{
+        [Environment]::SetEnvironmentVariable($name, $saved[$name])
+    }}
+    $end = $start + $watch.Elapsed.TotalSeconds
+    $format = "{{0}} {{1}} {{2}} {{3}} {{4}}`n{{5}}`n{{0}} stderr`n{{6}}`n"
+    [Console]::Out.Write(($format -f
+        $__dlpxM, $Index, $rc, $start.ToString($__dlpxInv),
+        $end.ToString($__dlpxInv), $out.ToString().TrimEnd(),
+        $err.ToString().TrimEnd()))
+    return $rc
+}}
+"""
+
+
+def _invalid_items(items):
+    """Validates the items of a batch and normalizes them.
+
+    Returns:
+        tuple: (items, error) where items is a list of (command, variables)
+        tuples and error is None, or the (actual_type, expected_type) to
+        report if the items are not valid.
+    """
+    expected = [tuple]
+    if not isinstance(items, (list, tuple)):
+        return None, (type(items), expected)
+    normalized = []
+    for item in items:
+        if isinstance(item, (tuple, list)) and len(item) in (1, 2):
+            command = to_str(item[0])
+            variables = to_str(item[1]) if len(item) == 2 else None
+        else:
+            command, variables = to_str(item), None
+        if variables is None:
+            variables = {}
+        if (not isinstance(command, six.string_types) or
+                not isinstance(variables, dict) or
+                not all(isinstance(variable, six.string_types) and
+                        isinstance(value, six.string_types)
+                        for variable, value in variables.items())):
+            return None, ([type(i) for i in items], expected)
+        normalized.append((command, variables))
+    return normalized, None
+
+
+def _parse_results(result, marker):
+    results = []
+    frames = split_frames(result.stdout, marker)
+    for (header, stdout), (_, stderr) in zip(frames[::2], frames[1::2]):
+        index, exit_code, start, end = header
+        start = float(start.replace(u',', u'.'))
+        end = float(end.replace(u',', u'.'))
+        results.append(BatchItemResult(
+            int(index), int(exit_code), stdout, stderr, start, end - start))
+    return results
+
+
+def _finish(result, marker, count, stop_on_failure, check):
+    results = _parse_results(result, marker)
+    stopped = (stop_on_failure and results and
+               results[-1].exit_code != 0)
+    if len(results) != count and not stopped:
+        raise PluginScriptError('The batch script failed with exit code {}'
+                                ' after {} of {} commands.'
+                                ' stdout : {} and '
+                                ' stderr : {}'.format(
+                                      result.exit_code,
+                                      len(results),
+                                      count,
+                                      result.stdout,
+                                      result.stderr))
+    if check:
+        for item in results:
+            if item.exit_code != 0:
+                raise PluginScriptError('The script failed with exit code {}.'
+                                        ' stdout : {} and '
+                                        ' stderr : {}'.format(
+                                              item.exit_code,
+                                              item.stdout,
+                                              item.stderr))
+    return results
+
+
+def run_bash_batch(remote_connection, items, use_login_shell=False,
+                   stop_on_failure=False, check=False):
+    """Runs several bash commands with a single run_bash call.
+
+    Each command runs in the order given, in its own environment with its own
+    variables, and its stdout, stderr, exit code and timing are reported
+    separately. All commands share one remote round trip.
+
+    Args:
+        remote_connection (RemoteConnection): Connection to a remote
+        environment.
+        items (list): The commands to run. Each item is either a command
+        (str) or a tuple of (command, variables), where variables is a dict
+        of str:str of environment variables to set for that command.
+        use_login_shell (bool): Whether to use login shell.
+        stop_on_failure (bool): If True, no further commands are run after a
+        command exits with a non-zero exit code.
+        check (bool): if True and a command exits with a non-zero exit code,
+        raise PluginScriptError
+
+    Returns:
+        list of BatchItemResult: One result per command that was run, in the
+        order of items.
+    """
+    if not isinstance(remote_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'remote_connection',
+            type(remote_connection),
+            RemoteConnection)
+    items, error = _invalid_items(items)
+    if error:
+        raise IncorrectArgumentTypeError('items', *error)
+    if use_login_shell and not isinstance(use_login_shell, bool):
+        raise IncorrectArgumentTypeError(
+            'use_login_shell', type(use_login_shell), bool, False)
+
+    marker = new_marker()
+    script = [_BASH_PROLOGUE.format(
+        marker=quote_sh(marker),
+        scratch=quote_sh(remote_connection.environment.host.scratch_path))]
+    for index, (command, variables) in enumerate(items):
+        exports = u''.join(u'export {} && '.format(
+            quote_sh(u'{}={}'.format(name, value)))
+            for name, value in variables.items())
+        script.append(u'__dlpx_run {} {}{}\n'.format(
+            index,
+            quote_sh(u'({}eval {})'.format(exports, quote_sh(command))),
+            u' || exit 0' if stop_on_failure else u''))
+
+    result = libs.run_bash(remote_connection, u''.join(script),
+                           use_login_shell=use_login_shell)
+    return _finish(result, marker, len(items), stop_on_failure, check)
+
+
+def run_powershell_batch(remote_connection, items, stop_on_failure=False,
+                         check=False):
+    """Runs several powershell commands with a single run_powershell call.
+
+    Each command runs in the order given with its own variables, and its
+    output, errors, exit code and timing are reported separately. All
+    commands share one remote round trip and one PowerShell session, so a
+    command that calls exit ends the whole batch.
+
+    Args:
+        remote_connection (RemoteConnection): Connection to a remote
+        environment.
+        items (list): The commands to run. Each item is either a command
+        (str) or a tuple of (command, variables), where variables is a dict
+        of str:str of environment variables to set for that command.
+        stop_on_failure (bool): If True, no further commands are run after a
+        command exits with a non-zero exit code.
+        check (bool): if True and a command exits with a non-zero exit code,
+        raise PluginScriptError
+
+    Returns:
+        list of BatchItemResult: One result per command that was run, in the
+        order of items.
+    """
+    if not isinstance(remote_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'remote_connection',
+            type(remote_connection),
+            RemoteConnection)
+    items, error = _invalid_items(items)
+    if error:
+        raise IncorrectArgumentTypeError('items', *error)
+
+    marker = new_marker()
+    script = [_POWERSHELL_PROLOGUE.format(marker=quote_ps(marker))]
+    for index, (command, variables) in enumerate(items):
+        script.append(u'$__dlpxRc = __DlpxRun {} {} @{{{}}}\n'.format(
+            index,
+            quote_ps(command),
+            u'; '.join(u'{} = {}'.format(quote_ps(name), quote_ps(value))
+                       for name, value in variables.items())))
+        if stop_on_failure:
+            script.append(u'if ($__dlpxRc -ne 0) { exit 0 }\n')
+    script.append(u'exit 0\n')
+
+    result = libs.run_powershell(remote_connection, u''.join(script))
+    return _finish(result, marker, len(items), stop_on_failure, check)
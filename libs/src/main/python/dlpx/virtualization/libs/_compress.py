@@ -0,0 +1,126 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Compressed command output for run_bash and run_powershell.
+
+With compress_output=True the command runs inside a generated script that
+captures its stdout and stderr, gzips them on the remote host and writes them
+base64-encoded as two frames. The wrapper decodes and decompresses the frames
+back into a CommandResult, so the plugin sees the same exit code and output
+as without compression while much less data crosses the engine-to-host
+channel and counts against the callback message limit.
+
+PowerShell output is the exception: the wrapper collects the objects the
+script writes and renders each of them with Out-String, without trailing
+whitespace, on a line of its own. Its output is therefore formatted like
+the output of the script run interactively, which can differ in line
+breaks and trailing whitespace from the output run_powershell returns
+without compression.
+"""
+
+import base64
+import gzip
+
+from dlpx.virtualization.libs._result import CommandResult
+from dlpx.virtualization.libs._shell import (BASH_BASE64, quote_ps, quote_sh,
+                                             split_frames)
+from dlpx.virtualization.libs.exceptions import PluginScriptError
+
+_BASH_COMMAND = u"""\
+__dlpx_d=$(mktemp -d {scratch}/dlpx-gzip.XXXXXX) || exit 1
+(eval {command}) >"$__dlpx_d/out" 2>"$__dlpx_d/err"
+__dlpx_rc=$?
+if command -v gzip >/dev/null 2>&1; then
+    __dlpx_z=gzip; __dlpx_c='gzip -c'
+else
+    __dlpx_z=plain; __dlpx_c=cat
+fi
+printf '%s stdout %s\\n' {marker} "$__dlpx_z"
+$__dlpx_c "$__dlpx_d/out" | __dlpx_b64
+printf '\\n%s stderr %s\\n' {marker} "$__dlpx_z"
+$__dlpx_c "$__dlpx_d/err" | __dlpx_b64
+printf '\\n'
+rm -rf "$__dlpx_d"
+exit $__dlpx_rc
+"""
+
+_POWERSHELL_COMMAND = u"""\
+function __DlpxGzip([string]$Text) {{
+    $bytes = [Text.Encoding]::UTF8.GetBytes($Text)
+    $buffer = New-Object IO.MemoryStream
+    $gzip = New-Object IO.Compression.GZipStream($buffer,
+        [IO.Compression.CompressionMode]::Compress)
+    $gzip.Write($bytes, 0, $bytes.Length)
+    $gzip.Close()
+    return [Convert]::ToBase64String($buffer.ToArray())
+}}
+$__dlpxOut = New-Object System.Text.StringBuilder
+$__dlpxErr = New-Object System.Text.StringBuilder
+$__dlpxFailed = $false
+$global:LASTEXITCODE = 0
+#
+# An exit in the script ends this one too, so the frames are written from
+# finally and the exit code of the script is kept.
+#
+try {{
+    & ([scriptblock]::Create({command})) 2>&1 | ForEach-Object {{
+        if ($_ -is [Management.Automation.ErrorRecord]) {{
+            [void]$__dlpxErr.AppendLine(($_ | Out-String).TrimEnd())
+        }} else {{
+            [void]$__dlpxOut.AppendLine(($_ | Out-String).TrimEnd())
+        }}
+    }}
+}} catch {{
+    $__dlpxFailed = $true
+    [void]$__dlpxErr.AppendLine(($_ | Out-String).TrimEnd())
+}} finally {{
+    [Console]::Out.Write(("{{0}} stdout gzip`n{{1}}`n{{0}} stderr gzip`n{{2}}`n" -f
+        {marker}, (__DlpxGzip $__dlpxOut.ToString()),
+        (__DlpxGzip $__dlpxErr.ToString())))
+}}
+$__dlpxRc = $global:LASTEXITCODE
+if ($__dlpxRc -eq $null) {{ $__dlpxRc = 0 }}
+if ($__dlpxRc -eq 0 -and $__dlpxFailed) {{ $__dlpxRc = 1 }}
+exit $__dlpxRc
+"""
+
+
+def bash_command(command, marker, scratch):
+    """Wraps a bash command so that its output is returned compressed."""
+    return BASH_BASE64 + _BASH_COMMAND.format(scratch=quote_sh(scratch),
+                                              command=quote_sh(command),
+                                              marker=quote_sh(marker))
+
+
+def powershell_command(command, marker):
+    """Wraps a PowerShell script so that its output is returned compressed."""
+    return _POWERSHELL_COMMAND.format(command=quote_ps(command),
+                                      marker=quote_ps(marker))
+
+
+def decompress(result, marker):
+    """Turns the result of a wrapped command into the CommandResult of the
+    command itself.
+
+    Raises:
+        PluginScriptError: If the output of the wrapped command could not be
+        read back, for example because the remote shell was killed.
+    """
+    output = {}
+    for header, body in split_frames(result.stdout, marker):
+        if len(header) != 2 or header[0] not in ('stdout', 'stderr'):
+            continue
+        data = base64.b64decode(body)
+        if header[1] == 'gzip':
+            data = gzip.decompress(data)
+        output[header[0]] = data
+
+    if len(output) != 2:
+        raise PluginScriptError('Failed to read the compressed output of the'
+                                ' command. The script exited with exit code {}.'
+                                ' stdout : {} and '
+                                ' stderr : {}'.format(result.exit_code,
+                                                      result.stdout,
+                                                      result.stderr))
+    return CommandResult(result.exit_code, output['stdout'], output['stderr'])
@@ -0,0 +1,140 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""In-process cache for retrieve_credentials.
+
+Every retrieve_credentials call is a round trip to the engine. Once the cache
+is enabled with enable_credentials_cache, the credentials retrieved from a
+supplier are kept for a limited time and returned again for an equal supplier
+without calling the engine. The cache is disabled by default.
+
+Entries are keyed by a SHA-256 digest of the supplier serialized as JSON with
+sorted keys, so two equal supplier dicts share an entry regardless of key
+order, and no supplier content is kept in the cache itself.
+"""
+
+import collections
+import hashlib
+import json
+import threading
+import time
+
+import six
+
+from dlpx.virtualization.libs.exceptions import IncorrectArgumentTypeError
+
+__all__ = [
+    "enable_credentials_cache",
+    "disable_credentials_cache",
+    "invalidate_credentials"
+]
+
+_lock = threading.Lock()
+_entries = collections.OrderedDict()
+_ttl = None
+_max_size = 0
+
+
+def _key(credentials_supplier):
+    return hashlib.sha256(
+        json.dumps(credentials_supplier, sort_keys=True,
+                   separators=(',', ':'), default=str).encode('utf-8')
+    ).hexdigest()
+
+
+def _get(credentials_supplier):
+    """Returns the cached credentials for a supplier, or None."""
+    if not _max_size:
+        return None
+    key = _key(credentials_supplier)
+    with _lock:
+        if not _max_size:
+            return None
+        entry = _entries.get(key)
+        if entry is None:
+            return None
+        expires, credentials = entry
+        if expires <= time.time():
+            del _entries[key]
+            return None
+        _entries.move_to_end(key)
+        return credentials
+
+
+def _put(credentials_supplier, credentials):
+    if not _max_size:
+        return
+    key = _key(credentials_supplier)
+    with _lock:
+        #
+        # The cache may have been disabled since the check above.
+        #
+        if not _max_size:
+            return
+        _entries[key] = (time.time() + _ttl, credentials)
+        _entries.move_to_end(key)
+        while len(_entries) > _max_size:
+            _entries.popitem(last=False)
+
+
+def enable_credentials_cache(ttl=300, max_size=128):
+    """Enables caching of the credentials returned by retrieve_credentials.
+
+    Credentials are returned from the cache for at most ttl seconds after
+    they were retrieved. When the cache holds max_size entries, the least
+    recently used entry is evicted. Enabling an enabled cache changes its
+    settings and keeps the cached entries, trimmed to the new size.
+
+    Args:
+        ttl (int): Number of seconds cached credentials remain valid. Must
+        not be negative.
+        max_size (int): Maximum number of suppliers to cache credentials for.
+        Must not be negative; 0 caches nothing.
+    """
+    global _ttl, _max_size
+
+    if (not isinstance(ttl, six.integer_types + (float,)) or
+            isinstance(ttl, bool) or ttl < 0):
+        raise IncorrectArgumentTypeError('ttl', type(ttl), int, False)
+    if (not isinstance(max_size, six.integer_types) or
+            isinstance(max_size, bool) or max_size < 0):
+        raise IncorrectArgumentTypeError(
+            'max_size', type(max_size), int, False)
+
+    with _lock:
+        _ttl = ttl
+        _max_size = max_size
+        while len(_entries) > _max_size:
+            _entries.popitem(last=False)
+
+
+def disable_credentials_cache():
+    """Disables the credentials cache and drops all cached credentials."""
+    global _ttl, _max_size
+
+    with _lock:
+        _ttl = None
+        _max_size = 0
+        _entries.clear()
+
+
+def invalidate_credentials(credentials_supplier=None):
+    """Drops cached credentials, for example after a password change.
+
+    Args:
+        credentials_supplier (dict): Supplier whose credentials to drop. When
+        None, all cached credentials are dropped.
+    """
+    if credentials_supplier is None:
+        with _lock:
+            _entries.clear()
+        return
+
+    if not isinstance(credentials_supplier, dict):
+        raise IncorrectArgumentTypeError(
+            'credentials_supplier', type(credentials_supplier), dict, False)
+
+    key = _key(credentials_supplier)
+    with _lock:
+        _entries.pop(key, None)
@@ -0,0 +1,121 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Concurrent fan-out of library calls across many remote connections.
+
+The library wrappers block until the remote command completes, so touching
+every host of a cluster one call at a time makes the wall time grow with the
+number of hosts. run_many runs the same library call against many
+RemoteConnections from a bounded thread pool.
+
+The library wrappers keep no shared mutable state, the deferred import of the
+engine interface is guarded by the interpreter's import lock, and
+PlatformHandler serializes records through the lock that every logging
+Handler holds around emit(). Plugins can therefore call the wrappers and log
+from the worker threads.
+"""
+
+import collections
+import threading
+from concurrent import futures
+
+import six
+
+from dlpx.virtualization.common._common_classes import RemoteConnection
+from dlpx.virtualization.libs.exceptions import IncorrectArgumentTypeError
+
+__all__ = [
+    "run_many"
+]
+
+
+def run_many(operation, remote_connections, *args, max_workers=8,
+             max_per_host=1, return_exceptions=False, **kwargs):
+    """Runs a library operation against many remote connections concurrently.
+
+    At most max_workers calls are in flight at a time, and at most
+    max_per_host of them target the same host (as identified by
+    RemoteHost.reference). Calls against the same host are started in input order.
+
+    Args:
+        operation (function): The library operation to run, for example
+        run_bash, run_powershell or run_expect. It is called as
+        operation(remote_connection, *args, **kwargs).
+        remote_connections (list of RemoteConnection): Connections to run the
+        operation against.
+        args: Positional arguments passed to every call after the connection.
+        max_workers (int): Maximum number of concurrent calls.
+        max_per_host (int): Maximum number of concurrent calls against the
+        same host.
+        return_exceptions (bool): If True, an exception raised by a call is
+        returned in place of its result. If False, no further calls are
+        started once a call fails, and the exception of the first failed call
+        in input order is raised after the calls in flight complete.
+        kwargs: Keyword arguments passed to every call.
+
+    Returns:
+        list: The return value of each call, in the order of
+        remote_connections.
+    """
+    if not callable(operation):
+        raise IncorrectArgumentTypeError(
+            'operation', type(operation), type(run_many))
+    if not isinstance(remote_connections, list):
+        raise IncorrectArgumentTypeError(
+            'remote_connections', type(remote_connections), [RemoteConnection])
+    if not all(isinstance(connection, RemoteConnection)
+               for connection in remote_connections):
+        raise IncorrectArgumentTypeError(
+            'remote_connections',
+            [type(connection) for connection in remote_connections],
+            [RemoteConnection])
+    if not isinstance(max_workers, six.integer_types) or max_workers < 1:
+        raise IncorrectArgumentTypeError(
+            'max_workers', type(max_workers), int, False)
+    if not isinstance(max_per_host, six.integer_types) or max_per_host < 1:
+        raise IncorrectArgumentTypeError(
+            'max_per_host', type(max_per_host), int, False)
+
+    #
+    # Each host gets up to max_per_host lanes that drain a shared queue of the
+    # indexes targeting that host. Lanes are what the thread pool runs, so a
+    # worker never sits blocked waiting for a busy host while another host
+    # still has work queued.
+    #
+    pending = collections.OrderedDict()
+    for index, connection in enumerate(remote_connections):
+        host = connection.environment.host.reference
+        pending.setdefault(host, collections.deque()).append(index)
+
+    results = [None] * len(remote_connections)
+    errors = {}
+    lock = threading.Lock()
+
+    def lane(queue):
+        while True:
+            with lock:
+                if not queue or (errors and not return_exceptions):
+                    return
+                index = queue.popleft()
+            try:
+                result = operation(remote_connections[index], *args, **kwargs)
+            except BaseException as e:
+                with lock:
+                    errors[index] = e
+            else:
+                results[index] = result
+
+    lanes = [queue for queue in pending.values()
+             for _ in range(min(max_per_host, len(queue)))]
+    if lanes:
+        with futures.ThreadPoolExecutor(
+                max_workers=min(max_workers, len(lanes))) as executor:
+            for done in [executor.submit(lane, queue) for queue in lanes]:
+                done.result()
+
+    if errors and not return_exceptions:
+        raise errors[min(errors)]
+    for index, error in errors.items():
+        results[index] = error
+    return results
@@ -0,0 +1,609 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Remote file access.
+
+read_file, write_file and stat move file contents between the plugin and a
+remote host through run_bash, or run_powershell on Windows hosts. File data
+travels base64-encoded in bounded chunks, one library call per chunk, so a
+large file never has to fit into a single request or response, and binary
+data survives unchanged. The path is passed to the remote script as an
+environment variable rather than spliced into the script, so it needs no
+quoting.
+
+write_file writes to a temporary file next to the target and renames it over
+the target once all chunks have arrived, so readers never see a partially
+written file. Both read_file and write_file can verify a SHA-256 checksum of
+the transferred data against the remote file.
+"""
+
+import base64
+import hashlib
+import uuid
+
+import six
+
+from dlpx.virtualization.common._common_classes import RemoteConnection
+from dlpx.virtualization.common.util import to_str
+from dlpx.virtualization.libs import libs
+from dlpx.virtualization.libs._shell import (BASH_BASE64, BASH_UNBASE64_SHA256,
+                                             new_marker, quote_ps, quote_sh,
+                                             split_frames)
+from dlpx.virtualization.libs.exceptions import (IncorrectArgumentTypeError,
+                                                 PluginScriptError)
+
+__all__ = [
+    "FileStat",
+    "read_file",
+    "write_file",
+    "stat"
+]
+
+_PATH_VARIABLE = 'DLPX_PATH'
+_PART_SUFFIX = '.dlpx-part'
+_STDIN_CHUNK_SIZE = 512 * 1024
+
+_BASH_READ = u"""\
+if [ ! -f "$DLPX_PATH" ]; then
+    printf '%s: No such file\\n' "$DLPX_PATH" >&2; exit 1
+fi
+__dlpx_size=$(wc -c <"$DLPX_PATH") || exit 1
+printf '%s size %s\\n' {marker} $((__dlpx_size))
+if [ {checksum} = 1 ]; then
+    printf '%s sha256\\n' {marker}
+    tail -c +{start} "$DLPX_PATH" | {range}__dlpx_sha256
+    printf '\\n'
+fi
+printf '%s data\\n' {marker}
+tail -c +{start} "$DLPX_PATH" | head -c {length} | __dlpx_b64
+printf '\\n'
+"""
+
+_BASH_WRITE = u"""\
+__dlpx_t="$DLPX_PATH"{part}
+if [ {first} = 1 ]; then
+    if [ -n {mode} ]; then
+        rm -f "$__dlpx_t" && (umask 077; : >"$__dlpx_t") || exit 1
+        chmod {mode} "$__dlpx_t" || exit 1
+    else
+        : >"$__dlpx_t" || exit 1
+    fi
+fi
+__dlpx_unb64 >>"$__dlpx_t" <<'__DLPX_EOF__' || exit 1
+{data}
+__DLPX_EOF__
+if [ {last} = 1 ]; then
+    if [ -n {digest} ] && [ "$(__dlpx_sha256 <"$__dlpx_t")" != {digest} ]; then
+        rm -f "$__dlpx_t"
+        printf '%s: checksum mismatch\\n' "$DLPX_PATH" >&2; exit 1
+    fi
+    mv -f "$__dlpx_t" "$DLPX_PATH" || exit 1
+fi
+"""
+
+_BASH_ABORT = u"""\
+rm -f "$DLPX_PATH"{part}
+"""
+
+_BASH_REMOVE = u"""\
+rm -f "$DLPX_PATH"
+"""
+
+_BASH_STDIN = u"""\
+(eval {command}) <{path}
+__dlpx_rc=$?
+rm -f {path}
+exit $__dlpx_rc
+"""
+
+_BASH_STAT = u"""\
+if [ ! -e "$DLPX_PATH" ] && [ ! -h "$DLPX_PATH" ]; then
+    printf '%s missing\\n' {marker}; exit 0
+fi
+__dlpx_s=$(stat -c '%s %Y %a %F' "$DLPX_PATH" 2>/dev/null) ||
+    __dlpx_s=$(stat -f '%z %m %Lp %HT' "$DLPX_PATH") || exit 1
+printf '%s stat %s\\n' {marker} "$__dlpx_s"
+"""
+
+_POWERSHELL_SHA256 = u"""\
+function __DlpxHex([byte[]]$Hash) {{
+    return [BitConverter]::ToString($Hash).Replace('-', '').ToLowerInvariant()
+}}
+"""
+
+_POWERSHELL_READ = _POWERSHELL_SHA256 + u"""\
+$ErrorActionPreference = 'Stop'
+try {{
+    $stream = [IO.File]::Open($env:DLPX_PATH, [IO.FileMode]::Open,
+        [IO.FileAccess]::Read, [IO.FileShare]::ReadWrite)
+    try {{
+        $out = New-Object System.Text.StringBuilder
+        $size = $stream.Length
+        [void]$out.Append(("{{0}} size {{1}}`n" -f {marker}, $size))
+        $range = [Math]::Max([long]0, $size - {offset})
+        if ({range} -ge 0) {{ $range = [Math]::Min($range, [long]{range}) }}
+        if ({checksum}) {{
+            $sha = [Security.Cryptography.SHA256]::Create()
+            $block = New-Object byte[] 1048576
+            [void]$stream.Seek({offset}, [IO.SeekOrigin]::Begin)
+            while ($range -gt 0) {{
+                $n = $stream.Read($block, 0, [Math]::Min($block.Length, $range))
+                if ($n -eq 0) {{ break }}
+                [void]$sha.TransformBlock($block, 0, $n, $null, 0)
+                $range -= $n
+            }}
+            [void]$sha.TransformFinalBlock($block, 0, 0)
+            [void]$out.Append(("{{0}} sha256`n{{1}}`n" -f {marker},
+                (__DlpxHex $sha.Hash)))
+        }}
+        $want = [Math]::Max([long]0, [Math]::Min([long]{length}, $size - {offset}))
+        $buffer = New-Object byte[] $want
+        $read = 0
+        [void]$stream.Seek({offset}, [IO.SeekOrigin]::Begin)
+        while ($read -lt $want) {{
+            $n = $stream.Read($buffer, $read, $want - $read)
+            if ($n -eq 0) {{ break }}
+            $read += $n
+        }}
+        [void]$out.Append(("{{0}} data`n{{1}}`n" -f {marker},
+            [Convert]::ToBase64String($buffer, 0, $read)))
+        [Console]::Out.Write($out.ToString())
+    }} finally {{
+        $stream.Close()
+    }}
+}} catch {{
+    [Console]::Error.WriteLine($_.Exception.Message)
+    exit 1
+}}
+"""
+
+_POWERSHELL_WRITE = _POWERSHELL_SHA256 + u"""\
+$ErrorActionPreference = 'Stop'
+try {{
+    $part = $env:DLPX_PATH + {part}
+    $mode = [IO.FileMode]::Append
+    if ({first}) {{ $mode = [IO.FileMode]::Create }}
+    $bytes = [Convert]::FromBase64String('{data}')
+    $stream = [IO.File]::Open($part, $mode, [IO.FileAccess]::Write)
+    try {{
+        $stream.Write($bytes, 0, $bytes.Length)
+    }} finally {{
+        $stream.Close()
+    }}
+    if ({last}) {{
+        if ({digest}) {{
+            $sha = [Security.Cryptography.SHA256]::Create()
+            $stream = [IO.File]::OpenRead($part)
+            try {{
+                $hash = __DlpxHex $sha.ComputeHash($stream)
+            }} finally {{
+                $stream.Close()
+            }}
+            if ($hash -ne {digest}) {{
+                [IO.File]::Delete($part)
+                throw ($env:DLPX_PATH + ': checksum mismatch')
+            }}
+        }}
+        if ([IO.File]::Exists($env:DLPX_PATH)) {{
+            [IO.File]::Replace($part, $env:DLPX_PATH, $null)
+        }} else {{
+            [IO.File]::Move($part, $env:DLPX_PATH)
+        }}
+    }}
+}} catch {{
+    [Console]::Error.WriteLine($_.Exception.Message)
+    exit 1
+}}
+"""
+
+_POWERSHELL_ABORT = u"""\
+Remove-Item -LiteralPath ($env:DLPX_PATH + {part}) -Force -ErrorAction SilentlyContinue
+"""
+
+_POWERSHELL_STAT = u"""\
+$item = Get-Item -LiteralPath $env:DLPX_PATH -Force -ErrorAction SilentlyContinue
+if ($item -eq $null) {{
+    [Console]::Out.Write(("{{0}} missing`n" -f {marker}))
+    exit 0
+}}
+$epoch = New-Object DateTime 1970, 1, 1, 0, 0, 0, ([DateTimeKind]::Utc)
+$mtime = ($item.LastWriteTimeUtc - $epoch).TotalSeconds
+if ($item.PSIsContainer) {{
+    $type = 'directory'; $size = 0
+}} else {{
+    $type = 'regular file'; $size = $item.Length
+}}
+if ($item.Attributes -band [IO.FileAttributes]::ReparsePoint) {{
+    $type = 'symbolic link'
+}}
+[Console]::Out.Write(("{{0}} stat {{1}} {{2}} 0 {{3}}`n" -f {marker}, $size,
+    $mtime.ToString([Globalization.CultureInfo]::InvariantCulture), $type))
+"""
+
+
+class FileStat(object):
+    """Information about a remote file returned by stat().
+
+    Args:
+        path (str): Path of the file.
+        exists (bool): Whether the file exists.
+        file_type (str): 'file', 'directory', 'symlink' or 'other'. None if
+            the file does not exist.
+        size (int): Size of the file in bytes.
+        mtime (float): Last modification time, in seconds since the epoch.
+        mode (int): Permission bits of the file. Always 0 on Windows hosts.
+    """
+    def __init__(self, path, exists, file_type=None, size=0, mtime=None,
+                 mode=0):
+        self.__path = path
+        self.__exists = exists
+        self.__file_type = file_type
+        self.__size = size
+        self.__mtime = mtime
+        self.__mode = mode
+
+    @property
+    def path(self):
+        return self.__path
+
+    @property
+    def exists(self):
+        return self.__exists
+
+    @property
+    def file_type(self):
+        return self.__file_type
+
+    @property
+    def is_file(self):
+        return self.__file_type == 'file'
+
+    @property
+    def is_dir(self):
+        return self.__file_type == 'directory'
+
+    @property
+    def size(self):
+        return self.__size
+
+    @property
+    def mtime(self):
+        return self.__mtime
+
+    @property
+    def mode(self):
+        return self.__mode
+
+
+def _run(remote_connection, powershell, path, command):
+    variables = {_PATH_VARIABLE: path}
+    if powershell:
+        return libs.run_powershell(remote_connection, command,
+                                   variables=variables, check=True)
+    return libs.run_bash(remote_connection, command, variables=variables,
+                         check=True)
+
+
+def _frames(result, marker):
+    frames = {}
+    for header, body in split_frames(result.stdout, marker):
+        frames[header[0]] = (header[1:], body)
+    return frames
+
+
+def _file_type(description):
+    description = description.lower()
+    if description == 'regular file' or description == 'regular empty file':
+        return 'file'
+    if description == 'directory':
+        return 'directory'
+    if description == 'symbolic link':
+        return 'symlink'
+    return 'other'
+
+
+def _check_int(value):
+    return isinstance(value, six.integer_types) and not isinstance(value, bool)
+
+
+def read_file(remote_connection, path, offset=0, length=None,
+              chunk_size=4 * 1024 * 1024, checksum=False, powershell=False):
+    """Reads the contents of a remote file.
+
+    The file is read in chunks of at most chunk_size bytes, one library call
+    per chunk.
+
+    Args:
+        remote_connection (RemoteConnection): Connection to a remote
+        environment.
+        path (str): Path of the file on the remote host.
+        offset (int): Position in the file to start reading at.
+        length (int): Maximum number of bytes to read. None reads up to the
+        end of the file.
+        chunk_size (int): Maximum number of bytes to transfer per call.
+        checksum (bool): Whether to verify the data read against a SHA-256
+        checksum computed on the remote host.
+        powershell (bool): Whether the remote host is a Windows host.
+
+    Returns:
+        bytes: The data read.
+
+    Raises:
+        PluginScriptError: If the file cannot be read, or the checksum does
+        not match, for example because the file changed while it was read.
+    """
+    path = to_str(path)
+    if not isinstance(remote_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'remote_connection',
+            type(remote_connection),
+            RemoteConnection)
+    if not isinstance(path, six.string_types):
+        raise IncorrectArgumentTypeError('path', type(path), six.string_types[0])
+    if not _check_int(offset) or offset < 0:
+        raise IncorrectArgumentTypeError('offset', type(offset), int, False)
+    if length is not None and (not _check_int(length) or length < 0):
+        raise IncorrectArgumentTypeError('length', type(length), int, False)
+    if not _check_int(chunk_size) or chunk_size <= 0:
+        raise IncorrectArgumentTypeError(
+            'chunk_size', type(chunk_size), int, False)
+    if not isinstance(checksum, bool):
+        raise IncorrectArgumentTypeError('checksum', type(checksum), bool, False)
+    if not isinstance(powershell, bool):
+        raise IncorrectArgumentTypeError(
+            'powershell', type(powershell), bool, False)
+
+    chunks = []
+    position = offset
+    end = None
+    expected = None
+    while end is None or position < end:
+        want = chunk_size
+        if end is not None:
+            want = min(want, end - position)
+        elif length is not None:
+            want = min(want, length)
+        marker = new_marker()
+        verify = checksum and end is None
+        if powershell:
+            command = _POWERSHELL_READ.format(
+                marker=quote_ps(marker),
+                offset=position,
+                length=want,
+                range=-1 if length is None else length,
+                checksum='$true' if verify else '$false')
+        else:
+            command = BASH_BASE64 + BASH_UNBASE64_SHA256 + _BASH_READ.format(
+                marker=quote_sh(marker),
+                start=position + 1,
+                length=want,
+                range='' if length is None else 'head -c {} | '.format(length),
+                checksum=1 if verify else 0)
+        result = _run(remote_connection, powershell, path, command)
+        frames = _frames(result, marker)
+        if 'size' not in frames or 'data' not in frames:
+            raise PluginScriptError('Failed to read {}. stdout : {} and '
+                                    ' stderr : {}'.format(path,
+                                                          result.stdout,
+                                                          result.stderr))
+        if end is None:
+            size = int(frames['size'][0][0])
+            end = size if length is None else min(size, offset + length)
+            if verify:
+                expected = frames['sha256'][1].strip()
+        chunk = base64.b64decode(frames['data'][1])
+        if not chunk:
+            break
+        chunks.append(chunk)
+        position += len(chunk)
+
+    data = b''.join(chunks)
+    if expected is not None and hashlib.sha256(data).hexdigest() != expected:
+        raise PluginScriptError('The checksum of the data read from {} does'
+                                ' not match the remote file.'.format(path))
+    return data
+
+
+def write_file(remote_connection, path, chunks, chunk_size=512 * 1024,
+               checksum=False, mode=None, powershell=False):
+    """Writes a remote file, replacing it if it exists.
+
+    The data is sent in pieces of at most chunk_size bytes, one library call
+    per piece, to a temporary file next to the target, which is renamed over
+    the target once all data has been written.
+
+    Args:
+        remote_connection (RemoteConnection): Connection to a remote
+        environment.
+        path (str): Path of the file on the remote host.
+        chunks (bytes or iterable of bytes): Data to write.
+        chunk_size (int): Maximum number of bytes to transfer per call.
+        checksum (bool): Whether to verify the written file against a SHA-256
+        checksum of the data before it replaces the target.
+        mode (int): Permission bits to give the file, for example 0o600,
+        before any data is written to it. On Unix hosts the file is created
+        readable only by the remote user and then given these bits. None
+        leaves them to the umask of the remote user. Ignored on Windows
+        hosts.
+        powershell (bool): Whether the remote host is a Windows host.
+
+    Returns:
+        int: Number of bytes written.
+
+    Raises:
+        PluginScriptError: If the file cannot be written or the checksum does
+        not match.
+    """
+    path = to_str(path)
+    if not isinstance(remote_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'remote_connection',
+            type(remote_connection),
+            RemoteConnection)
+    if not isinstance(path, six.string_types):
+        raise IncorrectArgumentTypeError('path', type(path), six.string_types[0])
+    if isinstance(chunks, (bytes, bytearray, memoryview)):
+        chunks = [chunks]
+    elif isinstance(chunks, six.string_types) or not hasattr(chunks, '__iter__'):
+        raise IncorrectArgumentTypeError('chunks', type(chunks), bytes)
+    if not _check_int(chunk_size) or chunk_size <= 0:
+        raise IncorrectArgumentTypeError(
+            'chunk_size', type(chunk_size), int, False)
+    if not isinstance(checksum, bool):
+        raise IncorrectArgumentTypeError('checksum', type(checksum), bool, False)
+    if mode is not None and not _check_int(mode):
+        raise IncorrectArgumentTypeError('mode', type(mode), int, False)
+    if not isinstance(powershell, bool):
+        raise IncorrectArgumentTypeError(
+            'powershell', type(powershell), bool, False)
+
+    digest = hashlib.sha256()
+    state = {'first': True, 'written': 0}
+
+    def send(data, last):
+        digest.update(data)
+        hex_digest = digest.hexdigest() if checksum and last else u''
+        if powershell:
+            command = _POWERSHELL_WRITE.format(
+                part=quote_ps(_PART_SUFFIX),
+                first='$true' if state['first'] else '$false',
+                last='$true' if last else '$false',
+                data=base64.b64encode(data).decode('ascii'),
+                digest=quote_ps(hex_digest))
+        else:
+            command = BASH_UNBASE64_SHA256 + _BASH_WRITE.format(
+                part=quote_sh(_PART_SUFFIX),
+                first=1 if state['first'] else 0,
+                last=1 if last else 0,
+                mode=quote_sh(u'' if mode is None else u'{:o}'.format(mode)),
+                data=base64.encodebytes(data).decode('ascii').rstrip('\n'),
+                digest=quote_sh(hex_digest))
+        _run(remote_connection, powershell, path, command)
+        state['first'] = False
+        state['written'] += len(data)
+
+    pending = bytearray()
+    try:
+        for chunk in chunks:
+            if not isinstance(chunk, (bytes, bytearray, memoryview)):
+                raise IncorrectArgumentTypeError('chunks', type(chunk), bytes)
+            pending += chunk
+            #
+            # Only full chunks are sent while more data may follow; whatever
+            # remains goes with the final call, which also verifies and
+            # renames the file.
+            #
+            while len(pending) > chunk_size:
+                send(bytes(pending[:chunk_size]), False)
+                del pending[:chunk_size]
+        send(bytes(pending), True)
+    except Exception:
+        if not state['first']:
+            abort = (_POWERSHELL_ABORT.format(part=quote_ps(_PART_SUFFIX))
+                     if powershell else
+                     _BASH_ABORT.format(part=quote_sh(_PART_SUFFIX)))
+            try:
+                _run(remote_connection, powershell, path, abort)
+            except Exception:
+                pass
+        raise
+    return state['written']
+
+
+def stat(remote_connection, path, powershell=False):
+    """Returns information about a remote file.
+
+    Args:
+        remote_connection (RemoteConnection): Connection to a remote
+        environment.
+        path (str): Path of the file on the remote host.
+        powershell (bool): Whether the remote host is a Windows host.
+
+    Returns:
+        FileStat: Information about the file. Its exists property is False if
+        there is no such file.
+    """
+    path = to_str(path)
+    if not isinstance(remote_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'remote_connection',
+            type(remote_connection),
+            RemoteConnection)
+    if not isinstance(path, six.string_types):
+        raise IncorrectArgumentTypeError('path', type(path), six.string_types[0])
+    if not isinstance(powershell, bool):
+        raise IncorrectArgumentTypeError(
+            'powershell', type(powershell), bool, False)
+
+    marker = new_marker()
+    if powershell:
+        command = _POWERSHELL_STAT.format(marker=quote_ps(marker))
+    else:
+        command = _BASH_STAT.format(marker=quote_sh(marker))
+    result = _run(remote_connection, powershell, path, command)
+    frames = _frames(result, marker)
+    if 'missing' in frames:
+        return FileStat(path, False)
+    if 'stat' not in frames or len(frames['stat'][0]) < 4:
+        raise PluginScriptError('Failed to stat {}. stdout : {} and '
+                                ' stderr : {}'.format(path,
+                                                      result.stdout,
+                                                      result.stderr))
+    fields = frames['stat'][0]
+    return FileStat(path,
+                    True,
+                    file_type=_file_type(u' '.join(fields[3:])),
+                    size=int(fields[0]),
+                    mtime=float(fields[1]),
+                    mode=int(fields[2], 8))
+
+
+def _stdin_chunks(stdin):
+    """Yields the input given to run_bash as stdin in chunks of bytes."""
+    def encode(data):
+        if isinstance(data, six.text_type):
+            return data.encode('utf-8')
+        return data
+
+    if isinstance(stdin, (six.text_type, bytes, bytearray, memoryview)):
+        yield encode(stdin)
+    elif hasattr(stdin, 'read'):
+        while True:
+            data = stdin.read(_STDIN_CHUNK_SIZE)
+            if not data:
+                return
+            yield encode(data)
+    else:
+        for data in stdin:
+            yield encode(data)
+
+
+def upload_stdin(remote_connection, stdin):
+    """Uploads the input for a run_bash command into a file only the remote
+    user can read, in the scratch path of the host.
+
+    Returns:
+        str: The path of the file on the remote host.
+    """
+    path = u'{}/dlpx-stdin-{}'.format(
+        remote_connection.environment.host.scratch_path, uuid.uuid4().hex)
+    write_file(remote_connection, path, _stdin_chunks(stdin),
+               chunk_size=_STDIN_CHUNK_SIZE, mode=0o600)
+    return path
+
+
+def stdin_command(command, path):
+    """Wraps a bash command so that it reads its standard input from the file
+    at path, which is removed once the command has finished."""
+    return _BASH_STDIN.format(command=quote_sh(command), path=quote_sh(path))
+
+
+def remove_stdin(remote_connection, path):
+    """Removes an uploaded input file whose command did not run. This is a
+    best effort: a failure to remove the file is ignored."""
+    try:
+        libs.run_bash(remote_connection, _BASH_REMOVE,
+                      variables={_PATH_VARIABLE: path})
+    except Exception:
+        pass
@@ -0,0 +1,355 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Hashing of remote directory trees.
+
+hash_tree computes a SHA-256 digest of every file below a remote directory
+with several hashing processes running in parallel on the remote host, and
+combines the digests into a single Merkle root that changes whenever any file
+is added, removed or modified. Comparing roots is enough to tell whether two
+trees, for example a source directory and its synced copy, are identical;
+comparing the per-file digests tells which files differ.
+
+Given the manifest of an earlier call, only the files whose size or
+modification time changed since are hashed again.
+"""
+
+import base64
+import hashlib
+
+import six
+
+from dlpx.virtualization.common._common_classes import RemoteConnection
+from dlpx.virtualization.common.util import to_str
+from dlpx.virtualization.libs import libs
+from dlpx.virtualization.libs._shell import (BASH_BASE64, BASH_LIST_FILES,
+                                             BASH_UNBASE64_SHA256, new_marker,
+                                             quote_sh, relative_path,
+                                             split_entries, split_frames)
+from dlpx.virtualization.libs.exceptions import (IncorrectArgumentTypeError,
+                                                 PluginScriptError)
+
+__all__ = [
+    "TreeManifest",
+    "hash_tree"
+]
+
+_MANIFEST_VERSION = 1
+
+_MODES = ('full', 'sample', 'block')
+
+_LIST = u"""\
+if [ ! -d {directory} ]; then
+    printf '%s: No such directory\\n' {directory} >&2; exit 1
+fi
+printf '%s list\\n' {marker}
+__dlpx_list {directory} | __dlpx_b64
+printf '\\n'
+"""
+
+#
+# Each mode defines __dlpx_digest, which prints the digest of the file given
+# as its argument. In sample mode only the size and three samples of
+# {sample} bytes at the start, middle and end of a larger file are hashed. In
+# block mode the digests of the {block} byte blocks of the file are printed,
+# separated by commas.
+#
+_DIGESTS = {
+    'full': u"""\
+__dlpx_digest() {{ __dlpx_sha256 <"$1"; }}
+""",
+    'sample': u"""\
+__dlpx_digest() {{
+    __dlpx_s=$(wc -c <"$1") || return 1
+    __dlpx_s=$((__dlpx_s))
+    if [ $__dlpx_s -le $((3 * {sample})) ]; then
+        __dlpx_sha256 <"$1"; return
+    fi
+    {{
+        printf '%s\\n' $__dlpx_s
+        head -c {sample} "$1"
+        tail -c +$((__dlpx_s / 2 + 1)) "$1" | head -c {sample}
+        tail -c {sample} "$1"
+    }} | __dlpx_sha256
+}}
+""",
+    'block': u"""\
+__dlpx_digest() {{
+    __dlpx_s=$(wc -c <"$1") || return 1
+    __dlpx_i=0
+    __dlpx_o=
+    while [ $__dlpx_i -eq 0 ] || [ $((__dlpx_i * {block})) -lt $__dlpx_s ]; do
+        __dlpx_h=$(tail -c +$((__dlpx_i * {block} + 1)) "$1" |
+            head -c {block} | __dlpx_sha256) || return 1
+        __dlpx_o=$__dlpx_o${{__dlpx_o:+,}}$__dlpx_h
+        __dlpx_i=$((__dlpx_i + 1))
+    done
+    printf '%s' "$__dlpx_o"
+}}
+"""
+}
+
+#
+# Hashes the NUL separated paths in the here-document with {workers} processes
+# and prints "<path>\\0<digest>\\0" for each file, base64-encoded.
+#
+_HASH = u"""\
+export -f __dlpx_sha256 __dlpx_digest
+__dlpx_p="-P {workers}"
+xargs -P 1 true </dev/null >/dev/null 2>&1 || __dlpx_p=
+printf '%s digests\\n' {marker}
+__dlpx_unb64 <<'__DLPX_EOF__' |
+{paths}
+__DLPX_EOF__
+    xargs -0 -n 16 $__dlpx_p bash -c 'for f; do
+        d=$(__dlpx_digest "$f") && printf "%s\\0%s\\0" "$f" "$d"
+    done' bash | __dlpx_b64
+printf '\\n'
+"""
+
+
+def _merkle_root(files):
+    """Combines the digests of the files into a Merkle root.
+
+    The leaves are SHA-256(path + NUL + digest) of every file in path order.
+    Each level hashes pairs of adjacent nodes; an odd node is carried up
+    unchanged.
+    """
+    level = [hashlib.sha256(path.encode('utf-8', 'surrogateescape') + b'\0' +
+                            files[path][2].encode('ascii')).digest()
+             for path in sorted(files)]
+    if not level:
+        return hashlib.sha256(b'').hexdigest()
+    while len(level) > 1:
+        level = [hashlib.sha256(b''.join(level[index:index + 2])).digest()
+                 if index + 1 < len(level) else level[index]
+                 for index in range(0, len(level), 2)]
+    return base64.b16encode(level[0]).decode('ascii').lower()
+
+
+class TreeManifest(object):
+    """The digests of the files below a remote directory.
+
+    Args:
+        mode (str): The hashing mode, 'full', 'sample' or 'block'.
+        files (dict of str:tuple): The (size, mtime, digest) of every file,
+            keyed by its path relative to the directory.
+        blocks (dict of str:list of str): The block digests of every file in
+            block mode.
+        parameter (int): The sample size in sample mode or the block size in
+            block mode.
+        rehashed (list of str): The paths of the files that were hashed, as
+            opposed to taken from the previous manifest.
+    """
+    def __init__(self, mode, files, blocks=None, parameter=None,
+                 rehashed=None):
+        self.__mode = mode
+        self.__files = files
+        self.__blocks = blocks or {}
+        self.__parameter = parameter
+        self.__rehashed = rehashed if rehashed is not None else sorted(files)
+        self.__root = _merkle_root(files)
+
+    @property
+    def root(self):
+        """The Merkle root of the tree, as a hex string."""
+        return self.__root
+
+    @property
+    def mode(self):
+        return self.__mode
+
+    @property
+    def parameter(self):
+        return self.__parameter
+
+    @property
+    def files(self):
+        return self.__files
+
+    @property
+    def rehashed(self):
+        return self.__rehashed
+
+    def digest(self, path):
+        """Returns the digest of a file, given its relative path."""
+        return self.__files[path][2]
+
+    def blocks(self, path):
+        """Returns the block digests of a file in block mode."""
+        return self.__blocks[path]
+
+    def diff(self, other):
+        """Compares the manifest with another one.
+
+        Returns:
+            (list of str, list of str, list of str): The relative paths of
+            the files that are only in this manifest, only in the other one,
+            and in both but with different digests.
+        """
+        ours = set(self.__files)
+        theirs = set(other.files)
+        return (sorted(ours - theirs),
+                sorted(theirs - ours),
+                sorted(path for path in ours & theirs
+                       if self.digest(path) != other.digest(path)))
+
+    def to_dict(self):
+        """Returns the manifest as a JSON serializable dict."""
+        manifest = {
+            'version': _MANIFEST_VERSION,
+            'mode': self.__mode,
+            'parameter': self.__parameter,
+            'files': {path: list(entry)
+                      for path, entry in self.__files.items()}
+        }
+        if self.__blocks:
+            manifest['blocks'] = dict(self.__blocks)
+        return manifest
+
+    @staticmethod
+    def from_dict(manifest):
+        """Creates a manifest from the output of to_dict()."""
+        if (not isinstance(manifest, dict) or
+                manifest.get('version') != _MANIFEST_VERSION):
+            raise ValueError('Unsupported tree manifest.')
+        return TreeManifest(
+            to_str(manifest['mode']),
+            {to_str(path): tuple(to_str(entry))
+             for path, entry in manifest['files'].items()},
+            {to_str(path): to_str(blocks)
+             for path, blocks in manifest.get('blocks', {}).items()},
+            manifest.get('parameter'),
+            [])
+
+
+def _check_int(value):
+    return (isinstance(value, six.integer_types) and
+            not isinstance(value, bool) and value > 0)
+
+
+def hash_tree(remote_connection, directory, mode='full', workers=4,
+              sample_size=1024 * 1024, block_size=64 * 1024 * 1024,
+              previous_manifest=None):
+    """Computes the digests of all files below a remote directory.
+
+    The files are hashed on the remote host by up to workers processes in
+    parallel. Files whose size and modification time are the same as in
+    previous_manifest keep their previous digest and are not read again.
+
+    Args:
+        remote_connection (RemoteConnection): Connection to a remote
+        environment.
+        directory (str): Path of the directory on the remote host.
+        mode (str): 'full' hashes every byte of every file. 'sample' only
+        hashes the size and three samples of sample_size bytes of files
+        larger than three samples, which is much faster but does not detect
+        every change. 'block' hashes every block of block_size bytes
+        separately, so changed blocks of large files can be identified.
+        workers (int): Number of hashing processes on the remote host.
+        sample_size (int): Size of the samples in sample mode.
+        block_size (int): Size of the blocks in block mode.
+        previous_manifest (TreeManifest or dict): The manifest returned by an
+        earlier call for the same directory, or its to_dict() form. It is
+        ignored if it was computed with a different mode, sample size or
+        block size.
+
+    Returns:
+        TreeManifest: The digests of the files and their Merkle root.
+    """
+    directory = to_str(directory)
+    mode = to_str(mode)
+
+    if not isinstance(remote_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'remote_connection',
+            type(remote_connection),
+            RemoteConnection)
+    if not isinstance(directory, six.string_types):
+        raise IncorrectArgumentTypeError(
+            'directory', type(directory), six.string_types[0])
+    if mode not in _MODES:
+        raise IncorrectArgumentTypeError('mode', type(mode), str, False)
+    if not _check_int(workers):
+        raise IncorrectArgumentTypeError('workers', type(workers), int, False)
+    if not _check_int(sample_size):
+        raise IncorrectArgumentTypeError(
+            'sample_size', type(sample_size), int, False)
+    if not _check_int(block_size):
+        raise IncorrectArgumentTypeError(
+            'block_size', type(block_size), int, False)
+    if isinstance(previous_manifest, dict):
+        previous_manifest = TreeManifest.from_dict(previous_manifest)
+    if (previous_manifest is not None and
+            not isinstance(previous_manifest, TreeManifest)):
+        raise IncorrectArgumentTypeError(
+            'previous_manifest', type(previous_manifest), TreeManifest, False)
+
+    parameter = {'full': None, 'sample': sample_size, 'block': block_size}[mode]
+    if (previous_manifest is not None and
+            (previous_manifest.mode != mode or
+             previous_manifest.parameter != parameter)):
+        previous_manifest = None
+
+    marker = new_marker()
+    result = libs.run_bash(
+        remote_connection,
+        BASH_BASE64 + BASH_LIST_FILES + _LIST.format(
+            directory=quote_sh(directory), marker=quote_sh(marker)),
+        check=True)
+    frames = split_frames(result.stdout, marker)
+    if not frames:
+        raise PluginScriptError('Failed to list the files of {}.'
+                                ' stdout : {} and '
+                                ' stderr : {}'.format(directory,
+                                                      result.stdout,
+                                                      result.stderr))
+
+    files = {}
+    blocks = {}
+    stale = {}
+    for size, mtime, path in split_entries(frames[0][1], 3):
+        relative = relative_path(path, directory)
+        size = int(size)
+        mtime = float(mtime)
+        if previous_manifest is not None:
+            entry = previous_manifest.files.get(relative)
+            if entry is not None and entry[0] == size and entry[1] == mtime:
+                files[relative] = entry
+                if mode == 'block':
+                    blocks[relative] = previous_manifest.blocks(relative)
+                continue
+        stale[path] = (relative, size, mtime)
+
+    if stale:
+        marker = new_marker()
+        paths = u'\0'.join(stale).encode('utf-8', 'surrogateescape')
+        result = libs.run_bash(
+            remote_connection,
+            BASH_BASE64 + BASH_UNBASE64_SHA256 +
+            _DIGESTS[mode].format(sample=sample_size, block=block_size) +
+            _HASH.format(workers=workers,
+                         marker=quote_sh(marker),
+                         paths=base64.encodebytes(paths).decode('ascii')
+                         .rstrip('\n')),
+            check=True)
+        frames = split_frames(result.stdout, marker)
+        values = (base64.b64decode(frames[0][1])
+                  .decode('utf-8', 'surrogateescape').split(u'\0')
+                  if frames else [])
+        digests = dict(zip(values[0::2], values[1::2]))
+        for path, (relative, size, mtime) in stale.items():
+            if path not in digests:
+                raise PluginScriptError('Failed to hash {}. stdout : {} and '
+                                        ' stderr : {}'.format(path,
+                                                              result.stdout,
+                                                              result.stderr))
+            digest = digests[path]
+            if mode == 'block':
+                blocks[relative] = digest.split(u',')
+                digest = hashlib.sha256(digest.encode('ascii')).hexdigest()
+            files[relative] = (size, mtime, digest)
+
+    return TreeManifest(mode, files, blocks, parameter,
+                        sorted(relative for relative, _, _ in stale.values()))
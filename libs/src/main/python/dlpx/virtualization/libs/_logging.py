@@ -2,15 +2,24 @@
 # Copyright (c) 2019, 2021 by Delphix. All rights reserved.
 #
 
+import functools
+import logging
 from logging import Handler
 
 from dlpx.virtualization.libs import libs
 from dlpx.virtualization.common.util import to_str
 
 __all__ = [
-    "PlatformHandler"
+    "PlatformHandler",
+    "BufferedPlatformHandler"
 ]
 
+#
+# A single log callback must stay below 192 MiB. Batches are split well below
+# that so that the request framing and the engine side copies have headroom.
+#
+_MAX_CALLBACK_BYTES = 128 * 1024 * 1024
+
 
 class PlatformHandler(Handler):
     """
@@ -20,3 +29,152 @@ class PlatformHandler(Handler):
         msg = self.format(record)
         msg = to_str(msg)
         libs._log_request(msg, record.levelno)
+
+
+class BufferedPlatformHandler(PlatformHandler):
+    """
+    A logging handler that collects records in memory and sends them to the
+    Virtualization Library in batches.
+
+    Consecutive single-line records that map to the same platform log level
+    are joined with newlines and sent with a single callback, so every line
+    of a batch is one record. A record that spans several lines is always
+    sent with a callback of its own, so its lines are never mixed up with
+    those of other records. The buffer is flushed when it holds capacity
+    records or max_bytes bytes of messages, as soon as a record of
+    flush_level or above is logged, and when flush() or close() is called.
+    Plugin operations decorated with flushing() flush the buffer when they
+    return, so that no records are left behind at the end of an operation.
+
+    Records are only dropped from the buffer once they have been sent. If a
+    flush triggered by a log call fails, the error is reported through
+    handleError() and the unsent records are kept, up to capacity of them,
+    for the next flush.
+    """
+    def __init__(self, capacity=1000, max_bytes=1024 * 1024,
+                 flush_level=logging.ERROR, level=logging.NOTSET):
+        super(BufferedPlatformHandler, self).__init__(level)
+        self.capacity = capacity
+        self.max_bytes = max_bytes
+        self.flush_level = flush_level
+        self.__buffer = []
+        self.__buffered_bytes = 0
+
+    def emit(self, record):
+        msg = to_str(self.format(record))
+        size = len(msg.encode('utf-8')) + 1
+        self.__buffer.append((record.levelno, msg, size))
+        self.__buffered_bytes += size
+        if (record.levelno >= self.flush_level or
+                len(self.__buffer) >= self.capacity or
+                self.__buffered_bytes >= self.max_bytes):
+            try:
+                self.flush()
+            except Exception:
+                self.handleError(record)
+                self.__drop(len(self.__buffer) - self.capacity)
+
+    def flush(self):
+        """Sends all buffered records to the Virtualization Library.
+
+        If sending fails, the records that were not sent stay buffered and
+        the error is raised.
+        """
+        self.acquire()
+        try:
+            for log_level, messages in _level_runs(self.__buffer):
+                for batch, count in _batches(messages, _MAX_CALLBACK_BYTES):
+                    libs._log_request(batch, log_level)
+                    self.__drop(count)
+        finally:
+            self.release()
+
+    def __drop(self, count):
+        """Drops the oldest count records from the buffer."""
+        if count <= 0:
+            return
+        self.__buffered_bytes -= sum(
+            size for _, _, size in self.__buffer[:count])
+        del self.__buffer[:count]
+
+    def close(self):
+        try:
+            self.flush()
+        finally:
+            super(BufferedPlatformHandler, self).close()
+
+    def flushing(self, operation):
+        """Decorator for a plugin operation that flushes the buffer when the
+        operation returns or raises.
+
+        Example:
+            @plugin.linked.pre_snapshot()
+            @handler.flushing
+            def linked_pre_snapshot(staged_source, repository, source_config,
+                                    optional_snapshot_parameters):
+                ...
+        """
+        @functools.wraps(operation)
+        def wrapper(*args, **kwargs):
+            try:
+                return operation(*args, **kwargs)
+            finally:
+                self.flush()
+        return wrapper
+
+
+def _platform_level(log_level):
+    """Returns the bucket _log_request maps a Python logging level to."""
+    if log_level <= logging.DEBUG:
+        return logging.DEBUG
+    if log_level <= logging.INFO:
+        return logging.INFO
+    return logging.ERROR
+
+
+def _level_runs(records):
+    """Groups the messages of consecutive (level, message, size) records that
+    share a platform log level, preserving their order."""
+    runs = []
+    for log_level, msg, _ in records:
+        if runs and _platform_level(runs[-1][0]) == _platform_level(log_level):
+            runs[-1][1].append(msg)
+        else:
+            runs.append((log_level, [msg]))
+    return runs
+
+
+def _batches(messages, limit):
+    """Joins single-line messages with newlines into strings of at most
+    limit bytes. A message that spans several lines is a batch of its own,
+    and a single message longer than limit is split into several batches.
+
+    Yields (batch, count) pairs, where count is the number of messages the
+    batch completes.
+    """
+    batch = []
+    size = 0
+    for msg in messages:
+        encoded = msg.encode('utf-8')
+        multiline = u'\n' in msg or u'\r' in msg
+        if multiline or len(encoded) > limit:
+            if batch:
+                yield u'\n'.join(batch), len(batch)
+                batch, size = [], 0
+            start = 0
+            while start < len(encoded):
+                end = min(start + limit, len(encoded))
+                # Do not cut a multi-byte character in half.
+                while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+                    end -= 1
+                yield (encoded[start:end].decode('utf-8'),
+                       1 if end == len(encoded) else 0)
+                start = end
+            continue
+        if batch and size + 1 + len(encoded) > limit:
+            yield u'\n'.join(batch), len(batch)
+            batch, size = [], 0
+        size += len(encoded) + (1 if batch else 0)
+        batch.append(msg)
+    if batch:
+        yield u'\n'.join(batch), len(batch)
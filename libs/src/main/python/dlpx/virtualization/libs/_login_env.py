@@ -0,0 +1,173 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Reuse of the login shell environment for run_bash.
+
+run_bash with use_login_shell=True sources the system and user profiles on
+every call, which can be slow on hosts whose profiles load vendor environment
+scripts. Once the cache is enabled with enable_login_environment_cache, the
+first login shell call for a remote connection also reports the environment
+the profiles set up. Later login shell calls for the same connection run in a
+plain shell that restores that environment first, until the cached
+environment expires or is invalidated.
+
+Only exported variables are carried over, as with libs.session: aliases,
+functions and shell options set by the profiles are not.
+
+As in a login shell, the variables of a call are set before the captured
+environment is restored, so a variable the profiles set takes precedence
+over the value passed to run_bash. To tell the two apart, a variable of the
+first call whose value the profiles left unchanged is not captured. A
+profile that derives a variable from the variables of a call therefore has
+it captured as it was computed for the first call.
+"""
+
+import re
+import threading
+import time
+
+import six
+
+from dlpx.virtualization.common._common_classes import RemoteConnection
+from dlpx.virtualization.libs._shell import (bash_restore_environment,
+                                             new_marker, quote_sh)
+from dlpx.virtualization.libs.exceptions import IncorrectArgumentTypeError
+
+__all__ = [
+    "enable_login_environment_cache",
+    "disable_login_environment_cache",
+    "invalidate_login_environment"
+]
+
+_CAPTURE = u"""\
+printf '%s state\\n' {marker}
+({unset}export -p)
+printf '\\n%s end\\n' {marker}
+"""
+
+_UNSET_UNCHANGED = u"""\
+[ "${{{name}-}}" = {value} ] && unset {name}
+"""
+
+_NAME = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+_lock = threading.Lock()
+_environments = {}
+_ttl = None
+
+
+def _key(remote_connection):
+    return (remote_connection.environment.reference,
+            remote_connection.user.reference)
+
+
+def enabled():
+    return _ttl is not None
+
+
+def wrap(remote_connection, command, variables):
+    """Prepares a login shell command.
+
+    The variables of the call are in the environment before the profiles run
+    or a cached environment is restored, so the profiles take precedence over
+    them. A variable of the call that the profiles did not change is left out
+    of the captured environment.
+
+    Returns:
+        (str, bool, str): The command to run, whether to run it in a login
+        shell, and the marker of the captured environment, or None if the
+        command restores a cached environment instead.
+    """
+    key = _key(remote_connection)
+    with _lock:
+        entry = _environments.get(key)
+        if entry is not None and entry[0] <= time.time():
+            del _environments[key]
+            entry = None
+    if entry is not None:
+        return bash_restore_environment(entry[1]) + command, False, None
+    marker = new_marker()
+    #
+    # Names that are not shell identifiers cannot be referenced, and are not
+    # listed by export -p either.
+    #
+    unset = u''.join(_UNSET_UNCHANGED.format(name=name, value=quote_sh(value))
+                     for name, value in variables.items()
+                     if _NAME.match(name))
+    return (_CAPTURE.format(marker=quote_sh(marker), unset=unset) + command,
+            True, marker)
+
+
+def capture(remote_connection, marker, result):
+    """Stores the environment a login shell command reported and removes it
+    from the output of the command."""
+    stdout = result.stdout
+    start = stdout.find(u'{} state\n'.format(marker))
+    end = stdout.find(u'\n{} end\n'.format(marker))
+    if start == -1 or end == -1:
+        return result
+    state = stdout[start + len(marker) + 7:end]
+    result.stdout = stdout[:start] + stdout[end + len(marker) + 6:]
+    with _lock:
+        if _ttl is not None:
+            _environments[_key(remote_connection)] = (time.time() + _ttl,
+                                                      state)
+    return result
+
+
+def enable_login_environment_cache(ttl=600):
+    """Enables reuse of the login shell environment by run_bash.
+
+    The environment a login shell sets up is captured on the first
+    run_bash call with use_login_shell=True for a remote connection, and
+    restored in a plain shell by later login shell calls for the same
+    connection for up to ttl seconds.
+
+    Args:
+        ttl (int): Number of seconds a captured environment is reused. Must
+        not be negative.
+    """
+    global _ttl
+
+    if (not isinstance(ttl, six.integer_types + (float,)) or
+            isinstance(ttl, bool) or ttl < 0):
+        raise IncorrectArgumentTypeError('ttl', type(ttl), int, False)
+
+    with _lock:
+        _ttl = ttl
+
+
+def disable_login_environment_cache():
+    """Disables reuse of the login shell environment and drops all captured
+    environments."""
+    global _ttl
+
+    with _lock:
+        _ttl = None
+        _environments.clear()
+
+
+def invalidate_login_environment(remote_connection=None):
+    """Drops captured login shell environments, for example after a profile
+    has been changed. The next login shell call captures the environment
+    again.
+
+    Args:
+        remote_connection (RemoteConnection): Connection whose environment to
+        drop. When None, all captured environments are dropped.
+    """
+    if remote_connection is None:
+        with _lock:
+            _environments.clear()
+        return
+
+    if not isinstance(remote_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'remote_connection',
+            type(remote_connection),
+            RemoteConnection,
+            False)
+
+    with _lock:
+        _environments.pop(_key(remote_connection), None)
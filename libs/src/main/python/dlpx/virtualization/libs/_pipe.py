@@ -0,0 +1,531 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Streaming the output of a command on one host into a command on another.
+
+The engine has no channel between two remote hosts, so pipe relays the data
+through the plugin. The source command runs in the background on the source
+host and its stdout is cut into numbered chunk files in the host's scratch
+path, optionally gzipped first. The destination command runs in the
+background on the destination host, reading its stdin from a FIFO that a
+feeder process fills from numbered chunk files as they arrive. The plugin
+moves each chunk from one host to the other with one run_bash call per side,
+fetching the next chunk while the previous one is written.
+
+Neither side ever spools more than backlog chunks: the source stops reading
+from its command while backlog chunks wait to be fetched, and the plugin
+waits before writing a chunk while backlog chunks wait to be fed to the
+destination command, so a slow side holds back the other instead of filling
+a disk or the plugin's memory.
+"""
+
+import base64
+import threading
+
+import six
+from six.moves import queue
+
+from dlpx.virtualization.common._common_classes import RemoteConnection
+from dlpx.virtualization.common.util import to_str
+from dlpx.virtualization.libs import libs
+from dlpx.virtualization.libs._result import CommandResult
+from dlpx.virtualization.libs._shell import (BASH_BASE64, BASH_UNBASE64_SHA256,
+                                             new_marker, quote_sh, split_frames)
+from dlpx.virtualization.libs.exceptions import (IncorrectArgumentTypeError,
+                                                 PluginScriptError)
+
+__all__ = [
+    "PipeResult",
+    "pipe"
+]
+
+#
+# Number of times a remote script polls, about ten times a second, for a
+# chunk or a free spool slot before it returns and lets the plugin call again.
+# This bounds the duration of a single library call.
+#
+_POLLS = 300
+
+_NAP = u"""\
+__dlpx_nap() { sleep 0.1 2>/dev/null || sleep 1; }
+"""
+
+_SOURCE_START = u"""\
+__dlpx_d=$(mktemp -d {scratch}/dlpx-pipe.XXXXXX) || exit 1
+mkfifo "$__dlpx_d/out" || exit 1
+if [ {compress} = 1 ] && command -v gzip >/dev/null 2>&1; then
+    __dlpx_z=gzip; __dlpx_c='gzip -c'
+else
+    __dlpx_z=plain; __dlpx_c=cat
+fi
+__dlpx_fb=
+if dd if=/dev/null of=/dev/null iflag=fullblock 2>/dev/null; then
+    __dlpx_fb=iflag=fullblock
+fi
+__dlpx_produce() {{
+    __dlpx_n=0
+    while :; do
+        while [ -e "$__dlpx_d/chunk.$((__dlpx_n - {backlog}))" ]; do
+            [ -e "$__dlpx_d/cancel" ] && return
+            __dlpx_nap
+        done
+        dd bs={chunk_size} count=1 $__dlpx_fb >"$__dlpx_d/part" 2>/dev/null
+        [ -s "$__dlpx_d/part" ] || return
+        mv "$__dlpx_d/part" "$__dlpx_d/chunk.$__dlpx_n"
+        __dlpx_n=$((__dlpx_n + 1))
+    done
+}}
+(
+    trap '' HUP
+    (eval {command}) >"$__dlpx_d/out" 2>"$__dlpx_d/err" </dev/null &
+    __dlpx_p=$!
+    echo $__dlpx_p >"$__dlpx_d/pid"
+    tee <"$__dlpx_d/out" >(wc -c >"$__dlpx_d/bytes.tmp"
+                           mv "$__dlpx_d/bytes.tmp" "$__dlpx_d/bytes") |
+        $__dlpx_c | __dlpx_produce
+    wait $__dlpx_p
+    echo $? >"$__dlpx_d/rc.tmp"
+    while [ ! -e "$__dlpx_d/bytes" ]; do __dlpx_nap; done
+    mv "$__dlpx_d/rc.tmp" "$__dlpx_d/rc"
+    [ -e "$__dlpx_d/cancel" ] && rm -rf "$__dlpx_d"
+) >/dev/null 2>&1 </dev/null &
+printf '%s start %s %s\\n' {marker} "$__dlpx_d" $__dlpx_z
+"""
+
+#
+# Returns chunk {index} of the source output, or the exit code, byte count and
+# stderr of the source command once all chunks have been returned, in which
+# case the spool directory is removed.
+#
+_SOURCE_FETCH = u"""\
+__dlpx_d={directory}
+[ -d "$__dlpx_d" ] || {{ echo 'The pipe spool directory is gone' >&2; exit 1; }}
+__dlpx_c="$__dlpx_d/chunk.{index}"
+__dlpx_i=0
+while [ ! -e "$__dlpx_c" ]; do
+    if [ -e "$__dlpx_d/rc" ] && [ ! -e "$__dlpx_c" ]; then
+        printf '%s end %s %s\\n' {marker} "$(cat "$__dlpx_d/rc")" \\
+            "$(tr -d ' ' <"$__dlpx_d/bytes")"
+        __dlpx_b64 <"$__dlpx_d/err"
+        printf '\\n'
+        rm -rf "$__dlpx_d"
+        exit 0
+    fi
+    __dlpx_i=$((__dlpx_i + 1))
+    if [ $__dlpx_i -ge {polls} ]; then printf '%s wait\\n' {marker}; exit 0; fi
+    __dlpx_nap
+done
+printf '%s chunk\\n' {marker}
+__dlpx_b64 <"$__dlpx_c"
+printf '\\n'
+rm -f "$__dlpx_c"
+"""
+
+_DESTINATION_START = u"""\
+if [ {decompress} = 1 ] && ! command -v gzip >/dev/null 2>&1; then
+    echo 'gzip is not available to decompress the piped data' >&2; exit 1
+fi
+__dlpx_d=$(mktemp -d {scratch}/dlpx-pipe.XXXXXX) || exit 1
+mkfifo "$__dlpx_d/in" || exit 1
+__dlpx_c=cat
+[ {decompress} = 1 ] && __dlpx_c='gzip -dc'
+__dlpx_feed() {{
+    __dlpx_n=0
+    while :; do
+        if [ -e "$__dlpx_d/in.$__dlpx_n" ]; then
+            cat "$__dlpx_d/in.$__dlpx_n" || return
+            rm -f "$__dlpx_d/in.$__dlpx_n"
+            __dlpx_n=$((__dlpx_n + 1))
+        elif [ -e "$__dlpx_d/eof" ] || [ -e "$__dlpx_d/cancel" ] ||
+                ! kill -0 $__dlpx_p 2>/dev/null; then
+            [ -e "$__dlpx_d/in.$__dlpx_n" ] || return
+        else
+            __dlpx_nap
+        fi
+    done
+}}
+(
+    trap '' HUP
+    (eval {command}) <"$__dlpx_d/in" >"$__dlpx_d/out" 2>"$__dlpx_d/err" &
+    __dlpx_p=$!
+    echo $__dlpx_p >"$__dlpx_d/pid"
+    __dlpx_feed | $__dlpx_c >"$__dlpx_d/in"
+    wait $__dlpx_p
+    echo $? >"$__dlpx_d/rc.tmp"
+    mv "$__dlpx_d/rc.tmp" "$__dlpx_d/rc"
+    [ -e "$__dlpx_d/cancel" ] && rm -rf "$__dlpx_d"
+) >/dev/null 2>&1 </dev/null &
+printf '%s start %s\\n' {marker} "$__dlpx_d"
+"""
+
+#
+# Stores chunk {index} next to the feeder's input unless the destination
+# command has already exited. The chunk is handed to the feeder once fewer
+# than backlog chunks are waiting for it; if that takes too long the script
+# returns "wait" and _DESTINATION_PUBLISH is called until it succeeds.
+#
+_DESTINATION_WRITE = u"""\
+__dlpx_d={directory}
+[ -d "$__dlpx_d" ] || {{ echo 'The pipe spool directory is gone' >&2; exit 1; }}
+if [ -e "$__dlpx_d/rc" ]; then printf '%s ended\\n' {marker}; exit 0; fi
+__dlpx_unb64 >"$__dlpx_d/part.{index}" <<'__DLPX_EOF__' || exit 1
+{data}
+__DLPX_EOF__
+"""
+
+_DESTINATION_PUBLISH = u"""\
+__dlpx_d={directory}
+[ -d "$__dlpx_d" ] || {{ echo 'The pipe spool directory is gone' >&2; exit 1; }}
+__dlpx_i=0
+while [ -e "$__dlpx_d/in.{previous}" ]; do
+    if [ -e "$__dlpx_d/rc" ]; then printf '%s ended\\n' {marker}; exit 0; fi
+    __dlpx_i=$((__dlpx_i + 1))
+    if [ $__dlpx_i -ge {polls} ]; then printf '%s wait\\n' {marker}; exit 0; fi
+    __dlpx_nap
+done
+if [ -e "$__dlpx_d/rc" ]; then printf '%s ended\\n' {marker}; exit 0; fi
+mv "$__dlpx_d/part.{index}" "$__dlpx_d/in.{index}" || exit 1
+printf '%s written\\n' {marker}
+"""
+
+#
+# Signals the end of the input and returns the result of the destination
+# command once it has exited, removing the spool directory.
+#
+_DESTINATION_FINISH = u"""\
+__dlpx_d={directory}
+[ -d "$__dlpx_d" ] || {{ echo 'The pipe spool directory is gone' >&2; exit 1; }}
+: >"$__dlpx_d/eof"
+__dlpx_i=0
+while [ ! -e "$__dlpx_d/rc" ]; do
+    __dlpx_i=$((__dlpx_i + 1))
+    if [ $__dlpx_i -ge {polls} ]; then printf '%s wait\\n' {marker}; exit 0; fi
+    __dlpx_nap
+done
+printf '%s end %s\\n' {marker} "$(cat "$__dlpx_d/rc")"
+printf '%s stdout\\n' {marker}
+__dlpx_b64 <"$__dlpx_d/out"
+printf '\\n%s stderr\\n' {marker}
+__dlpx_b64 <"$__dlpx_d/err"
+printf '\\n'
+rm -rf "$__dlpx_d"
+"""
+
+#
+# Stops a command started by pipe and removes its spool directory. If the
+# background job is slow to shut down, it removes the directory itself once
+# it is done.
+#
+_CANCEL = u"""\
+__dlpx_d={directory}
+[ -d "$__dlpx_d" ] || exit 0
+: >"$__dlpx_d/cancel"
+if [ -f "$__dlpx_d/pid" ]; then
+    __dlpx_p=$(cat "$__dlpx_d/pid")
+    pkill -TERM -P "$__dlpx_p" >/dev/null 2>&1
+    kill "$__dlpx_p" >/dev/null 2>&1
+    __dlpx_i=0
+    while [ ! -f "$__dlpx_d/rc" ] && [ $__dlpx_i -lt 50 ]; do
+        __dlpx_nap
+        __dlpx_i=$((__dlpx_i + 1))
+    done
+fi
+[ -e "$__dlpx_d/rc" ] && rm -rf "$__dlpx_d"
+exit 0
+"""
+
+
+class PipeResult(object):
+    """The result of a pipe() call.
+
+    Args:
+        source (CommandResult): Result of the source command. Its stdout is
+            always empty, since it was piped to the destination command, and
+            its exit_code is None if the source command was stopped because
+            the destination command exited first.
+        destination (CommandResult): Result of the destination command.
+        bytes_read (int): Number of bytes the source command wrote, or None if
+            it was stopped.
+        bytes_transferred (int): Number of bytes relayed between the hosts,
+            after compression.
+    """
+    def __init__(self, source, destination, bytes_read, bytes_transferred):
+        self.__source = source
+        self.__destination = destination
+        self.__bytes_read = bytes_read
+        self.__bytes_transferred = bytes_transferred
+
+    @property
+    def source(self):
+        return self.__source
+
+    @property
+    def destination(self):
+        return self.__destination
+
+    @property
+    def exit_code(self):
+        """The exit code of the destination command."""
+        return self.__destination.exit_code
+
+    @property
+    def bytes_read(self):
+        return self.__bytes_read
+
+    @property
+    def bytes_transferred(self):
+        return self.__bytes_transferred
+
+
+def _call(remote_connection, command, marker):
+    result = libs.run_bash(remote_connection, _NAP + command, check=True)
+    frames = split_frames(result.stdout, marker)
+    if not frames:
+        raise PluginScriptError('The pipe script returned no result.'
+                                ' stdout : {} and '
+                                ' stderr : {}'.format(result.stdout,
+                                                      result.stderr))
+    return frames
+
+
+def _cancel(remote_connection, directory):
+    """Stops the command of one side of a pipe. This is a best effort: a
+    failure to reach the host is ignored."""
+    try:
+        libs.run_bash(remote_connection,
+                      _NAP + _CANCEL.format(directory=quote_sh(directory)))
+    except Exception:
+        pass
+
+
+class _Source(object):
+    """The source side of a pipe, whose chunks are fetched on a separate
+    thread into a bounded queue."""
+    def __init__(self, remote_connection, directory, backlog):
+        self.remote_connection = remote_connection
+        self.directory = directory
+        self.chunks = queue.Queue(maxsize=backlog)
+        self.stopped = threading.Event()
+        self.result = None
+
+    def fetch(self):
+        try:
+            index = 0
+            while not self.stopped.is_set():
+                marker = new_marker()
+                header, body = _call(self.remote_connection,
+                                     BASH_BASE64 + _SOURCE_FETCH.format(
+                                         directory=quote_sh(self.directory),
+                                         index=index,
+                                         polls=_POLLS,
+                                         marker=quote_sh(marker)),
+                                     marker)[0]
+                if header[0] == 'chunk':
+                    self.put(('chunk', base64.b64decode(body)))
+                    index += 1
+                elif header[0] == 'end':
+                    self.put(('end', (int(header[1]), int(header[2]),
+                                      base64.b64decode(body))))
+                    return
+        except BaseException as e:
+            self.put(('error', e))
+
+    def put(self, item):
+        while not self.stopped.is_set():
+            try:
+                self.chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+
+def _write(remote_connection, directory, index, data, backlog):
+    """Hands a chunk to the destination command.
+
+    Returns:
+        bool: False if the destination command has already exited.
+    """
+    marker = new_marker()
+    frames = split_frames(
+        libs.run_bash(remote_connection,
+                      BASH_UNBASE64_SHA256 + _DESTINATION_WRITE.format(
+                          directory=quote_sh(directory),
+                          index=index,
+                          marker=quote_sh(marker),
+                          data=base64.encodebytes(data).decode('ascii')
+                          .rstrip('\n')),
+                      check=True).stdout,
+        marker)
+    if frames and frames[0][0][0] == 'ended':
+        return False
+    while True:
+        marker = new_marker()
+        header = _call(remote_connection,
+                       _DESTINATION_PUBLISH.format(
+                           directory=quote_sh(directory),
+                           index=index,
+                           previous=index - backlog,
+                           polls=_POLLS,
+                           marker=quote_sh(marker)),
+                       marker)[0][0]
+        if header[0] != 'wait':
+            return header[0] == 'written'
+
+
+def _finish(remote_connection, directory):
+    while True:
+        marker = new_marker()
+        frames = _call(remote_connection,
+                       BASH_BASE64 + _DESTINATION_FINISH.format(
+                           directory=quote_sh(directory),
+                           polls=_POLLS,
+                           marker=quote_sh(marker)),
+                       marker)
+        if frames[0][0][0] == 'end':
+            output = {header[0]: base64.b64decode(body)
+                      for header, body in frames[1:]}
+            return CommandResult(int(frames[0][0][1]), output['stdout'],
+                                 output['stderr'])
+
+
+def pipe(source_connection, source_command, destination_connection,
+         destination_command, compress=False, chunk_size=512 * 1024,
+         backlog=4, check=False):
+    """Streams the stdout of a bash command on one host into the stdin of a
+    bash command on another host.
+
+    Both commands run concurrently. The data is relayed through the plugin in
+    chunks of at most chunk_size bytes, with at most backlog chunks spooled
+    in the scratch path of each host, so a dump can be restored on another
+    host without ever being written there in full.
+
+    Args:
+        source_connection (RemoteConnection): Connection to the host to run
+        the source command on.
+        source_command (str): Bash command whose stdout is piped.
+        destination_connection (RemoteConnection): Connection to the host to
+        run the destination command on.
+        destination_command (str): Bash command that reads the piped data
+        from stdin.
+        compress (bool): Whether to gzip the data on the source host and
+        decompress it on the destination host. If gzip is not available on
+        the source host, the data is sent uncompressed.
+        chunk_size (int): Maximum number of bytes to relay per call.
+        backlog (int): Maximum number of chunks spooled on each host.
+        check (bool): if True, raise PluginScriptError if either command
+        exits with a non-zero exit code.
+
+    Returns:
+        PipeResult: The results of both commands and the number of bytes
+        piped.
+
+    Raises:
+        PluginScriptError: If check is True and a command failed, or if the
+        pipe itself failed. Both commands are stopped in that case.
+    """
+    source_command = to_str(source_command)
+    destination_command = to_str(destination_command)
+
+    if not isinstance(source_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'source_connection',
+            type(source_connection),
+            RemoteConnection)
+    if not isinstance(source_command, six.string_types):
+        raise IncorrectArgumentTypeError(
+            'source_command',
+            type(source_command),
+            six.string_types[0])
+    if not isinstance(destination_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'destination_connection',
+            type(destination_connection),
+            RemoteConnection)
+    if not isinstance(destination_command, six.string_types):
+        raise IncorrectArgumentTypeError(
+            'destination_command',
+            type(destination_command),
+            six.string_types[0])
+    if not isinstance(compress, bool):
+        raise IncorrectArgumentTypeError('compress', type(compress), bool, False)
+    if (not isinstance(chunk_size, six.integer_types) or
+            isinstance(chunk_size, bool) or chunk_size <= 0):
+        raise IncorrectArgumentTypeError(
+            'chunk_size', type(chunk_size), int, False)
+    if (not isinstance(backlog, six.integer_types) or
+            isinstance(backlog, bool) or backlog <= 0):
+        raise IncorrectArgumentTypeError('backlog', type(backlog), int, False)
+    if not isinstance(check, bool):
+        raise IncorrectArgumentTypeError('check', type(check), bool, False)
+
+    marker = new_marker()
+    header = _call(source_connection, _SOURCE_START.format(
+        scratch=quote_sh(
+            source_connection.environment.host.scratch_path),
+        compress=1 if compress else 0,
+        backlog=backlog,
+        chunk_size=chunk_size,
+        command=quote_sh(source_command),
+        marker=quote_sh(marker)), marker)[0][0]
+    source = _Source(source_connection, header[1], backlog)
+    compressed = header[2] == 'gzip'
+
+    destination = None
+    fetcher = None
+    try:
+        marker = new_marker()
+        destination = _call(destination_connection, _DESTINATION_START.format(
+            scratch=quote_sh(
+                destination_connection.environment.host.scratch_path),
+            decompress=1 if compressed else 0,
+            command=quote_sh(destination_command),
+            marker=quote_sh(marker)), marker)[0][0][1]
+
+        fetcher = threading.Thread(target=source.fetch)
+        fetcher.daemon = True
+        fetcher.start()
+
+        index = 0
+        transferred = 0
+        while True:
+            kind, value = source.chunks.get()
+            if kind == 'error':
+                raise value
+            if kind == 'end':
+                source.result = value
+                break
+            if not _write(destination_connection, destination, index, value,
+                          backlog):
+                break
+            transferred += len(value)
+            index += 1
+        result = _finish(destination_connection, destination)
+        destination = None
+    finally:
+        source.stopped.set()
+        if fetcher is not None:
+            fetcher.join()
+        if source.result is None:
+            _cancel(source_connection, source.directory)
+        if destination is not None:
+            _cancel(destination_connection, destination)
+
+    if source.result is None:
+        source_result = CommandResult(None, b'', b'')
+        bytes_read = None
+    else:
+        exit_code, bytes_read, stderr = source.result
+        source_result = CommandResult(exit_code, b'', stderr)
+
+    for name, command_result in (('source', source_result),
+                                 ('destination', result)):
+        if check and command_result.exit_code not in (0, None):
+            raise PluginScriptError('The {} command failed with exit code {}.'
+                                    ' stdout : {} and '
+                                    ' stderr : {}'.format(
+                                          name,
+                                          command_result.exit_code,
+                                          command_result.stdout,
+                                          command_result.stderr))
+    return PipeResult(source_result, result, bytes_read, transferred)
@@ -0,0 +1,270 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Bulk queries of remote files.
+
+Discovery and source_size implementations often stat, list or measure many
+paths, one run_bash call per path. query_files answers all of these questions
+for a list of paths with a single run_bash or run_powershell call, returning
+the results in a structured form.
+"""
+
+import base64
+
+import six
+
+from dlpx.virtualization.common._common_classes import RemoteConnection
+from dlpx.virtualization.common.util import to_str
+from dlpx.virtualization.libs import libs
+from dlpx.virtualization.libs._files import FileStat, _check_int, _file_type
+from dlpx.virtualization.libs._shell import (BASH_BASE64, new_marker, quote_ps,
+                                             quote_sh, split_frames)
+from dlpx.virtualization.libs.exceptions import (IncorrectArgumentTypeError,
+                                                 PluginScriptError)
+
+__all__ = [
+    "FileQuery",
+    "query_files"
+]
+
+#
+# find -printf reports the file type as a single letter.
+#
+_FIND_TYPES = {
+    'f': 'file',
+    'd': 'directory',
+    'l': 'symlink'
+}
+
+_BASH_QUERY = u"""\
+__dlpx_stat() {{
+    stat -c '%s %Y %a %F' "$1" 2>/dev/null || stat -f '%z %m %Lp %HT' "$1"
+}}
+__dlpx_entries() {{
+    if find /dev/null -maxdepth 0 -printf '' >/dev/null 2>&1; then
+        find "$1" -mindepth 1 -maxdepth {depth} -printf '%p\\0%s %T@ %m %y\\0' \\
+            2>/dev/null
+    else
+        find "$1" -mindepth 1 -maxdepth {depth} -print0 2>/dev/null |
+            while IFS= read -r -d '' __dlpx_f; do
+                __dlpx_s=$(__dlpx_stat "$__dlpx_f") || continue
+                printf '%s\\0%s\\0' "$__dlpx_f" "$__dlpx_s"
+            done
+    fi
+}}
+__dlpx_query() {{
+    if [ ! -e "$2" ] && [ ! -h "$2" ]; then
+        printf '%s missing %s\\n' {marker} "$1"
+        return
+    fi
+    __dlpx_s=$(__dlpx_stat "$2") || return
+    printf '%s stat %s %s\\n' {marker} "$1" "$__dlpx_s"
+    if [ {depth} -gt 0 ] && [ -d "$2" ]; then
+        printf '%s list %s\\n' {marker} "$1"
+        __dlpx_entries "$2" | __dlpx_b64
+        printf '\\n'
+    fi
+    if [ {disk_usage} = 1 ]; then
+        printf '%s du %s %s\\n' {marker} "$1" \\
+            "$(du -sk "$2" 2>/dev/null | cut -f1)"
+    fi
+}}
+"""
+
+_POWERSHELL_QUERY = u"""\
+$epoch = New-Object DateTime 1970, 1, 1, 0, 0, 0, ([DateTimeKind]::Utc)
+function __DlpxStat($Item) {{
+    $mtime = ($Item.LastWriteTimeUtc - $epoch).TotalSeconds
+    if ($Item.PSIsContainer) {{
+        $type = 'directory'; $size = 0
+    }} else {{
+        $type = 'regular file'; $size = $Item.Length
+    }}
+    if ($Item.Attributes -band [IO.FileAttributes]::ReparsePoint) {{
+        $type = 'symbolic link'
+    }}
+    return ("{{0}} {{1}} 0 {{2}}" -f $size,
+        $mtime.ToString([Globalization.CultureInfo]::InvariantCulture), $type)
+}}
+$paths = @({paths})
+$out = New-Object System.Text.StringBuilder
+for ($i = 0; $i -lt $paths.Length; $i++) {{
+    $item = Get-Item -LiteralPath $paths[$i] -Force -ErrorAction SilentlyContinue
+    if ($item -eq $null) {{
+        [void]$out.Append(("{{0}} missing {{1}}`n" -f {marker}, $i))
+        continue
+    }}
+    [void]$out.Append(("{{0}} stat {{1}} {{2}}`n" -f {marker}, $i,
+        (__DlpxStat $item)))
+    if ({depth} -gt 0 -and $item.PSIsContainer) {{
+        $list = New-Object System.Text.StringBuilder
+        Get-ChildItem -LiteralPath $item.FullName -Recurse -Depth ({depth} - 1) `
+                -Force -ErrorAction SilentlyContinue | ForEach-Object {{
+            [void]$list.Append($_.FullName).Append([char]0)
+            [void]$list.Append((__DlpxStat $_)).Append([char]0)
+        }}
+        [void]$out.Append(("{{0}} list {{1}}`n{{2}}`n" -f {marker}, $i,
+            [Convert]::ToBase64String(
+                [Text.Encoding]::UTF8.GetBytes($list.ToString()))))
+    }}
+    if ({disk_usage}) {{
+        $usage = $item.Length
+        if ($item.PSIsContainer) {{
+            $usage = (Get-ChildItem -LiteralPath $item.FullName -Recurse -File `
+                -Force -ErrorAction SilentlyContinue |
+                Measure-Object -Property Length -Sum).Sum
+        }}
+        if ($usage -eq $null) {{ $usage = 0 }}
+        [void]$out.Append(("{{0}} du {{1}} {{2}}`n" -f {marker}, $i, $usage))
+    }}
+}}
+[Console]::Out.Write($out.ToString())
+"""
+
+
+class FileQuery(object):
+    """The result of query_files() for a single path.
+
+    Args:
+        stat (FileStat): Information about the file itself.
+        entries (list of FileStat): The files below the path, up to the
+            requested depth, or None if the path was not listed.
+        disk_usage (int): Disk space used by the path and everything below
+            it, in bytes, or None if it was not measured.
+    """
+    def __init__(self, stat, entries=None, disk_usage=None):
+        self.__stat = stat
+        self.__entries = entries
+        self.__disk_usage = disk_usage
+
+    @property
+    def path(self):
+        return self.__stat.path
+
+    @property
+    def exists(self):
+        return self.__stat.exists
+
+    @property
+    def stat(self):
+        return self.__stat
+
+    @property
+    def entries(self):
+        return self.__entries
+
+    @property
+    def disk_usage(self):
+        return self.__disk_usage
+
+
+def _file_stat(path, fields):
+    description = u' '.join(fields[3:])
+    return FileStat(path,
+                    True,
+                    file_type=_FIND_TYPES.get(description, 'other')
+                    if len(description) == 1 else _file_type(description),
+                    size=int(fields[0]),
+                    mtime=float(fields[1]),
+                    mode=int(fields[2], 8))
+
+
+def _entries(data):
+    values = base64.b64decode(data).decode('utf-8',
+                                           'surrogateescape').split(u'\0')
+    return [_file_stat(values[index], values[index + 1].split(u' '))
+            for index in range(0, len(values) - 1, 2)]
+
+
+def query_files(remote_connection, paths, list_depth=0, disk_usage=False,
+                powershell=False):
+    """Returns information about many remote files with a single call.
+
+    Every path is checked for existence and stat'ed. Directories can also be
+    listed, recursively up to list_depth levels, and the disk usage of every
+    path can be measured.
+
+    Args:
+        remote_connection (RemoteConnection): Connection to a remote
+        environment.
+        paths (list of str): Paths of the files on the remote host.
+        list_depth (int): Number of directory levels to list below each path
+        that is a directory. 0 does not list any.
+        disk_usage (bool): Whether to measure the disk usage of each path.
+        On Windows hosts this is the total size of the files below the path.
+        powershell (bool): Whether the remote host is a Windows host.
+
+    Returns:
+        dict of str:FileQuery: The result for each path.
+
+    Raises:
+        PluginScriptError: If a path exists but cannot be stat'ed.
+    """
+    paths = to_str(paths)
+    if not isinstance(remote_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'remote_connection',
+            type(remote_connection),
+            RemoteConnection)
+    if (not isinstance(paths, list) or
+            not all(isinstance(path, six.string_types) for path in paths)):
+        raise IncorrectArgumentTypeError(
+            'paths', type(paths), [six.string_types[0]])
+    if not _check_int(list_depth) or list_depth < 0:
+        raise IncorrectArgumentTypeError(
+            'list_depth', type(list_depth), int, False)
+    if not isinstance(disk_usage, bool):
+        raise IncorrectArgumentTypeError(
+            'disk_usage', type(disk_usage), bool, False)
+    if not isinstance(powershell, bool):
+        raise IncorrectArgumentTypeError(
+            'powershell', type(powershell), bool, False)
+
+    paths = list(dict.fromkeys(paths))
+    if not paths:
+        return {}
+
+    marker = new_marker()
+    if powershell:
+        command = _POWERSHELL_QUERY.format(
+            paths=u', '.join(quote_ps(path) for path in paths),
+            depth=list_depth,
+            disk_usage='$true' if disk_usage else '$false',
+            marker=quote_ps(marker))
+        result = libs.run_powershell(remote_connection, command, check=True)
+    else:
+        command = BASH_BASE64 + _BASH_QUERY.format(
+            depth=list_depth,
+            disk_usage=1 if disk_usage else 0,
+            marker=quote_sh(marker)) + u''.join(
+                u'__dlpx_query {} {}\n'.format(index, quote_sh(path))
+                for index, path in enumerate(paths))
+        result = libs.run_bash(remote_connection, command, check=True)
+
+    stats = {}
+    entries = {}
+    usage = {}
+    for header, body in split_frames(result.stdout, marker):
+        index = int(header[1])
+        if header[0] == 'missing':
+            stats[index] = FileStat(paths[index], False)
+        elif header[0] == 'stat':
+            stats[index] = _file_stat(paths[index], header[2:])
+        elif header[0] == 'list':
+            entries[index] = _entries(body)
+        elif header[0] == 'du' and len(header) > 2 and header[2]:
+            usage[index] = int(header[2]) * (1 if powershell else 1024)
+
+    queries = {}
+    for index, path in enumerate(paths):
+        if index not in stats:
+            raise PluginScriptError('Failed to stat {}. stdout : {} and '
+                                    ' stderr : {}'.format(path,
+                                                          result.stdout,
+                                                          result.stderr))
+        listed = None
+        if list_depth > 0 and stats[index].is_dir:
+            listed = entries.get(index, [])
+        queries[path] = FileQuery(stats[index], listed, usage.get(index))
+    return queries
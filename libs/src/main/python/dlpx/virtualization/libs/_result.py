@@ -0,0 +1,156 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Results of the remote command wrappers.
+
+run_bash, run_powershell and run_expect return a CommandResult instead of the
+raw protobuf result. Decoding the output of a command, which can be large, is
+deferred until stdout or stderr is first read, so a plugin that only looks at
+exit_code never pays for it. iter_lines() and tail() walk the decoded text
+without splitting all of it into a list.
+
+The output fields of the protobuf results are text, so stdout_bytes and
+stderr_bytes are not a view of the received data: they encode the text to
+UTF-8 once, on first access, and return a memoryview of that copy.
+"""
+
+import six
+
+__all__ = [
+    "CommandResult"
+]
+
+
+class CommandResult(object):
+    """The result of a remote command.
+
+    Args:
+        exit_code (int): Exit code of the command.
+        stdout (str or bytes): Standard output of the command.
+        stderr (str or bytes): Standard error of the command.
+    """
+    def __init__(self, exit_code, stdout, stderr):
+        self.__exit_code = exit_code
+        self.__raw = {'stdout': stdout, 'stderr': stderr}
+        self.__text = {}
+        self.__bytes = {}
+        self.__proto = None
+
+    @staticmethod
+    def from_proto(return_value):
+        """Wraps a RunBashResult, RunPowerShellResult or RunExpectResult.
+
+        The output fields are only read from the protobuf message when they
+        are first used.
+        """
+        result = CommandResult(return_value.exit_code, None, None)
+        result.__proto = return_value
+        return result
+
+    @property
+    def exit_code(self):
+        return self.__exit_code
+
+    @property
+    def stdout(self):
+        """The standard output of the command, decoded on first access."""
+        return self.__get_text('stdout')
+
+    @stdout.setter
+    def stdout(self, value):
+        self.__set('stdout', value)
+
+    @property
+    def stderr(self):
+        """The standard error of the command, decoded on first access."""
+        return self.__get_text('stderr')
+
+    @stderr.setter
+    def stderr(self, value):
+        self.__set('stderr', value)
+
+    @property
+    def stdout_bytes(self):
+        """The standard output of the command as a memoryview of its UTF-8
+        bytes. Output held as text is encoded on first access."""
+        return self.__get_bytes('stdout')
+
+    @property
+    def stderr_bytes(self):
+        """The standard error of the command as a memoryview of its UTF-8
+        bytes. Output held as text is encoded on first access."""
+        return self.__get_bytes('stderr')
+
+    def iter_lines(self, stderr=False):
+        """Yields the lines of the output one at a time, without their line
+        endings.
+
+        Args:
+            stderr (bool): Whether to read standard error instead of standard
+            output.
+        """
+        text = self.stderr if stderr else self.stdout
+        start = 0
+        while start < len(text):
+            end = text.find(u'\n', start)
+            if end == -1:
+                yield text[start:].rstrip(u'\r')
+                return
+            yield text[start:end].rstrip(u'\r')
+            start = end + 1
+
+    def tail(self, n, stderr=False):
+        """Returns the last n lines of the output, without their line endings.
+
+        Only the end of the output is scanned, so this is cheap even when the
+        output is large.
+
+        Args:
+            n (int): Number of lines to return.
+            stderr (bool): Whether to read standard error instead of standard
+            output.
+
+        Returns:
+            list of str: Up to n lines, oldest first.
+        """
+        text = self.stderr if stderr else self.stdout
+        if n <= 0 or not text:
+            return []
+        end = len(text) - 1 if text.endswith(u'\n') else len(text)
+        start = end
+        for _ in range(n):
+            start = text.rfind(u'\n', 0, start)
+            if start == -1:
+                break
+        return [line.rstrip(u'\r')
+                for line in text[start + 1:end].split(u'\n')]
+
+    def __get_raw(self, name):
+        if self.__raw[name] is None:
+            self.__raw[name] = getattr(self.__proto, name)
+        return self.__raw[name]
+
+    def __get_text(self, name):
+        if name not in self.__text:
+            raw = self.__get_raw(name)
+            if not isinstance(raw, six.text_type):
+                raw = bytes(raw).decode('utf-8')
+            self.__text[name] = raw
+        return self.__text[name]
+
+    def __get_bytes(self, name):
+        if name not in self.__bytes:
+            raw = self.__get_raw(name)
+            if isinstance(raw, six.text_type):
+                raw = raw.encode('utf-8')
+            self.__bytes[name] = memoryview(raw)
+        return self.__bytes[name]
+
+    def __set(self, name, value):
+        self.__raw[name] = value
+        self.__text.pop(name, None)
+        self.__bytes.pop(name, None)
+
+    def __repr__(self):
+        return 'CommandResult(exit_code={})'.format(self.__exit_code)
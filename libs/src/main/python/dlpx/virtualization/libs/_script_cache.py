@@ -0,0 +1,325 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Content-addressed cache of scripts on remote hosts.
+
+Plugins typically run the same scripts over and over, sending the full text
+of the script with every call. The cached wrappers in this module upload a
+script to the host's scratch path once, named by the SHA-256 digest of its
+content, and afterwards only send a short command that runs the cached copy.
+If the cached copy has gone missing (for example because the scratch path was
+cleaned up), the script is uploaded again and the call is retried.
+"""
+
+import base64
+import hashlib
+import re
+import threading
+
+import six
+
+from dlpx.virtualization.common._common_classes import RemoteConnection
+from dlpx.virtualization.common.util import to_str
+from dlpx.virtualization.libs import libs
+from dlpx.virtualization.libs._shell import (new_marker, quote_ps, quote_sh,
+                                             quote_tcl)
+from dlpx.virtualization.libs.exceptions import (IncorrectArgumentTypeError,
+                                                 PluginScriptError)
+
+__all__ = [
+    "run_bash_cached",
+    "run_powershell_cached",
+    "run_expect_cached"
+]
+
+_CACHE_DIRECTORY = u'.dlpx-script-cache'
+
+#
+# Exit code and stderr message with which the generated commands report that
+# the cached copy of a script is missing. Both have to match for the script
+# to be uploaded again, so a script that happens to exit with the same code
+# is not mistaken for a cache miss.
+#
+_MISSING_EXIT_CODE = 197
+_MISSING_MESSAGE = u'DLPX_SCRIPT_CACHE_MISS'
+
+_BASH_RUN = u"""\
+__dlpx_f={path}
+if [ ! -r "$__dlpx_f" ]; then echo {missing} >&2; exit {exit_code}; fi
+. "$__dlpx_f"
+"""
+
+_BASH_UPLOAD = u"""\
+__dlpx_f={path}
+mkdir -p {directory} && chmod 700 {directory} || exit 1
+cat >"$__dlpx_f.$$" <<'{delimiter}'
+{script}
+{delimiter}
+mv "$__dlpx_f.$$" "$__dlpx_f" || exit 1
+"""
+
+_POWERSHELL_PATH = u"""\
+$__dlpxF = Join-Path (Join-Path (Join-Path {scratch} {cache}) {user}) {name}
+"""
+
+_POWERSHELL_RUN = _POWERSHELL_PATH + u"""\
+if (-not (Test-Path -LiteralPath $__dlpxF)) {{
+    [Console]::Error.WriteLine({missing})
+    exit {exit_code}
+}}
+. ([scriptblock]::Create([IO.File]::ReadAllText($__dlpxF)))
+"""
+
+_POWERSHELL_UPLOAD = _POWERSHELL_PATH + u"""\
+[void](New-Item -ItemType Directory -Force -Path (Split-Path $__dlpxF))
+[IO.File]::WriteAllBytes("$__dlpxF.tmp", [Convert]::FromBase64String({data}))
+Move-Item -Force -LiteralPath "$__dlpxF.tmp" -Destination $__dlpxF
+"""
+
+_EXPECT_RUN = u"""\
+set __dlpx_f {path}
+if {{![file readable $__dlpx_f]}} {{
+    puts stderr {missing}
+    exit {exit_code}
+}}
+source $__dlpx_f
+"""
+
+_uploaded = set()
+_uploaded_lock = threading.Lock()
+
+
+def _digest(command):
+    return hashlib.sha256(command.encode('utf-8')).hexdigest()
+
+
+def _cache_key(remote_connection, digest):
+    return (remote_connection.environment.host.reference,
+            remote_connection.user.reference,
+            digest)
+
+
+def _is_uploaded(key):
+    with _uploaded_lock:
+        return key in _uploaded
+
+
+def _set_uploaded(key, uploaded):
+    with _uploaded_lock:
+        if uploaded:
+            _uploaded.add(key)
+        else:
+            _uploaded.discard(key)
+
+
+def _user_directory(remote_connection):
+    return re.sub(u'[^A-Za-z0-9_.-]', u'_', remote_connection.user.reference)
+
+
+def _unix_paths(remote_connection, digest, suffix):
+    directory = u'{}/{}/{}'.format(
+        remote_connection.environment.host.scratch_path.rstrip(u'/'),
+        _CACHE_DIRECTORY,
+        _user_directory(remote_connection))
+    return directory, u'{}/{}{}'.format(directory, digest, suffix)
+
+
+def _bash_upload_command(remote_connection, command, digest, suffix):
+    directory, path = _unix_paths(remote_connection, digest, suffix)
+    return _BASH_UPLOAD.format(path=quote_sh(path),
+                               directory=quote_sh(directory),
+                               delimiter=new_marker(),
+                               script=command)
+
+
+def _is_missing(result):
+    return (result.exit_code == _MISSING_EXIT_CODE and
+            _MISSING_MESSAGE in result.stderr)
+
+
+def _run_cached(remote_connection, command, run, upload_and_run, upload,
+                check):
+    """Runs a cached script, uploading it first if it is not known to be
+    cached on the host yet.
+
+    Args:
+        run (function): Runs the cached copy and returns the result.
+        upload_and_run (function or None): Uploads the script and runs it with
+        a single call, or None if that is not possible.
+        upload (function): Only uploads the script.
+    """
+    key = _cache_key(remote_connection, _digest(command))
+    if _is_uploaded(key):
+        result = run()
+        if not _is_missing(result):
+            return _check(result, check)
+        _set_uploaded(key, False)
+
+    if upload_and_run is not None:
+        result = upload_and_run()
+        _set_uploaded(key, True)
+        return _check(result, check)
+
+    upload()
+    _set_uploaded(key, True)
+    return _check(run(), check)
+
+
+def _check(result, check):
+    if check and result.exit_code != 0:
+        raise PluginScriptError('The script failed with exit code {}.'
+                                ' stdout : {} and '
+                                ' stderr : {}'.format(
+                                      result.exit_code,
+                                      result.stdout,
+                                      result.stderr))
+    return result
+
+
+def run_bash_cached(remote_connection, command, variables=None,
+                    use_login_shell=False, check=False):
+    """run_bash with the script cached on the remote host.
+
+    The first call for a given script on a host uploads the script into the
+    host's scratch path as part of running it. Later calls only send a short
+    command that sources the cached copy, which behaves like running the
+    script inline.
+
+    Args:
+        remote_connection (RemoteConnection): Connection to a remote
+        environment.
+        command (str): Bash command to run.
+        variables (dict of str:str): Environment variables to set before
+        running the command.
+        use_login_shell (bool): Whether to use login shell.
+        check (bool): if True and non-zero exitcode is received, raise PluginScriptError
+
+    Returns:
+        CommandResult: The exit code and output of the script.
+    """
+    command = to_str(command)
+    if not isinstance(remote_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'remote_connection',
+            type(remote_connection),
+            RemoteConnection)
+    if not isinstance(command, six.string_types):
+        raise IncorrectArgumentTypeError('command', type(command), six.string_types[0])
+    digest = _digest(command)
+
+    def run_bash(script):
+        return libs.run_bash(remote_connection, script, variables=variables,
+                             use_login_shell=use_login_shell)
+
+    def run():
+        _, path = _unix_paths(remote_connection, digest, u'.sh')
+        return run_bash(_BASH_RUN.format(path=quote_sh(path),
+                                         missing=_MISSING_MESSAGE,
+                                         exit_code=_MISSING_EXIT_CODE))
+
+    def upload_and_run():
+        return run_bash(
+            _bash_upload_command(remote_connection, command, digest, u'.sh') +
+            u'. "$__dlpx_f"\n')
+
+    return _run_cached(remote_connection, command, run, upload_and_run, None,
+                       check)
+
+
+def run_powershell_cached(remote_connection, command, variables=None,
+                          check=False):
+    """run_powershell with the script cached on the remote host.
+
+    The script is uploaded into the host's scratch path the first time it is
+    run on a host. Later calls only send a short command that runs the cached
+    copy in the same way as an inline script.
+
+    Args:
+        remote_connection (RemoteConnection): Connection to a remote
+        environment.
+        command (str): Powershell script to run.
+        variables (dict): Environment variables to set before running the
+        command.
+        check (bool): if True and non-zero exitcode is received, raise PluginScriptError
+
+    Returns:
+        CommandResult: The exit code and output of the script.
+    """
+    command = to_str(command)
+    if not isinstance(remote_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'remote_connection',
+            type(remote_connection),
+            RemoteConnection)
+    if not isinstance(command, six.string_types):
+        raise IncorrectArgumentTypeError('command', type(command), six.string_types[0])
+    digest = _digest(command)
+    path = dict(scratch=quote_ps(remote_connection.environment.host.scratch_path),
+                cache=quote_ps(_CACHE_DIRECTORY),
+                user=quote_ps(_user_directory(remote_connection)),
+                name=quote_ps(digest + u'.ps1'))
+
+    def run_powershell(script):
+        return libs.run_powershell(remote_connection, script,
+                                   variables=variables)
+
+    def run():
+        return run_powershell(_POWERSHELL_RUN.format(
+            missing=quote_ps(_MISSING_MESSAGE),
+            exit_code=_MISSING_EXIT_CODE,
+            **path))
+
+    def upload_and_run():
+        data = base64.b64encode(command.encode('utf-8')).decode('ascii')
+        return run_powershell(
+            _POWERSHELL_UPLOAD.format(data=quote_ps(data), **path) +
+            u'. ([scriptblock]::Create([IO.File]::ReadAllText($__dlpxF)))\n')
+
+    return _run_cached(remote_connection, command, run, upload_and_run, None,
+                       check)
+
+
+def run_expect_cached(remote_connection, command, variables=None, check=False):
+    """run_expect with the script cached on the remote host.
+
+    The script is uploaded into the host's scratch path with run_bash the
+    first time it is run on a host, and is sourced from there by a short
+    command on every call.
+
+    Args:
+        remote_connection (RemoteConnection): Connection to a remote
+        environment.
+        command (str): Expect(TCL) command to run.
+        variables (dict): Environment variables to set before running the
+        command.
+        check (bool): if True and non-zero exitcode is received, raise PluginScriptError
+
+    Returns:
+        CommandResult: The exit code and output of the script.
+    """
+    command = to_str(command)
+    if not isinstance(remote_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'remote_connection',
+            type(remote_connection),
+            RemoteConnection)
+    if not isinstance(command, six.string_types):
+        raise IncorrectArgumentTypeError('command', type(command), six.string_types[0])
+    digest = _digest(command)
+
+    def run():
+        _, path = _unix_paths(remote_connection, digest, u'.exp')
+        return libs.run_expect(remote_connection,
+                               _EXPECT_RUN.format(path=quote_tcl(path),
+                                                  missing=_MISSING_MESSAGE,
+                                                  exit_code=_MISSING_EXIT_CODE),
+                               variables=variables)
+
+    def upload():
+        libs.run_bash(remote_connection,
+                      _bash_upload_command(remote_connection, command, digest,
+                                           u'.exp'),
+                      check=True)
+
+    return _run_cached(remote_connection, command, run, None, upload, check)
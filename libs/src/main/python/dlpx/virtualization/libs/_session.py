@@ -0,0 +1,270 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Remote shell sessions.
+
+Every run_bash or run_powershell call starts a new remote shell, so exported
+variables and the working directory do not carry over from one call to the
+next, and a login shell re-sources the user's profile on every call. A
+Session carries that state between calls instead: each command reports the
+environment and working directory it leaves behind, and the next command
+restores them before it runs. With login=True only the first command of a
+session pays for the login shell; the following commands run in a plain
+shell with the captured login environment.
+"""
+
+import base64
+import threading
+import time
+
+import six
+
+from dlpx.virtualization.common._common_classes import RemoteConnection
+from dlpx.virtualization.common.util import to_str
+from dlpx.virtualization.libs import libs
+from dlpx.virtualization.libs._shell import (bash_restore_environment,
+                                             new_marker, quote_ps, quote_sh)
+from dlpx.virtualization.libs.exceptions import (IncorrectArgumentTypeError,
+                                                 PluginScriptError)
+
+__all__ = [
+    "Session",
+    "session"
+]
+
+_BASH_COMMAND = u"""\
+trap '__dlpx_rc=$?
+printf "\\n%s state\\n" {marker}
+export -p
+printf "\\n%s cwd\\n" {marker}
+pwd
+printf "\\n"
+exit $__dlpx_rc' EXIT
+{restore}{exports}eval {command}
+"""
+
+_POWERSHELL_COMMAND = u"""\
+{restore}{exports}try {{
+    . ([scriptblock]::Create({command}))
+}} finally {{
+    $__dlpxUtf8 = [Text.Encoding]::UTF8
+    $__dlpxState = New-Object System.Text.StringBuilder
+    foreach ($__dlpxVar in [Environment]::GetEnvironmentVariables().GetEnumerator()) {{
+        if ([string]$__dlpxVar.Key -like '=*') {{ continue }}
+        [void]$__dlpxState.AppendLine(
+            [Convert]::ToBase64String($__dlpxUtf8.GetBytes([string]$__dlpxVar.Key)) +
+            ' ' +
+            [Convert]::ToBase64String($__dlpxUtf8.GetBytes([string]$__dlpxVar.Value)))
+    }}
+    [Console]::Out.Write(("`n{{0}} state`n{{1}}`n{{0}} cwd`n{{2}}`n" -f
+        {marker}, $__dlpxState.ToString().TrimEnd(), (Get-Location).Path))
+}}
+"""
+
+
+class Session(object):
+    """A remote shell session created by session().
+
+    The session carries exported environment variables and the working
+    directory from one command to the next. It is not a live remote process:
+    shell variables that are not exported, functions, and background jobs do
+    not carry over.
+
+    A session that has been idle for longer than idle_timeout seconds, or
+    whose state could not be captured after a command (for example because
+    the remote shell was killed), starts over with a fresh shell on the next
+    command.
+    """
+    def __init__(self, remote_connection, login, idle_timeout, powershell):
+        self.__remote_connection = remote_connection
+        self.__login = login
+        self.__idle_timeout = idle_timeout
+        self.__powershell = powershell
+        self.__lock = threading.Lock()
+        self.__state = None
+        self.__cwd = None
+        self.__last_used = None
+
+    @property
+    def remote_connection(self):
+        return self.__remote_connection
+
+    @property
+    def active(self):
+        """Whether the session currently carries state from earlier
+        commands."""
+        return self.__state is not None and not self.__expired()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Discards the state of the session."""
+        with self.__lock:
+            self.__reset()
+
+    def run(self, command, variables=None, check=False):
+        """Runs a command in the session.
+
+        Args:
+            command (str): Bash command, or PowerShell script for a PowerShell
+            session, to run.
+            variables (dict of str:str): Environment variables to export
+            before running the command. They remain set for the following
+            commands of the session.
+            check (bool): if True and non-zero exitcode is received, raise
+            PluginScriptError
+
+        Returns:
+            CommandResult: The exit code and output of the command, with
+            stdout holding only the output of the command.
+        """
+        command = to_str(command)
+        if variables is None:
+            variables = {}
+        variables = to_str(variables)
+
+        if not isinstance(command, six.string_types):
+            raise IncorrectArgumentTypeError(
+                'command', type(command), six.string_types[0])
+        if (not isinstance(variables, dict) or
+                not all(isinstance(variable, six.string_types) and
+                        isinstance(value, six.string_types)
+                        for variable, value in variables.items())):
+            raise IncorrectArgumentTypeError(
+                'variables',
+                type(variables),
+                {six.string_types[0]: six.string_types[0]},
+                False)
+
+        with self.__lock:
+            if self.__expired():
+                self.__reset()
+            marker = new_marker()
+            if self.__powershell:
+                result = libs.run_powershell(
+                    self.__remote_connection,
+                    self.__powershell_command(marker, command, variables))
+            else:
+                result = libs.run_bash(
+                    self.__remote_connection,
+                    self.__bash_command(marker, command, variables),
+                    use_login_shell=self.__login and self.__state is None)
+            self.__capture(result, marker)
+
+        if check and result.exit_code != 0:
+            raise PluginScriptError('The script failed with exit code {}.'
+                                    ' stdout : {} and '
+                                    ' stderr : {}'.format(
+                                          result.exit_code,
+                                          result.stdout,
+                                          result.stderr))
+        return result
+
+    def __expired(self):
+        return (self.__last_used is not None and self.__idle_timeout and
+                time.time() - self.__last_used > self.__idle_timeout)
+
+    def __reset(self):
+        self.__state = None
+        self.__cwd = None
+        self.__last_used = None
+
+    def __bash_command(self, marker, command, variables):
+        restore = u''
+        if self.__state is not None:
+            restore = bash_restore_environment(self.__state) + \
+                u'cd {} 2>/dev/null\n'.format(quote_sh(self.__cwd))
+        exports = u''.join(
+            u'export {}\n'.format(quote_sh(u'{}={}'.format(name, value)))
+            for name, value in variables.items())
+        #
+        # The marker is only made of letters, digits and underscores, so it
+        # can be used unquoted inside the single-quoted trap.
+        #
+        return _BASH_COMMAND.format(marker=marker,
+                                    restore=restore,
+                                    exports=exports,
+                                    command=quote_sh(command))
+
+    def __powershell_command(self, marker, command, variables):
+        restore = u''
+        if self.__state is not None:
+            restore = u''.join(
+                u'[Environment]::SetEnvironmentVariable({}, {})\n'.format(
+                    quote_ps(name), quote_ps(value))
+                for name, value in self.__state.items())
+            restore += u'Set-Location -LiteralPath {} -ErrorAction ' \
+                       u'SilentlyContinue\n'.format(quote_ps(self.__cwd))
+        exports = u''.join(
+            u'[Environment]::SetEnvironmentVariable({}, {})\n'.format(
+                quote_ps(name), quote_ps(value))
+            for name, value in variables.items())
+        return _POWERSHELL_COMMAND.format(marker=quote_ps(marker),
+                                          restore=restore,
+                                          exports=exports,
+                                          command=quote_ps(command))
+
+    def __capture(self, result, marker):
+        """Splits the state of the session off the stdout of a command."""
+        start = result.stdout.find(u'\n{} state\n'.format(marker))
+        cwd = result.stdout.find(u'\n{} cwd\n'.format(marker))
+        if start == -1 or cwd == -1:
+            self.__reset()
+            return
+        state = result.stdout[start + len(marker) + 8:cwd]
+        self.__cwd = result.stdout[cwd + len(marker) + 6:].strip()
+        if self.__powershell:
+            self.__state = {}
+            for line in state.split(u'\n'):
+                if u' ' in line:
+                    name, value = line.strip().split(u' ', 1)
+                    self.__state[base64.b64decode(name).decode('utf-8')] = (
+                        base64.b64decode(value).decode('utf-8'))
+        else:
+            self.__state = state
+        self.__last_used = time.time()
+        result.stdout = result.stdout[:start]
+
+
+def session(remote_connection, login=False, idle_timeout=300,
+            powershell=False):
+    """Opens a remote shell session.
+
+    The session is a context manager, and commands are run with its run()
+    method. Exported environment variables and the working directory carry
+    over from one command to the next. With login=True the first command runs
+    in a login shell and the following commands reuse the environment it set
+    up, without sourcing the profile again.
+
+    Args:
+        remote_connection (RemoteConnection): Connection to a remote
+        environment.
+        login (bool): Whether to start the session with a login shell. Only
+        applies to bash sessions.
+        idle_timeout (int): Number of seconds after which an unused session
+        starts over with a fresh shell. 0 disables the timeout.
+        powershell (bool): Whether to run PowerShell on a Windows host
+        instead of bash.
+
+    Returns:
+        Session: The session.
+    """
+    if not isinstance(remote_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'remote_connection',
+            type(remote_connection),
+            RemoteConnection)
+    if not isinstance(login, bool):
+        raise IncorrectArgumentTypeError('login', type(login), bool, False)
+    if not isinstance(idle_timeout, six.integer_types + (float,)):
+        raise IncorrectArgumentTypeError(
+            'idle_timeout', type(idle_timeout), int, False)
+    if not isinstance(powershell, bool):
+        raise IncorrectArgumentTypeError(
+            'powershell', type(powershell), bool, False)
+    return Session(remote_connection, login, idle_timeout, powershell)
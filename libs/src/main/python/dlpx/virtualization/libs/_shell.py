@@ -0,0 +1,156 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Helpers for composing remote scripts.
+
+Several library helpers are implemented by generating a single bash or
+PowerShell script, running it through one of the existing library operations
+and parsing the output back into structured results. The generated scripts
+write their results as "frames": a header line that starts with a random
+marker, followed by the frame body. This module holds the quoting and framing
+helpers shared by those library helpers.
+"""
+
+import base64
+import uuid
+
+#
+# Defines __dlpx_b64, which base64-encodes its standard input. Not every Unix
+# host ships the base64 utility, so fall back to openssl.
+#
+BASH_BASE64 = u"""\
+__dlpx_b64() {
+    if command -v base64 >/dev/null 2>&1; then base64; else openssl base64; fi
+}
+"""
+
+#
+# Defines __dlpx_unb64, which decodes base64 from its standard input, and
+# __dlpx_sha256, which prints the hex SHA-256 digest of its standard input.
+#
+BASH_UNBASE64_SHA256 = u"""\
+__dlpx_unb64() {
+    if base64 -d </dev/null >/dev/null 2>&1; then base64 -d
+    else openssl base64 -d; fi
+}
+__dlpx_sha256() {
+    if command -v sha256sum >/dev/null 2>&1; then sha256sum
+    elif command -v shasum >/dev/null 2>&1; then shasum -a 256
+    else openssl dgst -sha256 | sed 's/^.*= *//'; fi | cut -d' ' -f1
+}
+"""
+
+#
+# Defines __dlpx_list, which prints "<size> <mtime> <path>" followed by a NUL
+# for every regular file below the directory given as its argument. find
+# -printf is a GNU extension, so fall back to stat, whose options differ
+# between GNU and BSD.
+#
+BASH_LIST_FILES = u"""\
+__dlpx_list() {
+    if find /dev/null -maxdepth 0 -printf '' >/dev/null 2>&1; then
+        find "$1" -type f -printf '%s %T@ %p\\0'
+    else
+        find "$1" -type f -print0 | while IFS= read -r -d '' __dlpx_f; do
+            __dlpx_s=$(stat -c '%s %Y' "$__dlpx_f" 2>/dev/null) ||
+                __dlpx_s=$(stat -f '%z %m' "$__dlpx_f") || continue
+            printf '%s %s\\0' "$__dlpx_s" "$__dlpx_f"
+        done
+    fi
+}
+"""
+
+#
+# PowerShell treats the typographic single quotes as ordinary single quotes,
+# so they have to be escaped as well when quoting a literal string.
+#
+_PS_SINGLE_QUOTES = (u"'", u"‘", u"’", u"‚", u"‛")
+
+
+def quote_sh(value):
+    """Quotes a string so that a POSIX shell reads it as a single word."""
+    return u"'" + value.replace(u"'", u"'\\''") + u"'"
+
+
+def quote_ps(value):
+    """Quotes a string as a PowerShell single-quoted string literal."""
+    for quote in _PS_SINGLE_QUOTES:
+        value = value.replace(quote, quote + quote)
+    return u"'" + value + u"'"
+
+
+def bash_restore_environment(state):
+    """Returns bash code that restores exported variables captured with
+    "export -p". Variables that cannot be set, such as read-only ones, are
+    skipped silently."""
+    #
+    # The no-op keeps the group valid when nothing was exported.
+    #
+    return u'{{\n:\n{}}} 2>/dev/null\n'.format(state)
+
+
+def new_marker():
+    """Returns a marker that is unique enough not to appear in any output."""
+    return u'__DLPX_{}__'.format(uuid.uuid4().hex)
+
+
+def split_frames(output, marker):
+    """Splits the output of a generated script into frames.
+
+    Every frame starts with a line "<marker> <field> <field> ..." and is
+    followed by the frame body. The generated scripts terminate every body
+    with an extra newline so that the following header always starts on a
+    new line; that newline is not part of the returned body. Any output that
+    precedes the first frame (for example, a banner printed by a login shell)
+    is ignored.
+
+    Args:
+        output (str): The stdout of the generated script.
+        marker (str): The marker the script was generated with.
+
+    Returns:
+        list of (list of str, str): The header fields and body of each frame.
+    """
+    prefix = u'\n' + marker + u' '
+    output = u'\n' + output
+    frames = []
+    start = output.find(prefix)
+    while start != -1:
+        header_end = output.find(u'\n', start + 1)
+        if header_end == -1:
+            header_end = len(output)
+        header = output[start + len(prefix):header_end].split(u' ')
+        next_start = output.find(prefix, header_end)
+        if next_start == -1:
+            body = output[header_end + 1:]
+            if body.endswith(u'\n'):
+                body = body[:-1]
+        else:
+            body = output[header_end + 1:next_start]
+        frames.append((header, body))
+        start = next_start
+    return frames
+
+
+def split_entries(data, fields):
+    """Splits a base64 encoded list of NUL terminated entries, such as the
+    output of __dlpx_list, into their space separated fields. The last field
+    is a path and may contain spaces."""
+    text = base64.b64decode(data).decode('utf-8', 'surrogateescape')
+    return [entry.split(u' ', fields - 1)
+            for entry in text.split(u'\0') if entry]
+
+
+def relative_path(path, directory):
+    """Returns path relative to directory, or path itself if it is not below
+    directory."""
+    prefix = directory.rstrip(u'/') + u'/'
+    return path[len(prefix):] if path.startswith(prefix) else path
+
+
+def quote_tcl(value):
+    """Quotes a string as a Tcl double-quoted word."""
+    for special in (u'\\', u'"', u'$', u'[', u']'):
+        value = value.replace(special, u'\\' + special)
+    return u'"' + value + u'"'
@@ -0,0 +1,284 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Streaming output of remote bash commands.
+
+run_bash returns the whole stdout and stderr of a command in a single
+response, which is held in memory and is subject to the callback message size
+limit. run_bash_stream starts the command in the background on the remote
+host, spooling its output to the host's scratch path, and then reads the
+output back in bounded chunks with short follow-up run_bash calls while the
+command runs. The plugin only ever holds one chunk at a time.
+"""
+
+import base64
+import codecs
+import time
+
+import six
+
+from dlpx.virtualization.common._common_classes import RemoteConnection
+from dlpx.virtualization.common.util import to_str
+from dlpx.virtualization.libs import libs
+from dlpx.virtualization.libs._shell import (BASH_BASE64, new_marker, quote_sh,
+                                             split_frames)
+from dlpx.virtualization.libs.exceptions import (IncorrectArgumentTypeError,
+                                                 PluginScriptError)
+
+__all__ = [
+    "RunBashStream",
+    "run_bash_stream"
+]
+
+_START = u"""\
+__dlpx_d=$(mktemp -d {scratch}/dlpx-stream.XXXXXX) || exit 1
+: >"$__dlpx_d/out"
+(
+    trap '' HUP
+    (eval {command}) >"$__dlpx_d/out" 2>"$__dlpx_d/err" </dev/null &
+    echo $! >"$__dlpx_d/pid.tmp"
+    mv "$__dlpx_d/pid.tmp" "$__dlpx_d/pid"
+    wait $!
+    echo $? >"$__dlpx_d/rc.tmp"
+    mv "$__dlpx_d/rc.tmp" "$__dlpx_d/rc"
+) >/dev/null 2>&1 </dev/null &
+while [ ! -f "$__dlpx_d/pid" ]; do
+    sleep 0.1 2>/dev/null || sleep 1
+done
+printf '%s\\n' "$__dlpx_d"
+"""
+
+#
+# Reads the next chunk of stdout, waiting up to {wait} seconds for the
+# command to produce more output or to exit. Once the command has exited and
+# all of its output has been read, the tail of stderr is returned as well and
+# the spool directory is removed.
+#
+_POLL = u"""\
+__dlpx_d={directory}
+__dlpx_size() {{ wc -c <"$__dlpx_d/out" | tr -d ' '; }}
+__dlpx_i=0
+while [ ! -f "$__dlpx_d/rc" ] && [ "$(__dlpx_size)" -le {offset} ] &&
+        [ $__dlpx_i -lt {wait} ]; do
+    sleep 1
+    __dlpx_i=$((__dlpx_i + 1))
+done
+__dlpx_rc=-
+[ -f "$__dlpx_d/rc" ] && __dlpx_rc=$(cat "$__dlpx_d/rc")
+__dlpx_n=$(__dlpx_size)
+printf '%s %s %s\\n' {marker} "$__dlpx_n" "$__dlpx_rc"
+tail -c +{start} "$__dlpx_d/out" | head -c {length} | __dlpx_b64
+printf '\\n'
+if [ "$__dlpx_rc" != - ] && [ "$__dlpx_n" -le {end} ]; then
+    printf '%s stderr\\n' {marker}
+    tail -c {stderr_limit} "$__dlpx_d/err" | __dlpx_b64
+    printf '\\n'
+    rm -rf "$__dlpx_d"
+fi
+"""
+
+_KILL = u"""\
+__dlpx_d={directory}
+if [ -f "$__dlpx_d/pid" ]; then
+    __dlpx_p=$(cat "$__dlpx_d/pid")
+    pkill -TERM -P "$__dlpx_p" >/dev/null 2>&1
+    kill "$__dlpx_p" >/dev/null 2>&1
+    __dlpx_i=0
+    while [ ! -f "$__dlpx_d/rc" ] && [ $__dlpx_i -lt 50 ]; do
+        sleep 0.1 2>/dev/null || sleep 1
+        __dlpx_i=$((__dlpx_i + 1))
+    done
+fi
+rm -rf "$__dlpx_d"
+"""
+
+
+class RunBashStream(object):
+    """The output of a command started by run_bash_stream.
+
+    Iterating over the stream yields the stdout of the command as chunks of
+    bytes while the command runs. Once the iteration completes, exit_code and
+    stderr are available. A stream that is not read to the end should be
+    closed, which stops the remote command and removes its spooled output;
+    the stream can also be used as a context manager for that purpose.
+
+    Attributes:
+        exit_code (int): Exit code of the command, or None until the whole
+            stdout has been read.
+        stderr (str): The last stderr_limit bytes of stderr, or None until the
+            whole stdout has been read.
+        bytes_read (int): Number of bytes of stdout read so far.
+    """
+    def __init__(self, remote_connection, directory, chunk_size, wait,
+                 stderr_limit, poll_interval, check):
+        self.__remote_connection = remote_connection
+        self.__directory = directory
+        self.__chunk_size = chunk_size
+        self.__wait = wait
+        self.__stderr_limit = stderr_limit
+        self.__poll_interval = poll_interval
+        self.__check = check
+        self.__offset = 0
+        self.__finished = False
+        self.__exit_code = None
+        self.__stderr = None
+
+    @property
+    def exit_code(self):
+        return self.__exit_code
+
+    @property
+    def stderr(self):
+        return self.__stderr
+
+    @property
+    def bytes_read(self):
+        return self.__offset
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __iter__(self):
+        while not self.__finished:
+            chunk = self.__read_chunk()
+            if chunk:
+                yield chunk
+            elif not self.__finished and self.__poll_interval:
+                time.sleep(self.__poll_interval)
+
+    def iter_lines(self, encoding='utf-8'):
+        """Yields the stdout of the command line by line.
+
+        Lines are decoded with the given encoding and do not include the line
+        terminator.
+        """
+        decoder = codecs.getincrementaldecoder(encoding)()
+        pending = u''
+        for chunk in self:
+            pending += decoder.decode(chunk)
+            lines = pending.split(u'\n')
+            pending = lines.pop()
+            for line in lines:
+                yield line
+        pending += decoder.decode(b'', final=True)
+        if pending:
+            yield pending
+
+    def close(self):
+        """Stops the remote command if it is still running and removes its
+        spooled output."""
+        if self.__finished:
+            return
+        self.__finished = True
+        libs.run_bash(self.__remote_connection,
+                      _KILL.format(directory=quote_sh(self.__directory)))
+
+    def __read_chunk(self):
+        marker = new_marker()
+        command = BASH_BASE64 + _POLL.format(
+            directory=quote_sh(self.__directory),
+            marker=quote_sh(marker),
+            offset=self.__offset,
+            wait=self.__wait,
+            start=self.__offset + 1,
+            length=self.__chunk_size,
+            end=self.__offset + self.__chunk_size,
+            stderr_limit=self.__stderr_limit)
+        result = libs.run_bash(self.__remote_connection, command)
+        frames = split_frames(result.stdout, marker)
+        if not frames:
+            #
+            # The command may still be running, so the stream is left open
+            # for close() to stop it and remove its spooled output.
+            #
+            raise PluginScriptError('Failed to read the output of the command.'
+                                    ' stdout : {} and '
+                                    ' stderr : {}'.format(result.stdout,
+                                                          result.stderr))
+        (size, exit_code), body = frames[0]
+        chunk = base64.b64decode(body)
+        self.__offset += len(chunk)
+        if len(frames) > 1:
+            self.__finished = True
+            self.__exit_code = int(exit_code)
+            self.__stderr = base64.b64decode(frames[1][1]).decode(
+                'utf-8', 'replace')
+            if self.__check and self.__exit_code != 0:
+                raise PluginScriptError('The script failed with exit code {}.'
+                                        ' stdout : {} and '
+                                        ' stderr : {}'.format(
+                                              self.__exit_code,
+                                              '<streamed>',
+                                              self.__stderr))
+        return chunk
+
+
+def run_bash_stream(remote_connection, command, variables=None,
+                    use_login_shell=False, check=False, chunk_size=1048576,
+                    wait=5, stderr_limit=65536, poll_interval=None):
+    """Runs a bash command and streams its stdout back in chunks.
+
+    The command is started in the background on the remote host with its
+    output spooled to the host's scratch path. The returned stream reads the
+    output back in chunks of at most chunk_size bytes, so memory use is
+    bounded no matter how much output the command produces.
+
+    Args:
+        remote_connection (RemoteConnection): Connection to a remote
+        environment.
+        command (str): Bash command to run.
+        variables (dict of str:str): Environment variables to set before
+        running the command.
+        use_login_shell (bool): Whether to use login shell.
+        check (bool): if True and non-zero exitcode is received, raise
+        PluginScriptError once the whole stdout has been read.
+        chunk_size (int): Maximum number of bytes of stdout read per call.
+        wait (int): Maximum number of seconds a read waits on the remote host
+        for more output before returning an empty chunk.
+        stderr_limit (int): Maximum number of bytes of stderr kept, counted
+        from the end of stderr.
+        poll_interval (float): Seconds to sleep locally after a read that
+        returned no output. None sleeps for a second if wait is 0, so that
+        the reads do not run in a tight loop, and not at all otherwise.
+
+    Returns:
+        RunBashStream: The stream of the command's stdout.
+    """
+    command = to_str(command)
+
+    if not isinstance(remote_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'remote_connection',
+            type(remote_connection),
+            RemoteConnection)
+    if not isinstance(command, six.string_types):
+        raise IncorrectArgumentTypeError('command', type(command), six.string_types[0])
+    for name, value in (('chunk_size', chunk_size), ('wait', wait),
+                        ('stderr_limit', stderr_limit)):
+        if not isinstance(value, six.integer_types) or value < 0:
+            raise IncorrectArgumentTypeError(name, type(value), int, False)
+    if poll_interval is None:
+        poll_interval = 1 if wait == 0 else 0
+    elif (not isinstance(poll_interval, six.integer_types + (float,)) or
+            isinstance(poll_interval, bool) or poll_interval < 0):
+        raise IncorrectArgumentTypeError(
+            'poll_interval', type(poll_interval), float, False)
+
+    start = _START.format(
+        scratch=quote_sh(remote_connection.environment.host.scratch_path),
+        command=quote_sh(command))
+    result = libs.run_bash(remote_connection, start, variables=variables,
+                           use_login_shell=use_login_shell)
+    if result.exit_code != 0 or not result.stdout.strip():
+        raise PluginScriptError('Failed to start the command with exit code {}.'
+                                ' stdout : {} and '
+                                ' stderr : {}'.format(result.exit_code,
+                                                      result.stdout,
+                                                      result.stderr))
+    directory = result.stdout.strip().splitlines()[-1]
+    return RunBashStream(remote_connection, directory, max(chunk_size, 1),
+                         wait, stderr_limit, poll_interval, check)
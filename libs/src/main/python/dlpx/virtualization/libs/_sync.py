@@ -0,0 +1,286 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Concurrent, manifest based syncing of several directories.
+
+run_sync copies one directory per call and reports nothing about what it
+copied. run_sync_many first lists the files of all source directories with a
+single run_bash call, compares each directory against the manifest of the
+previous sync, and only runs run_sync for the directories that changed, a
+few at a time. It returns a manifest of what it found, which the plugin can
+persist, for example in its snapshot metadata, and pass to the next sync.
+
+Within a directory that did change, run_sync itself only transfers the files
+that differ, so a directory is the unit that is skipped or synced.
+"""
+
+import threading
+from concurrent import futures
+
+import six
+
+from dlpx.virtualization.common._common_classes import RemoteConnection
+from dlpx.virtualization.common.util import to_str
+from dlpx.virtualization.libs import libs
+from dlpx.virtualization.libs._shell import (BASH_BASE64, BASH_LIST_FILES,
+                                             BASH_UNBASE64_SHA256, new_marker,
+                                             quote_sh, relative_path,
+                                             split_entries, split_frames)
+from dlpx.virtualization.libs.exceptions import (IncorrectArgumentTypeError,
+                                                 PluginScriptError)
+
+__all__ = [
+    "SyncManifest",
+    "run_sync_many"
+]
+
+_MANIFEST_VERSION = 1
+
+_SCAN_PROLOGUE = u"""\
+__dlpx_hash() {{
+    find "$1" -type f -print0 | while IFS= read -r -d '' __dlpx_f; do
+        printf '%s %s\\0' "$(__dlpx_sha256 <"$__dlpx_f")" "$__dlpx_f"
+    done
+}}
+__dlpx_scan() {{
+    if [ ! -d "$2" ]; then
+        printf '%s missing %s\\n' {marker} "$1"
+        return
+    fi
+    printf '%s list %s\\n' {marker} "$1"
+    __dlpx_list "$2" | __dlpx_b64
+    printf '\\n'
+    if [ {checksum} = 1 ]; then
+        printf '%s hash %s\\n' {marker} "$1"
+        __dlpx_hash "$2" | __dlpx_b64
+        printf '\\n'
+    fi
+}}
+"""
+
+
+class SyncManifest(object):
+    """The files found in the source directories of a run_sync_many call.
+
+    Each file is recorded as a (path, size, mtime, sha256) tuple, where path
+    is relative to its source directory and sha256 is None unless checksums
+    were requested.
+
+    Args:
+        directories (dict of str:list of tuple): The files of each source
+            directory.
+        synced (list of str): Source directories that were synced.
+        skipped (list of str): Source directories that were unchanged since
+            the previous manifest and were not synced.
+    """
+    def __init__(self, directories, synced=None, skipped=None):
+        self.__directories = directories
+        self.__synced = synced or []
+        self.__skipped = skipped or []
+
+    @property
+    def directories(self):
+        return list(self.__directories)
+
+    @property
+    def synced(self):
+        return self.__synced
+
+    @property
+    def skipped(self):
+        return self.__skipped
+
+    def files(self, directory):
+        """Returns the (path, size, mtime, sha256) tuples of a directory."""
+        return self.__directories[directory]
+
+    def to_dict(self):
+        """Returns the manifest as a JSON serializable dict."""
+        return {
+            'version': _MANIFEST_VERSION,
+            'directories': {
+                directory: [list(entry) for entry in entries]
+                for directory, entries in self.__directories.items()}
+        }
+
+    @staticmethod
+    def from_dict(manifest):
+        """Creates a manifest from the output of to_dict()."""
+        if (not isinstance(manifest, dict) or
+                manifest.get('version') != _MANIFEST_VERSION):
+            raise ValueError('Unsupported sync manifest.')
+        return SyncManifest({
+            to_str(directory): [tuple(to_str(entry)) for entry in entries]
+            for directory, entries in manifest['directories'].items()})
+
+
+def _excluded(path, exclude_paths):
+    for exclude in exclude_paths:
+        exclude = exclude.strip(u'/')
+        if path == exclude or path.startswith(exclude + u'/'):
+            return True
+    return False
+
+
+def _scan(remote_connection, directories, exclude_paths, checksum):
+    """Lists the files of the source directories on the remote host.
+
+    Returns:
+        dict of str:list of tuple: The sorted (path, size, mtime, sha256)
+        tuples of each directory, or None for a directory that does not
+        exist.
+    """
+    marker = new_marker()
+    command = (BASH_BASE64 + BASH_UNBASE64_SHA256 + BASH_LIST_FILES +
+               _SCAN_PROLOGUE.format(marker=quote_sh(marker),
+                                     checksum=1 if checksum else 0) +
+               u''.join(u'__dlpx_scan {} {}\n'.format(index, quote_sh(directory))
+                        for index, directory in enumerate(directories)))
+    result = libs.run_bash(remote_connection, command, check=True)
+
+    listings = {}
+    hashes = {}
+    missing = set()
+    for header, body in split_frames(result.stdout, marker):
+        index = int(header[1])
+        if header[0] == 'missing':
+            missing.add(index)
+        elif header[0] == 'list':
+            listings[index] = split_entries(body, 3)
+        elif header[0] == 'hash':
+            hashes[index] = {path: digest
+                             for digest, path in split_entries(body, 2)}
+
+    scanned = {}
+    for index, directory in enumerate(directories):
+        if index in missing:
+            scanned[directory] = None
+            continue
+        if index not in listings:
+            raise PluginScriptError('Failed to list the files of {}.'
+                                    ' stdout : {} and '
+                                    ' stderr : {}'.format(directory,
+                                                          result.stdout,
+                                                          result.stderr))
+        entries = []
+        for size, mtime, path in listings[index]:
+            relative = relative_path(path, directory)
+            if _excluded(relative, exclude_paths):
+                continue
+            entries.append((relative, int(size), float(mtime),
+                            hashes.get(index, {}).get(path)))
+        scanned[directory] = sorted(entries)
+    return scanned
+
+
+def run_sync_many(remote_connection, source_directories, rsync_user=None,
+                  exclude_paths=None, sym_links_to_follow=None, max_workers=4,
+                  previous_manifest=None, checksum=False):
+    """Syncs several source directories concurrently.
+
+    The files of all source directories are listed with a single run_bash
+    call. Directories whose files have the same paths, sizes, modification
+    times and, if checksum is True, SHA-256 checksums as in previous_manifest
+    are skipped; the others are synced with run_sync, at most max_workers at
+    a time.
+
+    Args:
+        remote_connection (RemoteConnection): Connection to a remote
+        environment.
+        source_directories (list of str): Directories of files to be synced.
+        rsync_user (str): User who has access to the directories to be
+        synced.
+        exclude_paths (list of str): Paths to be excluded, relative to the
+        source directories.
+        sym_links_to_follow (list of str): Sym links to follow if any.
+        max_workers (int): Maximum number of directories synced at a time.
+        previous_manifest (SyncManifest or dict): The manifest returned by the
+        previous sync, or its to_dict() form. None syncs every directory.
+        checksum (bool): Whether to record a SHA-256 checksum of every file
+        and compare it as well. This reads every file on the remote host.
+
+    Returns:
+        SyncManifest: The files found in the source directories, and which
+        directories were synced or skipped.
+    """
+    if source_directories is not None:
+        source_directories = to_str(source_directories)
+    if exclude_paths is not None:
+        exclude_paths = to_str(exclude_paths)
+
+    if not isinstance(remote_connection, RemoteConnection):
+        raise IncorrectArgumentTypeError(
+            'remote_connection',
+            type(remote_connection),
+            RemoteConnection)
+    if (not isinstance(source_directories, list) or
+            not all(isinstance(directory, six.string_types)
+                    for directory in source_directories)):
+        raise IncorrectArgumentTypeError(
+            'source_directories',
+            type(source_directories),
+            [six.string_types[0]])
+    if exclude_paths and (not isinstance(exclude_paths, list) or
+                          not all(isinstance(path, six.string_types)
+                                  for path in exclude_paths)):
+        raise IncorrectArgumentTypeError(
+            'exclude_paths',
+            type(exclude_paths),
+            [six.string_types[0]],
+            False)
+    if (not isinstance(max_workers, six.integer_types) or
+            isinstance(max_workers, bool) or max_workers < 1):
+        raise IncorrectArgumentTypeError(
+            'max_workers', type(max_workers), int, False)
+    if isinstance(previous_manifest, dict):
+        previous_manifest = SyncManifest.from_dict(previous_manifest)
+    if (previous_manifest is not None and
+            not isinstance(previous_manifest, SyncManifest)):
+        raise IncorrectArgumentTypeError(
+            'previous_manifest', type(previous_manifest), SyncManifest, False)
+    if not isinstance(checksum, bool):
+        raise IncorrectArgumentTypeError('checksum', type(checksum), bool, False)
+
+    directories = list(dict.fromkeys(source_directories))
+    scanned = _scan(remote_connection, directories, exclude_paths or [],
+                    checksum)
+
+    synced = []
+    skipped = []
+    for directory in directories:
+        if (previous_manifest is not None and scanned[directory] is not None and
+                directory in previous_manifest.directories and
+                scanned[directory] == previous_manifest.files(directory)):
+            skipped.append(directory)
+        else:
+            synced.append(directory)
+
+    errors = {}
+    lock = threading.Lock()
+
+    def sync(index, directory):
+        with lock:
+            if errors:
+                return
+        try:
+            libs.run_sync(remote_connection, directory, rsync_user=rsync_user,
+                          exclude_paths=exclude_paths,
+                          sym_links_to_follow=sym_links_to_follow)
+        except BaseException as e:
+            with lock:
+                errors[index] = e
+
+    if synced:
+        with futures.ThreadPoolExecutor(
+                max_workers=min(max_workers, len(synced))) as executor:
+            for index, directory in enumerate(synced):
+                executor.submit(sync, index, directory)
+    if errors:
+        raise errors[min(errors)]
+
+    return SyncManifest(
+        {directory: entries for directory, entries in scanned.items()
+         if entries is not None},
+        synced,
+        skipped)
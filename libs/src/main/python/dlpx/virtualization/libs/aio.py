@@ -0,0 +1,99 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""asyncio versions of the Virtualization Libs API wrappers.
+
+The wrappers in dlpx.virtualization.libs block until the engine has completed
+the call. The coroutines in this module run those same wrappers, with the
+same argument validation and error handling, in the event loop's executor so
+that a plugin operation can overlap several calls, for example with
+asyncio.gather.
+
+Every coroutine accepts a timeout in seconds. When the timeout expires, or
+when the awaiting task is cancelled, the coroutine stops waiting and raises
+TimeoutError or CancelledError respectively. The engine call itself cannot be
+interrupted and runs to completion in the background.
+"""
+
+import asyncio
+import functools
+
+from dlpx.virtualization.libs import libs
+
+__all__ = [
+    "run_bash",
+    "run_sync",
+    "run_powershell",
+    "run_expect"
+]
+
+
+async def _run_in_executor(operation, timeout, *args, **kwargs):
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(
+        None, functools.partial(operation, *args, **kwargs))
+    return await asyncio.wait_for(future, timeout)
+
+
+async def run_bash(remote_connection, command, variables=None,
+                   use_login_shell=False, check=False, compress_output=False,
+                   stdin=None, timeout=None):
+    """Awaitable version of dlpx.virtualization.libs.run_bash.
+
+    Args:
+        timeout (float): Number of seconds to wait for the command, or None
+        to wait indefinitely.
+
+    See run_bash for the other arguments and the return value.
+    """
+    return await _run_in_executor(
+        libs.run_bash, timeout, remote_connection, command,
+        variables=variables, use_login_shell=use_login_shell, check=check,
+        compress_output=compress_output, stdin=stdin)
+
+
+async def run_sync(remote_connection, source_directory, rsync_user=None,
+                   exclude_paths=None, sym_links_to_follow=None, timeout=None):
+    """Awaitable version of dlpx.virtualization.libs.run_sync.
+
+    Args:
+        timeout (float): Number of seconds to wait for the sync, or None to
+        wait indefinitely.
+
+    See run_sync for the other arguments.
+    """
+    return await _run_in_executor(
+        libs.run_sync, timeout, remote_connection, source_directory,
+        rsync_user=rsync_user, exclude_paths=exclude_paths,
+        sym_links_to_follow=sym_links_to_follow)
+
+
+async def run_powershell(remote_connection, command, variables=None,
+                         check=False, compress_output=False, timeout=None):
+    """Awaitable version of dlpx.virtualization.libs.run_powershell.
+
+    Args:
+        timeout (float): Number of seconds to wait for the command, or None
+        to wait indefinitely.
+
+    See run_powershell for the other arguments and the return value.
+    """
+    return await _run_in_executor(
+        libs.run_powershell, timeout, remote_connection, command,
+        variables=variables, check=check, compress_output=compress_output)
+
+
+async def run_expect(remote_connection, command, variables=None, check=False,
+                     timeout=None):
+    """Awaitable version of dlpx.virtualization.libs.run_expect.
+
+    Args:
+        timeout (float): Number of seconds to wait for the command, or None
+        to wait indefinitely.
+
+    See run_expect for the other arguments and the return value.
+    """
+    return await _run_in_executor(
+        libs.run_expect, timeout, remote_connection, command,
+        variables=variables, check=check)
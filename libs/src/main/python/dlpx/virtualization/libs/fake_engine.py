@@ -0,0 +1,254 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""A local stand-in for the Delphix Engine side of the Virtualization Libs API.
+
+The wrappers in dlpx.virtualization.libs call into
+dlpx.virtualization._engine.libs, which only exists while a plugin runs on a
+Delphix Engine. FakeEngine implements the same operations locally so that
+plugin code, and the library itself, can be run and profiled on a
+workstation or a CI host:
+
+- run_bash, run_powershell and run_expect run the command in a local bash,
+  pwsh or expect process.
+- run_sync copies the source directory into a local directory, if one is
+  given.
+- log, retrieve_credentials and upgrade_password are implemented in memory.
+
+Every call can be slowed down by a fixed latency and a bandwidth limit, and
+made to fail with an actionable error at a given rate, to see how plugin
+code behaves on a slow or unreliable engine.
+
+Example:
+    from dlpx.virtualization.libs import fake_engine
+
+    with fake_engine.FakeEngine(latency=0.05, bandwidth=10 * 1024 * 1024):
+        plugin_operation(...)
+"""
+
+import os
+import random
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import types
+
+from dlpx.virtualization.api import libs_pb2
+from google.protobuf import json_format
+from google.protobuf.struct_pb2 import Struct
+
+__all__ = [
+    "FakeEngine"
+]
+
+_PACKAGE = 'dlpx.virtualization._engine'
+_MODULE = _PACKAGE + '.libs'
+
+_OPERATIONS = ('run_bash', 'run_sync', 'run_powershell', 'run_expect', 'log',
+               'retrieve_credentials', 'upgrade_password')
+
+
+class FakeEngine(object):
+    """A local implementation of the engine's Virtualization Libs operations.
+
+    The engine is used by installing it as dlpx.virtualization._engine.libs,
+    with install() and uninstall() or by using it as a context manager.
+
+    Args:
+        latency (float): Number of seconds added to every call.
+        bandwidth (int): Number of bytes per second at which requests and
+            responses are transferred; the transfer time is added to every
+            call. None does not limit the transfer.
+        failures (dict of str:float): Probability, between 0 and 1, with
+            which a call to each operation fails with an actionable error
+            instead of running, keyed by the name of the operation, for
+            example 'run_bash'.
+        sync_directory (str): Local directory that run_sync copies source
+            directories into. When None, run_sync only checks that the
+            source directory exists.
+        credentials (callable): Function that returns the credentials for a
+            credentials supplier, as a dict with the keys username and
+            password, or username, private_key and public_key. By default
+            the credentials are taken from the supplier itself.
+        seed (int): Seed of the random number generator that decides which
+            calls fail.
+
+    Attributes:
+        calls (list of (str, Message)): The operation and request of every
+            call, in order.
+        logs (list of (int, str)): The level and message of every log call.
+    """
+    def __init__(self, latency=0, bandwidth=None, failures=None,
+                 sync_directory=None, credentials=None, seed=None):
+        unknown = set(failures or {}) - set(_OPERATIONS)
+        if unknown:
+            raise ValueError('Unknown operations: {}'.format(
+                ', '.join(sorted(unknown))))
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.failures = dict(failures or {})
+        self.sync_directory = sync_directory
+        self.credentials = credentials
+        self.calls = []
+        self.logs = []
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__saved = None
+
+    def install(self):
+        """Installs the engine as dlpx.virtualization._engine.libs, in place
+        of whatever module was installed before."""
+        if self.__saved is not None:
+            raise RuntimeError('The fake engine is already installed.')
+        package = sys.modules.get(_PACKAGE)
+        created = package is None
+        if created:
+            package = types.ModuleType(_PACKAGE)
+            package.__path__ = []
+            sys.modules[_PACKAGE] = package
+        self.__saved = (created, sys.modules.get(_MODULE),
+                        getattr(package, 'libs', None))
+        sys.modules[_MODULE] = self
+        package.libs = self
+
+    def uninstall(self):
+        """Restores the module that was installed before install()."""
+        if self.__saved is None:
+            return
+        created, module, attribute = self.__saved
+        self.__saved = None
+        if created:
+            sys.modules.pop(_PACKAGE, None)
+            sys.modules.pop(_MODULE, None)
+            return
+        if module is None:
+            sys.modules.pop(_MODULE, None)
+        else:
+            sys.modules[_MODULE] = module
+        package = sys.modules[_PACKAGE]
+        if attribute is None:
+            del package.libs
+        else:
+            package.libs = attribute
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.uninstall()
+
+    def __call(self, operation, request, response_class, handler):
+        with self.__lock:
+            self.calls.append((operation, request))
+            failed = self.__random.random() < self.failures.get(operation, 0)
+
+        response = response_class()
+        error = ('Injected failure of {}.'.format(operation) if failed else
+                 handler(request, response.return_value))
+        if error is not None:
+            response.ClearField('return_value')
+            response.error.actionable_error.id = 1
+            response.error.actionable_error.message = error
+
+        delay = self.latency
+        if self.bandwidth:
+            delay += ((request.ByteSize() + response.ByteSize()) /
+                      float(self.bandwidth))
+        if delay > 0:
+            time.sleep(delay)
+        return response
+
+    @staticmethod
+    def __execute(args, request, result):
+        env = dict(os.environ)
+        env.update(request.variables)
+        try:
+            process = subprocess.run(args, env=env, capture_output=True)
+        except OSError as e:
+            result.exit_code = 127
+            result.stderr = '{}: {}\n'.format(args[0], e.strerror)
+            return
+        result.exit_code = process.returncode
+        result.stdout = process.stdout.decode('utf-8', 'replace')
+        result.stderr = process.stderr.decode('utf-8', 'replace')
+
+    def run_bash(self, request):
+        shell = ['bash', '-l'] if request.use_login_shell else ['bash']
+        return self.__call(
+            'run_bash', request, libs_pb2.RunBashResponse,
+            lambda request, result: self.__execute(
+                shell + ['-c', request.command], request, result))
+
+    def run_powershell(self, request):
+        return self.__call(
+            'run_powershell', request, libs_pb2.RunPowerShellResponse,
+            lambda request, result: self.__execute(
+                ['pwsh', '-NoProfile', '-NonInteractive', '-Command',
+                 request.command], request, result))
+
+    def run_expect(self, request):
+        return self.__call(
+            'run_expect', request, libs_pb2.RunExpectResponse,
+            lambda request, result: self.__execute(
+                ['expect', '-c', request.command], request, result))
+
+    def run_sync(self, request):
+        def handler(request, result):
+            source = request.source_directory
+            if not os.path.isdir(source):
+                return '{} is not a directory.'.format(source)
+            if self.sync_directory is None:
+                return None
+            excluded = set(
+                os.path.normpath(os.path.join(source, path.lstrip('/')))
+                for path in request.exclude_paths)
+            try:
+                shutil.copytree(
+                    source,
+                    os.path.join(self.sync_directory,
+                                 os.path.basename(os.path.normpath(source))),
+                    symlinks=True,
+                    dirs_exist_ok=True,
+                    ignore=lambda directory, names: [
+                        name for name in names
+                        if os.path.normpath(os.path.join(directory, name))
+                        in excluded])
+            except (OSError, shutil.Error) as e:
+                return 'Failed to sync {}: {}'.format(source, e)
+            return None
+        return self.__call('run_sync', request, libs_pb2.RunSyncResponse,
+                           handler)
+
+    def log(self, request):
+        def handler(request, result):
+            with self.__lock:
+                self.logs.append((request.level, request.message))
+        return self.__call('log', request, libs_pb2.LogResponse, handler)
+
+    def retrieve_credentials(self, request):
+        def handler(request, result):
+            supplier = json_format.MessageToDict(request.credentials_supplier)
+            credentials = (supplier if self.credentials is None
+                           else self.credentials(supplier))
+            result.username = credentials.get('username', '')
+            if 'private_key' in credentials:
+                result.key_pair.private_key = credentials['private_key']
+                result.key_pair.public_key = credentials.get('public_key', '')
+            else:
+                result.password = credentials.get('password', '')
+        return self.__call('retrieve_credentials', request,
+                           libs_pb2.CredentialsResponse, handler)
+
+    def upgrade_password(self, request):
+        def handler(request, result):
+            supplier = Struct()
+            supplier.update({'password': request.password})
+            if request.username:
+                supplier.update({'username': request.username})
+            result.credentials_supplier.CopyFrom(supplier)
+        return self.__call('upgrade_password', request,
+                           libs_pb2.UpgradePasswordResponse, handler)
@@ -24,9 +24,14 @@ of a lib operation.
 
 """
 
+import functools
 import sys
 
 from dlpx.virtualization.api import libs_pb2
+from dlpx.virtualization.libs import (_compress, _credentials_cache,
+                                      _login_env, metrics)
+from dlpx.virtualization.libs._result import CommandResult
+from dlpx.virtualization.libs._shell import new_marker
 from dlpx.virtualization.libs.exceptions import (IncorrectArgumentTypeError,
                                                  LibraryError,
                                                  PluginScriptError)
@@ -75,29 +80,42 @@ def _handle_response(response):
     return response.return_value
 
 
-def _check_exit_code(response, check):
+def _check_exit_code(result, check):
     """
-    This functions checks the exitcode received in response and throws
+    This functions checks the exitcode of a command result and throws
     PluginScriptError if check is True.
 
     Args:
-    response (RunPowerShellResponse or RunBashResponse or RunExpectResponse): Response
-        received by run_bash or run_powershell or run_expect
+    result (CommandResult): Result of run_bash or run_powershell or run_expect
     check (bool): if True and non-zero exitcode is received in response, raise
         PluginScriptError
     """
-    if (check and response.HasField('return_value')
-            and response.return_value.exit_code != 0):
+    if check and result.exit_code != 0:
         raise PluginScriptError('The script failed with exit code {}.'
                                 ' stdout : {} and '
                                 ' stderr : {}'.format(
-                                      response.return_value.exit_code,
-                                      response.return_value.stdout,
-                                      response.return_value.stderr))
+                                      result.exit_code,
+                                      result.stdout,
+                                      result.stderr))
+
+
+def _command_result(response, check, unwrap=()):
+    """
+    Unpacks the response of run_bash, run_powershell or run_expect into a
+    CommandResult. The output is left undecoded until it is used. For a
+    command that was wrapped in a generated script, unwrap holds the
+    functions that turn the result of the script into the result of the
+    command, in the order to apply them.
+    """
+    result = CommandResult.from_proto(_handle_response(response))
+    for function in unwrap:
+        result = function(result)
+    _check_exit_code(result, check)
+    return result
 
 
 def run_bash(remote_connection, command, variables=None, use_login_shell=False,
-             check=False):
+             check=False, compress_output=False, stdin=None):
     """run_bash operation wrapper.
 
     The run_bash function executes a shell command or script on a remote Unix
@@ -117,17 +135,32 @@ def run_bash(remote_connection, command, variables=None, use_login_shell=False,
         command (str): Bash command to run.
         variables (dict of str:str): Environment variables to set before
         running the command.
-        use_login_shell (bool): Whether to use login shell.
+        use_login_shell (bool): Whether to use login shell. Once
+        enable_login_environment_cache has been called, only the first login
+        shell call for a remote connection runs in a login shell, and later
+        ones restore the environment it set up in a plain shell.
         check (bool): if True and non-zero exitcode is received, raise PluginScriptError
+        compress_output (bool): Whether to gzip the output of the command on
+        the remote host before it is sent back. The output is decompressed
+        transparently.
+        stdin (bytes or str or file-like object or iterable of bytes): Input
+        for the command. It is uploaded in chunks to a temporary file in the
+        scratch path of the host, which the command reads as its standard
+        input and which is removed afterwards.
 
     Returns:
-        RunBashResponse: The return value of run_bash operation.
+        CommandResult: The exit code and output of the command.
     """
     #
     # Since this import only resolves at runtime, we keep it in the function
     # scope to allow unit testing of this module.
     #
     from dlpx.virtualization._engine import libs as internal_libs
+    #
+    # _files is built on top of run_bash, so it can only be imported once
+    # this module has been loaded.
+    #
+    from dlpx.virtualization.libs import _files
 
     if variables is None:
         variables = {}
@@ -161,18 +194,55 @@ def run_bash(remote_connection, command, variables=None, use_login_shell=False,
     if use_login_shell and not isinstance(use_login_shell, bool):
         raise IncorrectArgumentTypeError(
             'use_login_shell', type(use_login_shell), bool, False)
+    if not isinstance(compress_output, bool):
+        raise IncorrectArgumentTypeError(
+            'compress_output', type(compress_output), bool, False)
+    if (stdin is not None and
+            not isinstance(stdin, (six.string_types, bytes, bytearray,
+                                   memoryview)) and
+            not hasattr(stdin, 'read') and not hasattr(stdin, '__iter__')):
+        raise IncorrectArgumentTypeError('stdin', type(stdin), bytes, False)
+
+    stdin_path = None
+    if stdin is not None:
+        stdin_path = _files.upload_stdin(remote_connection, stdin)
+        command = _files.stdin_command(command, stdin_path)
+
+    unwrap = []
+    if compress_output:
+        marker = new_marker()
+        command = _compress.bash_command(
+            command, marker, remote_connection.environment.host.scratch_path)
+        unwrap.append(functools.partial(_compress.decompress, marker=marker))
+    if use_login_shell and _login_env.enabled():
+        command, use_login_shell, marker = _login_env.wrap(
+            remote_connection, command, variables)
+        if marker is not None:
+            unwrap.insert(0, functools.partial(
+                _login_env.capture, remote_connection, marker))
 
     run_bash_request = libs_pb2.RunBashRequest()
-    run_bash_request.remote_connection.CopyFrom(remote_connection.to_proto())
+    run_bash_request.remote_connection.CopyFrom(remote_connection._proto())
     run_bash_request.command = command
     run_bash_request.use_login_shell = use_login_shell
     for variable, value in variables.items():
         run_bash_request.variables[variable] = value
 
-    run_bash_response = internal_libs.run_bash(run_bash_request)
-    response_to_str(run_bash_response)
-    _check_exit_code(run_bash_response, check)
-    return _handle_response(run_bash_response)
+    try:
+        run_bash_response = metrics._call(
+            'run_bash', remote_connection, internal_libs.run_bash,
+            run_bash_request)
+    except Exception:
+        if stdin_path is not None:
+            _files.remove_stdin(remote_connection, stdin_path)
+        raise
+    #
+    # An error response means the command never ran, so nothing removed the
+    # uploaded input, which may hold secrets.
+    #
+    if stdin_path is not None and run_bash_response.HasField('error'):
+        _files.remove_stdin(remote_connection, stdin_path)
+    return _command_result(run_bash_response, check, unwrap)
 
 
 def run_sync(remote_connection, source_directory, rsync_user=None,
@@ -249,7 +319,7 @@ def run_sync(remote_connection, source_directory, rsync_user=None,
             False)
 
     run_sync_request = libs_pb2.RunSyncRequest()
-    run_sync_request.remote_connection.CopyFrom(remote_connection.to_proto())
+    run_sync_request.remote_connection.CopyFrom(remote_connection._proto())
     run_sync_request.source_directory = source_directory
     if rsync_user is not None:
         run_sync_request.rsync_user = rsync_user
@@ -258,12 +328,14 @@ def run_sync(remote_connection, source_directory, rsync_user=None,
     if sym_links_to_follow is not None:
         run_sync_request.sym_links_to_follow.extend(sym_links_to_follow)
 
-    response = internal_libs.run_sync(run_sync_request)
+    response = metrics._call('run_sync', remote_connection,
+                             internal_libs.run_sync, run_sync_request)
     response_to_str(response)
     _handle_response(response)
 
 
-def run_powershell(remote_connection, command, variables=None, check=False):
+def run_powershell(remote_connection, command, variables=None, check=False,
+                   compress_output=False):
     """run_powershell operation wrapper.
 
     The run_powershell function executes a powershell command or script on a
@@ -284,9 +356,14 @@ def run_powershell(remote_connection, command, variables=None, check=False):
         variables (dict): Environment variables to set before running the
         command.
         check (bool): if True and non-zero exitcode is received, raise PluginScriptError
+        compress_output (bool): Whether to gzip the output of the script on
+        the remote host before it is sent back. The output is decompressed
+        transparently, but every object the script outputs is rendered with
+        Out-String on a line of its own, so line breaks and trailing
+        whitespace can differ from the output without compression.
 
     Returns:
-        RunPowerShellResponse: The return value of run_powershell operation.
+        CommandResult: The exit code and output of the command.
     """
     #
     # Since this import only resolves at runtime, we keep it in the function
@@ -324,17 +401,25 @@ def run_powershell(remote_connection, command, variables=None, check=False):
              for variable, value in variables.items()},
             {six.string_types[0]: six.string_types[0]},
             False)
+    if not isinstance(compress_output, bool):
+        raise IncorrectArgumentTypeError(
+            'compress_output', type(compress_output), bool, False)
+
+    unwrap = []
+    if compress_output:
+        marker = new_marker()
+        command = _compress.powershell_command(command, marker)
+        unwrap.append(functools.partial(_compress.decompress, marker=marker))
 
     run_powershell_request = libs_pb2.RunPowerShellRequest()
-    run_powershell_request.remote_connection.CopyFrom(remote_connection.to_proto())
+    run_powershell_request.remote_connection.CopyFrom(remote_connection._proto())
     run_powershell_request.command = command
     for variable, value in variables.items():
         run_powershell_request.variables[variable] = value
-    run_powershell_response = internal_libs.run_powershell(
+    run_powershell_response = metrics._call(
+        'run_powershell', remote_connection, internal_libs.run_powershell,
         run_powershell_request)
-    response_to_str(run_powershell_response)
-    _check_exit_code(run_powershell_response, check)
-    return _handle_response(run_powershell_response)
+    return _command_result(run_powershell_response, check, unwrap)
 
 
 def run_expect(remote_connection, command, variables=None, check=False):
@@ -394,15 +479,15 @@ def run_expect(remote_connection, command, variables=None, check=False):
             False)
 
     run_expect_request = libs_pb2.RunExpectRequest()
-    run_expect_request.remote_connection.CopyFrom(remote_connection.to_proto())
+    run_expect_request.remote_connection.CopyFrom(remote_connection._proto())
     run_expect_request.command = command
     for variable, value in variables.items():
         run_expect_request.variables[variable] = value
 
-    run_expect_response = internal_libs.run_expect(run_expect_request)
-    response_to_str(run_expect_response)
-    _check_exit_code(run_expect_response, check)
-    return _handle_response(run_expect_response)
+    run_expect_response = metrics._call(
+        'run_expect', remote_connection, internal_libs.run_expect,
+        run_expect_request)
+    return _command_result(run_expect_response, check)
 
 
 def _log_request(message, log_level):
@@ -437,7 +522,7 @@ def _log_request(message, log_level):
     else:
         log_request.level = libs_pb2.LogRequest.ERROR
 
-    response = internal_libs.log(log_request)
+    response = metrics._call('log', None, internal_libs.log, log_request)
     response_to_str(response)
     _handle_response(response)
 
@@ -448,6 +533,10 @@ def retrieve_credentials(credentials_supplier):
     retrieval API. Given a supplier provided by Virtualization, retrieves the
     credentials from that supplier.
 
+    When the credentials cache has been enabled with enable_credentials_cache,
+    credentials retrieved earlier from an equal supplier are returned without
+    calling the engine while they are still valid.
+
     Args:
         credentials_supplier (dict): Properties that make up a supplier of credentials.
     Return:
@@ -460,12 +549,18 @@ def retrieve_credentials(credentials_supplier):
         raise IncorrectArgumentTypeError(
             'credentials_supplier', type(credentials_supplier), dict)
 
+    credentials = _credentials_cache._get(credentials_supplier)
+    if credentials is not None:
+        return credentials
+
     credentials_request = libs_pb2.CredentialsRequest()
     credentials_struct = Struct()
     credentials_struct.update(credentials_supplier)
     credentials_request.credentials_supplier.CopyFrom(credentials_struct)
 
-    response = internal_libs.retrieve_credentials(credentials_request)
+    response = metrics._call('retrieve_credentials', None,
+                             internal_libs.retrieve_credentials,
+                             credentials_request)
     response_to_str(response)
     credentials_result = _handle_response(response)
     #
@@ -479,12 +574,15 @@ def retrieve_credentials(credentials_supplier):
         not credentials_result.key_pair.private_key and
         not credentials_result.key_pair.public_key
     ):
-        return PasswordCredentials(
+        credentials = PasswordCredentials(
             credentials_result.username, credentials_result.password)
-    return KeyPairCredentials(
-        credentials_result.username,
-        credentials_result.key_pair.private_key,
-        credentials_result.key_pair.public_key)
+    else:
+        credentials = KeyPairCredentials(
+            credentials_result.username,
+            credentials_result.key_pair.private_key,
+            credentials_result.key_pair.public_key)
+    _credentials_cache._put(credentials_supplier, credentials)
+    return credentials
 
 
 def upgrade_password(password, username=None):
@@ -514,7 +612,9 @@ def upgrade_password(password, username=None):
     if username:
         upgrade_password_request.username = username
 
-    response = internal_libs.upgrade_password(upgrade_password_request)
+    response = metrics._call('upgrade_password', None,
+                             internal_libs.upgrade_password,
+                             upgrade_password_request)
     response_to_str(response)
     upgrade_password_result = _handle_response(response)
     return json_format.MessageToDict(upgrade_password_result.credentials_supplier)
@@ -0,0 +1,212 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Instrumentation of the Virtualization Libs API wrappers.
+
+Once enabled with enable(), every call a wrapper makes to the engine is
+recorded in an in-process registry: its latency, the size of the request and
+the response, whether it failed and, for remote commands, the exit code.
+Calls are aggregated by operation and by the reference of the host they ran
+on, and snapshot() returns the aggregates. Recording is off by default and
+costs a single flag check per call while it is off.
+
+A plugin operation decorated with summarized logs a summary of the calls it
+made through the platform logger when it returns.
+"""
+
+import functools
+import logging
+import threading
+import time
+
+__all__ = [
+    "enable",
+    "disable",
+    "reset",
+    "snapshot",
+    "summarized"
+]
+
+_lock = threading.Lock()
+_enabled = False
+_stats = {}
+
+
+class _Stats(object):
+    __slots__ = ('count', 'errors', 'seconds', 'max_seconds', 'request_bytes',
+                 'response_bytes', 'exit_codes')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.exit_codes = {}
+
+
+def _call(operation, remote_connection, function, request):
+    """Calls an engine operation, recording the call if metrics are enabled.
+
+    Args:
+        operation (str): Name of the operation, for example 'run_bash'.
+        remote_connection (RemoteConnection): Connection the operation runs
+            on, or None for operations that do not run on a host.
+        function: The engine operation.
+        request: The request message to pass to it.
+
+    Returns:
+        The response message of the engine operation.
+    """
+    if not _enabled:
+        return function(request)
+
+    response = None
+    start = time.perf_counter()
+    try:
+        response = function(request)
+        return response
+    finally:
+        _record(operation,
+                None if remote_connection is None else
+                remote_connection.environment.host.reference,
+                time.perf_counter() - start,
+                request,
+                response)
+
+
+def _record(operation, host, seconds, request, response):
+    failed = response is None or response.HasField('error')
+    exit_code = None
+    if not failed:
+        exit_code = getattr(response.return_value, 'exit_code', None)
+    request_bytes = request.ByteSize()
+    response_bytes = 0 if response is None else response.ByteSize()
+
+    with _lock:
+        stats = _stats.get((operation, host))
+        if stats is None:
+            stats = _stats[(operation, host)] = _Stats()
+        stats.count += 1
+        stats.errors += failed
+        stats.seconds += seconds
+        stats.max_seconds = max(stats.max_seconds, seconds)
+        stats.request_bytes += request_bytes
+        stats.response_bytes += response_bytes
+        if exit_code is not None:
+            stats.exit_codes[exit_code] = stats.exit_codes.get(exit_code, 0) + 1
+
+
+def enable():
+    """Starts recording the calls the wrappers make to the engine."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stops recording calls. The calls recorded so far are kept until
+    reset() is called."""
+    global _enabled
+    _enabled = False
+
+
+def reset():
+    """Drops all recorded calls."""
+    with _lock:
+        _stats.clear()
+
+
+def snapshot():
+    """Returns the calls recorded so far.
+
+    Returns:
+        list of dict: One entry per operation and host, ordered by operation
+        and host, with the keys operation, host (the host reference, or None
+        for operations that do not run on a host), count, errors, seconds,
+        max_seconds, request_bytes, response_bytes and exit_codes (a dict of
+        the number of calls by exit code).
+    """
+    with _lock:
+        entries = [dict(operation=operation,
+                        host=host,
+                        count=stats.count,
+                        errors=stats.errors,
+                        seconds=stats.seconds,
+                        max_seconds=stats.max_seconds,
+                        request_bytes=stats.request_bytes,
+                        response_bytes=stats.response_bytes,
+                        exit_codes=dict(stats.exit_codes))
+                   for (operation, host), stats in _stats.items()]
+    return sorted(entries,
+                  key=lambda entry: (entry['operation'], entry['host'] or ''))
+
+
+def _difference(before, after):
+    """Returns the entries of snapshot after minus those of snapshot before,
+    leaving out the ones without new calls."""
+    previous = {(entry['operation'], entry['host']): entry for entry in before}
+    entries = []
+    for entry in after:
+        old = previous.get((entry['operation'], entry['host']))
+        if old is not None:
+            if entry['count'] == old['count']:
+                continue
+            entry = dict(entry)
+            for key in ('count', 'errors', 'seconds', 'request_bytes',
+                        'response_bytes'):
+                entry[key] -= old[key]
+            entry['exit_codes'] = {
+                code: count - old['exit_codes'].get(code, 0)
+                for code, count in entry['exit_codes'].items()
+                if count != old['exit_codes'].get(code, 0)}
+        entries.append(entry)
+    return entries
+
+
+def _summary(entries):
+    lines = ['Virtualization Libs calls:']
+    for entry in entries:
+        name = entry['operation']
+        if entry['host'] is not None:
+            name = '{} on host {}'.format(name, entry['host'])
+        lines.append(
+            '{}: {} calls, {} failed, {:.3f}s, {} bytes sent,'
+            ' {} bytes received{}'.format(
+                name,
+                entry['count'],
+                entry['errors'],
+                entry['seconds'],
+                entry['request_bytes'],
+                entry['response_bytes'],
+                ', exit codes {}'.format(entry['exit_codes'])
+                if entry['exit_codes'] else ''))
+    return '\n'.join(lines)
+
+
+def summarized(operation):
+    """Decorator for a plugin operation that logs a summary of the calls the
+    operation made to the engine through the platform logger, at INFO level,
+    when it returns or raises. Nothing is logged while metrics are disabled.
+
+    Example:
+        @plugin.linked.pre_snapshot()
+        @metrics.summarized
+        def linked_pre_snapshot(staged_source, repository, source_config,
+                                optional_snapshot_parameters):
+            ...
+    """
+    @functools.wraps(operation)
+    def wrapper(*args, **kwargs):
+        if not _enabled:
+            return operation(*args, **kwargs)
+        before = snapshot()
+        try:
+            return operation(*args, **kwargs)
+        finally:
+            entries = _difference(before, snapshot())
+            if entries:
+                from dlpx.virtualization.libs import libs
+                libs._log_request(_summary(entries), logging.INFO)
+    return wrapper
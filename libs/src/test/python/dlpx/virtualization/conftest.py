@@ -2,7 +2,11 @@
 # Copyright (c) 2019, 2021 by Delphix. All rights reserved.
 #
 
+import os
+import subprocess
+
 import pytest
+from dlpx.virtualization.api import libs_pb2
 from dlpx.virtualization.common._common_classes import (
     RemoteUser, RemoteHost, RemoteEnvironment, RemoteConnection)
 
@@ -27,3 +31,33 @@ def remote_environment(remote_host):
 @pytest.fixture
 def remote_connection(remote_environment, remote_user):
     return RemoteConnection(remote_environment, remote_user)
+
+
+@pytest.fixture
+def local_remote_connection(tmp_path, remote_user):
+    host = RemoteHost("host", "host-reference", "binary_path", str(tmp_path))
+    environment = RemoteEnvironment("environment",
+                                    "environment-reference",
+                                    host)
+    return RemoteConnection(environment, remote_user)
+
+
+@pytest.fixture
+def local_run_bash():
+    """
+    Returns a replacement for the engine's run_bash that runs the command with
+    the local bash, for testing library helpers that generate scripts.
+    """
+    def run_bash(run_bash_request):
+        env = dict(os.environ)
+        env.update(run_bash_request.variables)
+        args = ['bash', '-l', '-c'] if run_bash_request.use_login_shell else [
+            'bash', '-c']
+        process = subprocess.run(args + [run_bash_request.command],
+                                 env=env, capture_output=True)
+        response = libs_pb2.RunBashResponse()
+        response.return_value.exit_code = process.returncode
+        response.return_value.stdout = process.stdout.decode('utf-8')
+        response.return_value.stderr = process.stderr.decode('utf-8')
+        return response
+    return run_bash
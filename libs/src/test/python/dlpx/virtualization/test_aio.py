@@ -0,0 +1,105 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import asyncio
+import threading
+import time
+
+import mock
+import pytest
+
+from dlpx.virtualization.api import libs_pb2
+from dlpx.virtualization.libs import aio
+from dlpx.virtualization.libs.exceptions import (
+    IncorrectArgumentTypeError, LibraryError, PluginScriptError)
+
+
+def _bash_response(stdout, exit_code=0):
+    response = libs_pb2.RunBashResponse()
+    response.return_value.exit_code = exit_code
+    response.return_value.stdout = stdout
+    return response
+
+
+class TestLibsAio:
+    @staticmethod
+    def test_run_bash_gather(remote_connection):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def mock_run_bash(request):
+            # Only returns once all three calls are in flight at once.
+            barrier.wait()
+            return _bash_response(request.command)
+
+        async def main():
+            return await asyncio.gather(
+                *[aio.run_bash(remote_connection, 'cmd{}'.format(i))
+                  for i in range(3)])
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=mock_run_bash, create=True):
+            results = asyncio.run(main())
+
+        assert [r.stdout for r in results] == ['cmd0', 'cmd1', 'cmd2']
+
+    @staticmethod
+    def test_run_bash_timeout(remote_connection):
+        def mock_run_bash(request):
+            time.sleep(0.5)
+            return _bash_response('late')
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=mock_run_bash, create=True):
+            with pytest.raises(asyncio.TimeoutError):
+                asyncio.run(aio.run_bash(remote_connection, 'cmd',
+                                         timeout=0.01))
+
+    @staticmethod
+    def test_run_bash_check(remote_connection):
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        return_value=_bash_response('out', 2), create=True):
+            with pytest.raises(PluginScriptError):
+                asyncio.run(aio.run_bash(remote_connection, 'cmd', check=True))
+
+    @staticmethod
+    def test_run_bash_validation(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            asyncio.run(aio.run_bash(remote_connection, 10))
+
+        assert err_info.value.message == (
+            "The function run_bash's argument 'command' was"
+            " class 'int' but should be of class 'str'.")
+
+    @staticmethod
+    def test_run_sync_with_actionable_error(remote_connection):
+        response = libs_pb2.RunSyncResponse()
+        response.error.actionable_error.id = 15
+        response.error.actionable_error.message = 'Some message'
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_sync',
+                        return_value=response, create=True):
+            with pytest.raises(LibraryError) as err_info:
+                asyncio.run(aio.run_sync(remote_connection, 'dir'))
+
+        assert err_info.value.message == 'Some message'
+
+    @staticmethod
+    def test_run_powershell_and_expect(remote_connection):
+        powershell_response = libs_pb2.RunPowerShellResponse()
+        powershell_response.return_value.stdout = 'powershell'
+        expect_response = libs_pb2.RunExpectResponse()
+        expect_response.return_value.stdout = 'expect'
+
+        async def main():
+            return await asyncio.gather(
+                aio.run_powershell(remote_connection, 'cmd'),
+                aio.run_expect(remote_connection, 'cmd'))
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_powershell',
+                        return_value=powershell_response, create=True):
+            with mock.patch('dlpx.virtualization._engine.libs.run_expect',
+                            return_value=expect_response, create=True):
+                results = asyncio.run(main())
+
+        assert [r.stdout for r in results] == ['powershell', 'expect']
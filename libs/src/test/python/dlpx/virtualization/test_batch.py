@@ -0,0 +1,156 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import mock
+import pytest
+
+from dlpx.virtualization.api import libs_pb2
+from dlpx.virtualization import libs
+from dlpx.virtualization.libs.exceptions import (
+    IncorrectArgumentTypeError, LibraryError, PluginScriptError)
+
+
+class TestLibsRunBashBatch:
+    @staticmethod
+    def test_run_bash_batch(local_remote_connection, local_run_bash):
+        items = [
+            'echo one',
+            ('echo "$GREETING"; echo oops >&2; exit 3', {'GREETING': "it's"}),
+            ('printf "no newline"', {}),
+        ]
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True) as run_bash:
+            results = libs.run_bash_batch(local_remote_connection, items)
+
+        assert run_bash.call_count == 1
+        assert [r.index for r in results] == [0, 1, 2]
+        assert [r.exit_code for r in results] == [0, 3, 0]
+        assert [r.stdout for r in results] == ['one\n', "it's\n", 'no newline']
+        assert [r.stderr for r in results] == ['', 'oops\n', '']
+        assert all(r.duration >= 0 for r in results)
+
+    @staticmethod
+    def test_run_bash_batch_variables_are_per_item(local_remote_connection,
+                                                   local_run_bash):
+        items = [('cd /; X=1; echo "$V"', {'V': 'a'}),
+                 'echo "${V:-unset} ${X:-unset} $(pwd)"']
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True):
+            results = libs.run_bash_batch(local_remote_connection, items)
+
+        assert results[0].stdout == 'a\n'
+        assert results[1].stdout.startswith('unset unset ')
+        assert results[1].stdout != 'unset unset /\n'
+
+    @staticmethod
+    def test_run_bash_batch_stop_on_failure(local_remote_connection,
+                                            local_run_bash):
+        items = ['true', 'false', 'echo never']
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True):
+            results = libs.run_bash_batch(local_remote_connection, items,
+                                          stop_on_failure=True)
+
+        assert [r.exit_code for r in results] == [0, 1]
+
+    @staticmethod
+    def test_run_bash_batch_check(local_remote_connection, local_run_bash):
+        items = ['true', 'echo out; echo err >&2; exit 2', 'echo done']
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True):
+            with pytest.raises(PluginScriptError) as info:
+                libs.run_bash_batch(local_remote_connection, items, check=True)
+
+        assert info.value.message == (
+            'The script failed with exit code 2.'
+            ' stdout : out\n and  stderr : err\n')
+
+    @staticmethod
+    def test_run_bash_batch_with_actionable_error(remote_connection):
+        response = libs_pb2.RunBashResponse()
+        response.error.actionable_error.id = 15
+        response.error.actionable_error.message = 'Some message'
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        return_value=response, create=True):
+            with pytest.raises(LibraryError) as err_info:
+                libs.run_bash_batch(remote_connection, ['command'])
+
+        assert err_info.value.message == 'Some message'
+
+    @staticmethod
+    def test_run_bash_batch_script_failure(remote_connection):
+        response = libs_pb2.RunBashResponse()
+        response.return_value.exit_code = 1
+        response.return_value.stderr = 'mktemp failed'
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        return_value=response, create=True):
+            with pytest.raises(PluginScriptError) as info:
+                libs.run_bash_batch(remote_connection, ['command'])
+
+        assert info.value.message == (
+            'The batch script failed with exit code 1 after 0 of 1 commands.'
+            ' stdout :  and  stderr : mktemp failed')
+
+    @staticmethod
+    def test_run_bash_batch_bad_items(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.run_bash_batch(remote_connection, ['ok', ('bad', {'a': 1})])
+
+        assert err_info.value.message == (
+            "The function run_bash_batch's argument 'items' was"
+            " a list of [class 'str', class 'tuple'] but should be of"
+            " type 'list of tuple'.")
+
+    @staticmethod
+    def test_run_bash_batch_bad_remote_connection():
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.run_bash_batch('BadRemoteConnection', ['command'])
+
+        assert err_info.value.message == (
+            "The function run_bash_batch's argument 'remote_connection' was"
+            " class 'str' but should be of"
+            " class 'dlpx.virtualization.common._common_classes.RemoteConnection'.")
+
+
+class TestLibsRunPowerShellBatch:
+    @staticmethod
+    def test_run_powershell_batch(remote_connection):
+        def mock_run_powershell(request):
+            marker = request.command.split("'")[1]
+            assert "__DlpxRun 0 'Write-Output ''a''' @{}" in request.command
+            assert "__DlpxRun 1 'exit 4' @{'V' = 'v'}" in request.command
+
+            response = libs_pb2.RunPowerShellResponse()
+            response.return_value.exit_code = 0
+            response.return_value.stdout = (
+                '{0} 0 0 10.5 11.0\na\n{0} stderr\n\n'
+                '{0} 1 4 11.0 11.25\n\n{0} stderr\nerror\n'.format(marker))
+            return response
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_powershell',
+                        side_effect=mock_run_powershell, create=True):
+            results = libs.run_powershell_batch(
+                remote_connection,
+                ["Write-Output 'a'", ('exit 4', {'V': 'v'})])
+
+        assert [r.exit_code for r in results] == [0, 4]
+        assert [r.stdout for r in results] == ['a', '']
+        assert [r.stderr for r in results] == ['', 'error']
+        assert [r.start_time for r in results] == [10.5, 11.0]
+        assert [r.duration for r in results] == [0.5, 0.25]
+
+    @staticmethod
+    def test_run_powershell_batch_bad_items(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.run_powershell_batch(remote_connection, 'command')
+
+        assert err_info.value.message == (
+            "The function run_powershell_batch's argument 'items' was"
+            " class 'str' but should be of type 'list of tuple'.")
@@ -0,0 +1,118 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import base64
+import gzip
+import shutil
+
+import mock
+import pytest
+
+from dlpx.virtualization.api import libs_pb2
+from dlpx.virtualization import libs
+from dlpx.virtualization.libs.exceptions import (
+    IncorrectArgumentTypeError, PluginScriptError)
+from dlpx.virtualization.libs.fake_engine import FakeEngine
+
+
+class TestLibsCompressOutput:
+    @staticmethod
+    def test_run_bash_compress_output(local_remote_connection, local_run_bash,
+                                      tmp_path):
+        commands = []
+
+        def run_bash(request):
+            commands.append(request.command)
+            return local_run_bash(request)
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=run_bash, create=True):
+            result = libs.run_bash(
+                local_remote_connection,
+                'seq 1 2000; echo "$NAME" >&2; exit 3',
+                variables={'NAME': u'café'},
+                compress_output=True)
+
+        assert 'gzip' in commands[0]
+        assert result.exit_code == 3
+        assert result.stdout == ''.join(
+            '{}\n'.format(i) for i in range(1, 2001))
+        assert result.stderr == u'café\n'
+        assert list(tmp_path.iterdir()) == []
+
+    @staticmethod
+    def test_run_bash_compress_output_check(local_remote_connection,
+                                            local_run_bash):
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True):
+            with pytest.raises(PluginScriptError) as info:
+                libs.run_bash(local_remote_connection, 'echo out; false',
+                              check=True, compress_output=True)
+
+        assert info.value.message == (
+            'The script failed with exit code 1.'
+            ' stdout : out\n and  stderr : ')
+
+    @staticmethod
+    def test_run_bash_compress_output_lost(remote_connection):
+        response = libs_pb2.RunBashResponse()
+        response.return_value.exit_code = 137
+        response.return_value.stderr = 'Killed'
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        return_value=response, create=True):
+            with pytest.raises(PluginScriptError) as info:
+                libs.run_bash(remote_connection, 'sleep 100',
+                              compress_output=True)
+
+        assert info.value.message == (
+            'Failed to read the compressed output of the command. The script'
+            ' exited with exit code 137. stdout :  and  stderr : Killed')
+
+    @staticmethod
+    def test_run_powershell_compress_output(remote_connection):
+        def frame(text):
+            return base64.b64encode(
+                gzip.compress(text.encode('utf-8'))).decode('ascii')
+
+        def run_powershell(request):
+            marker = request.command.split("-f\n        '")[1].split("'")[0]
+            response = libs_pb2.RunPowerShellResponse()
+            response.return_value.exit_code = 2
+            response.return_value.stdout = (
+                '{0} stdout gzip\n{1}\n{0} stderr gzip\n{2}\n'.format(
+                    marker, frame('output\r\n'), frame('')))
+            return response
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_powershell',
+                        side_effect=run_powershell, create=True):
+            result = libs.run_powershell(remote_connection, 'Write-Output x',
+                                         compress_output=True)
+
+        assert result.exit_code == 2
+        assert result.stdout == 'output\r\n'
+        assert result.stderr == ''
+
+    @staticmethod
+    @pytest.mark.skipif(shutil.which('pwsh') is None,
+                        reason='PowerShell is not installed')
+    def test_run_powershell_compress_output_exit(remote_connection):
+        with FakeEngine():
+            result = libs.run_powershell(
+                remote_connection,
+                'Write-Output out; Write-Error err; exit 3',
+                compress_output=True)
+
+        assert result.exit_code == 3
+        assert result.stdout == 'out\n'
+        assert 'err' in result.stderr
+
+    @staticmethod
+    def test_run_bash_bad_compress_output(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.run_bash(remote_connection, 'true', compress_output='yes')
+
+        assert err_info.value.message == (
+            "The function run_bash's argument 'compress_output' was"
+            " class 'str' but should be of class 'bool' if defined.")
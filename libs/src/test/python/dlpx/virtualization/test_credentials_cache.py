@@ -0,0 +1,111 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import mock
+import pytest
+
+from dlpx.virtualization.api import libs_pb2
+from dlpx.virtualization import libs
+from dlpx.virtualization.libs.exceptions import IncorrectArgumentTypeError
+
+SUPPLIER = {'type': 'NamedPasswordCredential', 'reference': 'CREDENTIAL-1'}
+
+
+@pytest.fixture(autouse=True)
+def credentials_cache():
+    yield
+    libs.disable_credentials_cache()
+
+
+@pytest.fixture
+def retrieve_credentials():
+    response = libs_pb2.CredentialsResponse()
+    response.return_value.username = 'some user'
+    response.return_value.password = 'some password'
+    with mock.patch('dlpx.virtualization._engine.libs.retrieve_credentials',
+                    return_value=response, create=True) as retrieve:
+        yield retrieve
+
+
+class TestLibsCredentialsCache:
+    @staticmethod
+    def test_disabled_by_default(retrieve_credentials):
+        libs.retrieve_credentials(SUPPLIER)
+        libs.retrieve_credentials(SUPPLIER)
+
+        assert retrieve_credentials.call_count == 2
+
+    @staticmethod
+    def test_cached(retrieve_credentials):
+        libs.enable_credentials_cache()
+
+        first = libs.retrieve_credentials(SUPPLIER)
+        second = libs.retrieve_credentials(
+            {'reference': 'CREDENTIAL-1', 'type': 'NamedPasswordCredential'})
+
+        assert retrieve_credentials.call_count == 1
+        assert second is first
+        assert first.password == 'some password'
+
+    @staticmethod
+    def test_ttl(retrieve_credentials):
+        libs.enable_credentials_cache(ttl=60)
+
+        with mock.patch('time.time', return_value=1000):
+            libs.retrieve_credentials(SUPPLIER)
+        with mock.patch('time.time', return_value=1059):
+            libs.retrieve_credentials(SUPPLIER)
+        with mock.patch('time.time', return_value=1061):
+            libs.retrieve_credentials(SUPPLIER)
+
+        assert retrieve_credentials.call_count == 2
+
+    @staticmethod
+    def test_lru_eviction(retrieve_credentials):
+        libs.enable_credentials_cache(max_size=2)
+        suppliers = [{'reference': 'CREDENTIAL-{}'.format(i)} for i in range(3)]
+
+        libs.retrieve_credentials(suppliers[0])
+        libs.retrieve_credentials(suppliers[1])
+        libs.retrieve_credentials(suppliers[0])
+        libs.retrieve_credentials(suppliers[2])
+        assert retrieve_credentials.call_count == 3
+
+        libs.retrieve_credentials(suppliers[0])
+        assert retrieve_credentials.call_count == 3
+        libs.retrieve_credentials(suppliers[1])
+        assert retrieve_credentials.call_count == 4
+
+    @staticmethod
+    def test_invalidate(retrieve_credentials):
+        libs.enable_credentials_cache()
+        other = {'reference': 'CREDENTIAL-2'}
+
+        libs.retrieve_credentials(SUPPLIER)
+        libs.retrieve_credentials(other)
+        libs.invalidate_credentials(SUPPLIER)
+        libs.retrieve_credentials(SUPPLIER)
+        libs.retrieve_credentials(other)
+        assert retrieve_credentials.call_count == 3
+
+        libs.invalidate_credentials()
+        libs.retrieve_credentials(other)
+        assert retrieve_credentials.call_count == 4
+
+    @staticmethod
+    def test_enable_bad_ttl():
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.enable_credentials_cache(ttl='60')
+
+        assert err_info.value.message == (
+            "The function enable_credentials_cache's argument 'ttl' was"
+            " class 'str' but should be of class 'int' if defined.")
+
+    @staticmethod
+    @pytest.mark.parametrize('ttl, max_size', [(-1, 128), (300, -1)])
+    def test_enable_negative(ttl, max_size):
+        with pytest.raises(IncorrectArgumentTypeError):
+            libs.enable_credentials_cache(ttl=ttl, max_size=max_size)
+
+        assert libs._credentials_cache._max_size == 0
@@ -0,0 +1,130 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import logging
+import os
+import sys
+import time
+
+import pytest
+
+from dlpx.virtualization.api import libs_pb2
+from dlpx.virtualization import libs
+from dlpx.virtualization.common._common_classes import (KeyPairCredentials,
+                                                        PasswordCredentials)
+from dlpx.virtualization.libs.exceptions import LibraryError
+from dlpx.virtualization.libs.fake_engine import FakeEngine
+
+
+class TestFakeEngine:
+    @staticmethod
+    def test_install():
+        engine_libs = sys.modules.get('dlpx.virtualization._engine.libs')
+
+        with FakeEngine() as engine:
+            from dlpx.virtualization._engine import libs as internal_libs
+            assert internal_libs is engine
+            with pytest.raises(RuntimeError):
+                engine.install()
+
+        assert sys.modules.get('dlpx.virtualization._engine.libs') is engine_libs
+
+    @staticmethod
+    def test_run_bash(remote_connection):
+        with FakeEngine() as engine:
+            result = libs.run_bash(remote_connection, 'echo "$GREETING"; exit 3',
+                                   variables={'GREETING': 'hello'})
+
+        assert result.exit_code == 3
+        assert result.stdout == 'hello\n'
+        assert [operation for operation, _ in engine.calls] == ['run_bash']
+
+    @staticmethod
+    def test_run_powershell_not_installed(remote_connection, monkeypatch):
+        monkeypatch.setenv('PATH', '')
+
+        with FakeEngine():
+            result = libs.run_powershell(remote_connection, 'Write-Output 1')
+
+        assert result.exit_code == 127
+        assert result.stderr.startswith('pwsh: ')
+
+    @staticmethod
+    def test_run_sync(remote_connection, tmp_path):
+        source = tmp_path / 'source'
+        (source / 'logs').mkdir(parents=True)
+        (source / 'data').write_text('data')
+        (source / 'logs' / 'log').write_text('log')
+        target = tmp_path / 'target'
+        target.mkdir()
+
+        with FakeEngine(sync_directory=str(target)):
+            libs.run_sync(remote_connection, str(source),
+                          exclude_paths=['logs'])
+            with pytest.raises(LibraryError) as err_info:
+                libs.run_sync(remote_connection, str(tmp_path / 'missing'))
+
+        assert sorted(os.listdir(str(target / 'source'))) == ['data']
+        assert 'is not a directory' in err_info.value.message
+
+    @staticmethod
+    def test_log():
+        logger = logging.getLogger('test_fake_engine')
+        logger.setLevel(logging.DEBUG)
+        handler = libs.PlatformHandler()
+        logger.addHandler(handler)
+
+        try:
+            with FakeEngine() as engine:
+                logger.info('message')
+        finally:
+            logger.removeHandler(handler)
+
+        assert engine.logs == [(libs_pb2.LogRequest.INFO, 'message')]
+
+    @staticmethod
+    def test_credentials():
+        with FakeEngine():
+            supplier = libs.upgrade_password('secret', username='user')
+            credentials = libs.retrieve_credentials(supplier)
+
+        assert isinstance(credentials, PasswordCredentials)
+        assert credentials.username == 'user'
+        assert credentials.password == 'secret'
+
+    @staticmethod
+    def test_credentials_key_pair():
+        def credentials(supplier):
+            return {'username': supplier['name'], 'private_key': 'private',
+                    'public_key': 'public'}
+
+        with FakeEngine(credentials=credentials):
+            result = libs.retrieve_credentials({'name': 'user'})
+
+        assert isinstance(result, KeyPairCredentials)
+        assert result.username == 'user'
+        assert result.private_key == 'private'
+
+    @staticmethod
+    def test_latency_and_bandwidth(remote_connection):
+        with FakeEngine(latency=0.05, bandwidth=10000):
+            start = time.time()
+            libs.run_bash(remote_connection, 'head -c 1000 /dev/zero')
+            elapsed = time.time() - start
+
+        assert elapsed >= 0.15
+
+    @staticmethod
+    def test_failures(remote_connection):
+        with FakeEngine(failures={'run_bash': 1}) as engine:
+            with pytest.raises(LibraryError) as err_info:
+                libs.run_bash(remote_connection, 'true')
+
+        assert err_info.value.message == 'Injected failure of run_bash.'
+        assert len(engine.calls) == 1
+
+    @staticmethod
+    def test_failures_unknown_operation():
+        with pytest.raises(ValueError):
+            FakeEngine(failures={'run_shell': 0.5})
@@ -0,0 +1,179 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import logging
+import threading
+import time
+
+import mock
+import pytest
+
+from dlpx.virtualization.api import libs_pb2
+from dlpx.virtualization import libs
+from dlpx.virtualization.common._common_classes import (
+    RemoteConnection, RemoteEnvironment, RemoteHost)
+from dlpx.virtualization.libs.exceptions import (
+    IncorrectArgumentTypeError, LibraryError)
+
+
+def _connection(remote_user, host_reference):
+    host = RemoteHost('host', host_reference, 'binary_path', 'scratch_path')
+    environment = RemoteEnvironment(
+        'environment', 'environment-' + host_reference, host)
+    return RemoteConnection(environment, remote_user)
+
+
+class _Tracker(object):
+    """Records the peak number of concurrent calls, overall and per host."""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak = 0
+        self.peak_per_host = 0
+
+    def run_bash(self, request):
+        host = request.remote_connection.environment.host.reference
+        with self.lock:
+            self.active[host] = self.active.get(host, 0) + 1
+            self.peak = max(self.peak, sum(self.active.values()))
+            self.peak_per_host = max(self.peak_per_host, self.active[host])
+        time.sleep(0.01)
+        with self.lock:
+            self.active[host] -= 1
+        response = libs_pb2.RunBashResponse()
+        response.return_value.exit_code = 0
+        response.return_value.stdout = host + ':' + request.command
+        return response
+
+
+class TestLibsRunMany:
+    @staticmethod
+    def test_run_many_preserves_order(remote_user):
+        connections = [_connection(remote_user, 'h{}'.format(i % 3))
+                       for i in range(9)]
+        tracker = _Tracker()
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=tracker.run_bash, create=True):
+            results = libs.run_many(libs.run_bash, connections, 'cmd',
+                                    max_workers=2, max_per_host=1)
+
+        assert [r.stdout for r in results] == [
+            'h{}:cmd'.format(i % 3) for i in range(9)]
+        assert tracker.peak <= 2
+        assert tracker.peak_per_host == 1
+
+    @staticmethod
+    def test_run_many_per_host_limit(remote_user):
+        connections = [_connection(remote_user, 'same') for _ in range(8)]
+        tracker = _Tracker()
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=tracker.run_bash, create=True):
+            libs.run_many(libs.run_bash, connections, 'cmd',
+                          max_workers=8, max_per_host=2)
+
+        assert tracker.peak_per_host <= 2
+
+    @staticmethod
+    def test_run_many_passes_kwargs(remote_connection):
+        response = libs_pb2.RunBashResponse()
+        response.return_value.exit_code = 0
+
+        def mock_run_bash(request):
+            assert request.variables['A'] == 'b'
+            assert request.use_login_shell
+            return response
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=mock_run_bash, create=True):
+            results = libs.run_many(libs.run_bash, [remote_connection], 'cmd',
+                                    variables={'A': 'b'}, use_login_shell=True)
+
+        assert len(results) == 1
+
+    @staticmethod
+    def test_run_many_raises_first_error(remote_user):
+        connections = [_connection(remote_user, 'h{}'.format(i))
+                       for i in range(4)]
+
+        def mock_run_bash(request):
+            response = libs_pb2.RunBashResponse()
+            reference = request.remote_connection.environment.host.reference
+            if reference in ('h1', 'h3'):
+                response.error.actionable_error.id = int(reference[1])
+                response.error.actionable_error.message = reference
+            return response
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=mock_run_bash, create=True):
+            with pytest.raises(LibraryError) as err_info:
+                libs.run_many(libs.run_bash, connections, 'cmd', max_workers=4)
+
+        assert err_info.value.message == 'h1'
+
+    @staticmethod
+    def test_run_many_return_exceptions(remote_user):
+        connections = [_connection(remote_user, 'h{}'.format(i))
+                       for i in range(3)]
+
+        def mock_run_bash(request):
+            response = libs_pb2.RunBashResponse()
+            reference = request.remote_connection.environment.host.reference
+            if reference == 'h1':
+                response.error.actionable_error.id = 1
+                response.error.actionable_error.message = 'failed'
+            else:
+                response.return_value.stdout = reference
+            return response
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=mock_run_bash, create=True):
+            results = libs.run_many(libs.run_bash, connections, 'cmd',
+                                    return_exceptions=True)
+
+        assert results[0].stdout == 'h0'
+        assert isinstance(results[1], LibraryError)
+        assert results[2].stdout == 'h2'
+
+    @staticmethod
+    def test_run_many_logging_from_workers(remote_user):
+        connections = [_connection(remote_user, 'h{}'.format(i))
+                       for i in range(6)]
+        messages = []
+
+        def mock_log(request):
+            messages.append(request.message)
+            response = libs_pb2.LogResponse()
+            response.return_value.CopyFrom(libs_pb2.LogResult())
+            return response
+
+        logger = logging.getLogger('test_run_many_logging_from_workers')
+        logger.setLevel(logging.DEBUG)
+        logger.addHandler(libs.PlatformHandler())
+
+        def operation(connection, count):
+            for i in range(count):
+                logger.debug('%s %s', connection.environment.host.reference, i)
+            return count
+
+        with mock.patch('dlpx.virtualization._engine.libs.log',
+                        side_effect=mock_log, create=True):
+            results = libs.run_many(operation, connections, 20, max_workers=6)
+
+        assert results == [20] * 6
+        assert sorted(messages) == sorted(
+            'h{} {}'.format(h, i) for h in range(6) for i in range(20))
+
+    @staticmethod
+    def test_run_many_bad_remote_connections(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.run_many(libs.run_bash, [remote_connection, 'bad'], 'cmd')
+
+        assert err_info.value.message == (
+            "The function run_many's argument 'remote_connections' was"
+            " a list of [class"
+            " 'dlpx.virtualization.common._common_classes.RemoteConnection',"
+            " class 'str'] but should be of type 'list of"
+            " dlpx.virtualization.common._common_classes.RemoteConnection'.")
@@ -0,0 +1,260 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import os
+
+import mock
+import pytest
+
+from dlpx.virtualization.api import libs_pb2
+from dlpx.virtualization import libs
+from dlpx.virtualization.libs.exceptions import (
+    IncorrectArgumentTypeError, LibraryError, PluginScriptError)
+
+DATA = bytes(bytearray(range(256))) * 40
+
+
+@pytest.fixture
+def run_bash(local_run_bash):
+    with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                    side_effect=local_run_bash, create=True) as run_bash:
+        yield run_bash
+
+
+class TestLibsReadFile:
+    @staticmethod
+    def test_read_file(local_remote_connection, run_bash, tmp_path):
+        path = tmp_path / "it's data"
+        path.write_bytes(DATA)
+
+        data = libs.read_file(local_remote_connection, str(path),
+                              chunk_size=4000, checksum=True)
+
+        assert data == DATA
+        assert run_bash.call_count == 3
+        assert all(str(path) not in call[0][0].command
+                   for call in run_bash.call_args_list)
+
+    @staticmethod
+    def test_read_file_range(local_remote_connection, run_bash, tmp_path):
+        path = tmp_path / 'data'
+        path.write_bytes(DATA)
+
+        assert libs.read_file(local_remote_connection, str(path), offset=100,
+                              length=1000, chunk_size=300,
+                              checksum=True) == DATA[100:1100]
+        assert libs.read_file(local_remote_connection, str(path),
+                              offset=len(DATA) - 10, length=1000) == DATA[-10:]
+        assert libs.read_file(local_remote_connection, str(path),
+                              length=0) == b''
+
+    @staticmethod
+    def test_read_file_missing(local_remote_connection, run_bash, tmp_path):
+        with pytest.raises(PluginScriptError) as info:
+            libs.read_file(local_remote_connection, str(tmp_path / 'missing'))
+
+        assert 'No such file' in info.value.message
+
+    @staticmethod
+    def test_read_file_bad_offset(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.read_file(remote_connection, '/etc/hosts', offset='1')
+
+        assert err_info.value.message == (
+            "The function read_file's argument 'offset' was"
+            " class 'str' but should be of class 'int' if defined.")
+
+
+class TestLibsWriteFile:
+    @staticmethod
+    def test_write_file(local_remote_connection, run_bash, tmp_path):
+        path = tmp_path / 'data'
+        path.write_bytes(b'old contents')
+
+        written = libs.write_file(local_remote_connection, str(path),
+                                  (DATA[i:i + 1000]
+                                   for i in range(0, len(DATA), 1000)),
+                                  chunk_size=4096, checksum=True)
+
+        assert written == len(DATA)
+        assert path.read_bytes() == DATA
+        assert run_bash.call_count == 3
+        assert os.listdir(str(tmp_path)) == ['data']
+
+    @staticmethod
+    def test_write_empty_file(local_remote_connection, run_bash, tmp_path):
+        path = tmp_path / 'empty'
+
+        assert libs.write_file(local_remote_connection, str(path), b'') == 0
+        assert path.read_bytes() == b''
+
+    @staticmethod
+    def test_write_file_mode(local_remote_connection, run_bash, tmp_path):
+        path = tmp_path / 'key'
+
+        libs.write_file(local_remote_connection, str(path), b'secret',
+                        mode=0o600)
+
+        assert os.stat(str(path)).st_mode & 0o777 == 0o600
+
+    @staticmethod
+    def test_write_file_failure_cleans_up(local_remote_connection, run_bash,
+                                          tmp_path):
+        path = tmp_path / 'data'
+
+        def chunks():
+            yield DATA
+            raise ValueError('source failed')
+
+        with pytest.raises(ValueError):
+            libs.write_file(local_remote_connection, str(path), chunks(),
+                            chunk_size=1024)
+
+        assert os.listdir(str(tmp_path)) == []
+
+    @staticmethod
+    def test_write_file_mode_created_private(local_remote_connection,
+                                             run_bash, tmp_path_factory):
+        #
+        # With chmod stubbed out, the mode of the file is the one it was
+        # created with.
+        #
+        bin_path = tmp_path_factory.mktemp('bin')
+        (bin_path / 'chmod').write_text(u'#!/bin/sh\nexit 0\n')
+        os.chmod(str(bin_path / 'chmod'), 0o755)
+        path = tmp_path_factory.mktemp('data') / 'key'
+
+        umask = os.umask(0o022)
+        try:
+            with mock.patch.dict(os.environ, {'PATH': '{}:{}'.format(
+                    bin_path, os.environ['PATH'])}):
+                libs.write_file(local_remote_connection, str(path), DATA,
+                                mode=0o640)
+        finally:
+            os.umask(umask)
+
+        assert os.stat(str(path)).st_mode & 0o777 == 0o600
+
+    @staticmethod
+    def test_write_file_bad_chunks(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.write_file(remote_connection, '/tmp/file', u'text')
+
+        assert err_info.value.message == (
+            "The function write_file's argument 'chunks' was"
+            " class 'str' but should be of class 'bytes'.")
+
+
+class TestLibsStat:
+    @staticmethod
+    def test_stat(local_remote_connection, run_bash, tmp_path):
+        path = tmp_path / 'data'
+        path.write_bytes(DATA)
+        os.chmod(str(path), 0o640)
+
+        file_stat = libs.stat(local_remote_connection, str(path))
+        dir_stat = libs.stat(local_remote_connection, str(tmp_path))
+        missing = libs.stat(local_remote_connection, str(tmp_path / 'none'))
+
+        assert file_stat.exists and file_stat.is_file
+        assert file_stat.size == len(DATA)
+        assert file_stat.mode == 0o640
+        assert int(file_stat.mtime) == int(os.stat(str(path)).st_mtime)
+        assert dir_stat.is_dir
+        assert not missing.exists
+
+    @staticmethod
+    def test_stat_powershell(remote_connection):
+        def run_powershell(request):
+            assert request.variables['DLPX_PATH'] == 'C:\\data\\file.txt'
+            marker = request.command.split("-f '")[1].split("'")[0]
+            response = libs_pb2.RunPowerShellResponse()
+            response.return_value.stdout = (
+                '{} stat 12 1700000000.5 0 regular file\n'.format(marker))
+            return response
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_powershell',
+                        side_effect=run_powershell, create=True):
+            file_stat = libs.stat(remote_connection, 'C:\\data\\file.txt',
+                                  powershell=True)
+
+        assert file_stat.is_file
+        assert file_stat.size == 12
+        assert file_stat.mtime == 1700000000.5
+
+
+class TestLibsRunBashStdin:
+    @staticmethod
+    def test_run_bash_stdin_bytes(local_remote_connection, run_bash, tmp_path):
+        result = libs.run_bash(local_remote_connection,
+                               'wc -c; ls -l "$0" >/dev/null; exit 2',
+                               stdin=DATA)
+
+        assert result.exit_code == 2
+        assert result.stdout.strip() == str(len(DATA))
+        assert os.listdir(str(tmp_path)) == []
+        assert all(DATA[:16].hex() not in call[0][0].command
+                   for call in run_bash.call_args_list)
+
+    @staticmethod
+    def test_run_bash_stdin_file_like(local_remote_connection, run_bash,
+                                      tmp_path):
+        source = tmp_path / 'source.sql'
+        source.write_text(u'select 1;\nselect 2;\n')
+
+        with open(str(source)) as stdin:
+            result = libs.run_bash(local_remote_connection, 'sort -r',
+                                   stdin=stdin, compress_output=True)
+
+        assert result.stdout == u'select 2;\nselect 1;\n'
+
+    @staticmethod
+    def test_run_bash_stdin_iterator(local_remote_connection, run_bash):
+        result = libs.run_bash(local_remote_connection, 'cat',
+                               stdin=iter([b'a', u'b', b'c']))
+
+        assert result.stdout == 'abc'
+
+    @staticmethod
+    def test_run_bash_stdin_removed_on_failure(local_remote_connection,
+                                               local_run_bash, tmp_path):
+        def run_bash(request):
+            if 'wc -c' in request.command:
+                raise RuntimeError('callback failed')
+            return local_run_bash(request)
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=run_bash, create=True):
+            with pytest.raises(RuntimeError):
+                libs.run_bash(local_remote_connection, 'wc -c', stdin=b'x')
+
+        assert os.listdir(str(tmp_path)) == []
+
+    @staticmethod
+    def test_run_bash_stdin_removed_on_error_response(local_remote_connection,
+                                                      local_run_bash,
+                                                      tmp_path):
+        def run_bash(request):
+            if 'wc -c' in request.command:
+                response = libs_pb2.RunBashResponse()
+                response.error.actionable_error.id = 1
+                response.error.actionable_error.message = 'engine error'
+                return response
+            return local_run_bash(request)
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=run_bash, create=True):
+            with pytest.raises(LibraryError):
+                libs.run_bash(local_remote_connection, 'wc -c', stdin=b'x')
+
+        assert os.listdir(str(tmp_path)) == []
+
+    @staticmethod
+    def test_run_bash_bad_stdin(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.run_bash(remote_connection, 'cat', stdin=10)
+
+        assert err_info.value.message == (
+            "The function run_bash's argument 'stdin' was"
+            " class 'int' but should be of class 'bytes' if defined.")
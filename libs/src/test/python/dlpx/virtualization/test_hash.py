@@ -0,0 +1,131 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import hashlib
+import json
+import os
+
+import mock
+import pytest
+
+from dlpx.virtualization import libs
+from dlpx.virtualization.libs.exceptions import (
+    IncorrectArgumentTypeError, PluginScriptError)
+
+
+@pytest.fixture
+def run_bash(local_run_bash):
+    with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                    side_effect=local_run_bash, create=True) as run_bash:
+        yield run_bash
+
+
+@pytest.fixture
+def tree(tmp_path):
+    directory = tmp_path / 'data'
+    (directory / 'sub dir').mkdir(parents=True)
+    (directory / 'a').write_bytes(b'a' * 1000)
+    (directory / 'sub dir' / 'b c').write_bytes(os.urandom(5000))
+    (directory / 'empty').write_bytes(b'')
+    return directory
+
+
+def sha256(path):
+    with open(str(path), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class TestLibsHashTree:
+    @staticmethod
+    def test_hash_tree(local_remote_connection, run_bash, tree):
+        manifest = libs.hash_tree(local_remote_connection, str(tree),
+                                  workers=2)
+
+        assert sorted(manifest.files) == ['a', 'empty', 'sub dir/b c']
+        assert manifest.digest('sub dir/b c') == sha256(tree / 'sub dir' / 'b c')
+        assert manifest.digest('empty') == hashlib.sha256(b'').hexdigest()
+        assert manifest.files['a'][0] == 1000
+        assert manifest.rehashed == ['a', 'empty', 'sub dir/b c']
+        assert len(manifest.root) == 64
+
+    @staticmethod
+    def test_hash_tree_incremental(local_remote_connection, run_bash, tree):
+        previous = libs.hash_tree(local_remote_connection, str(tree))
+        (tree / 'a').write_bytes(b'b' * 1001)
+        (tree / 'new').write_bytes(b'new')
+        os.remove(str(tree / 'empty'))
+
+        manifest = libs.hash_tree(
+            local_remote_connection, str(tree),
+            previous_manifest=json.loads(json.dumps(previous.to_dict())))
+
+        assert manifest.rehashed == ['a', 'new']
+        assert manifest.digest('a') == sha256(tree / 'a')
+        assert manifest.root != previous.root
+        assert manifest.diff(previous) == (['new'], ['empty'], ['a'])
+
+    @staticmethod
+    def test_hash_tree_root_is_stable(local_remote_connection, run_bash,
+                                      tree):
+        first = libs.hash_tree(local_remote_connection, str(tree))
+        second = libs.hash_tree(local_remote_connection, str(tree),
+                                previous_manifest=first)
+
+        assert second.rehashed == []
+        assert second.root == first.root
+
+    @staticmethod
+    def test_hash_tree_sample(local_remote_connection, run_bash, tree):
+        manifest = libs.hash_tree(local_remote_connection, str(tree),
+                                  mode='sample', sample_size=100)
+
+        assert manifest.digest('a') != sha256(tree / 'a')
+        with open(str(tree / 'a'), 'r+b') as f:
+            f.seek(500)
+            f.write(b'x')
+        stat = os.stat(str(tree / 'a'))
+        os.utime(str(tree / 'a'), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        changed = libs.hash_tree(local_remote_connection, str(tree),
+                                 mode='sample', sample_size=100,
+                                 previous_manifest=manifest)
+
+        assert changed.rehashed == ['a']
+        assert changed.digest('a') != manifest.digest('a')
+
+    @staticmethod
+    def test_hash_tree_block(local_remote_connection, run_bash, tree):
+        manifest = libs.hash_tree(local_remote_connection, str(tree),
+                                  mode='block', block_size=2000)
+
+        with open(str(tree / 'sub dir' / 'b c'), 'rb') as f:
+            data = f.read()
+        assert manifest.blocks('sub dir/b c') == [
+            hashlib.sha256(data[i:i + 2000]).hexdigest()
+            for i in range(0, 5000, 2000)]
+        assert manifest.blocks('empty') == [hashlib.sha256(b'').hexdigest()]
+
+    @staticmethod
+    def test_hash_tree_missing(local_remote_connection, run_bash, tmp_path):
+        with pytest.raises(PluginScriptError) as err_info:
+            libs.hash_tree(local_remote_connection, str(tmp_path / 'missing'))
+
+        assert 'No such directory' in err_info.value.message
+
+    @staticmethod
+    def test_hash_tree_bad_workers(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.hash_tree(remote_connection, '/data', workers='2')
+
+        assert err_info.value.message == (
+            "The function hash_tree's argument 'workers' was class 'str' but"
+            " should be of class 'int' if defined.")
+
+    @staticmethod
+    def test_hash_tree_bad_mode(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.hash_tree(remote_connection, '/data', mode='md5')
+
+        assert err_info.value.message.startswith(
+            "The function hash_tree's argument 'mode' was")
@@ -6,7 +6,7 @@ import logging
 import mock
 import pytest
 
-from dlpx.virtualization.libs import PlatformHandler
+from dlpx.virtualization.libs import BufferedPlatformHandler, PlatformHandler
 from dlpx.virtualization.api.libs_pb2 import LogRequest
 from dlpx.virtualization.api.libs_pb2 import LogResult
 from dlpx.virtualization.api.libs_pb2 import LogResponse
@@ -84,3 +84,175 @@ class TestPythonHandler:
         log_request.level = LogRequest.ERROR
 
         mock_internal_libs.log.assert_called_with(log_request)
+
+
+class TestBufferedPlatformHandler:
+
+    @staticmethod
+    @pytest.fixture()
+    def successful_response():
+        response = LogResponse()
+        response.return_value.CopyFrom(LogResult())
+        return response
+
+    @staticmethod
+    @pytest.fixture()
+    def logger():
+        logger = logging.getLogger('buffered')
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        yield logger
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+
+    @staticmethod
+    def sent(mock_internal_libs):
+        return [(call[0][0].level, call[0][0].message)
+                for call in mock_internal_libs.log.call_args_list]
+
+    @staticmethod
+    @mock.patch("dlpx.virtualization._engine.libs", create=True)
+    def test_batches_same_level_runs(mock_internal_libs, logger,
+                                     successful_response):
+        mock_internal_libs.log.return_value = successful_response
+        handler = BufferedPlatformHandler()
+        logger.addHandler(handler)
+
+        logger.debug('one')
+        logger.debug('two')
+        logger.info('three')
+        logger.debug('four')
+        assert not mock_internal_libs.log.called
+
+        handler.flush()
+
+        assert TestBufferedPlatformHandler.sent(mock_internal_libs) == [
+            (LogRequest.DEBUG, 'one\ntwo'),
+            (LogRequest.INFO, 'three'),
+            (LogRequest.DEBUG, 'four')]
+
+    @staticmethod
+    @mock.patch("dlpx.virtualization._engine.libs", create=True)
+    def test_multiline_records_sent_alone(mock_internal_libs, logger,
+                                          successful_response):
+        mock_internal_libs.log.return_value = successful_response
+        handler = BufferedPlatformHandler()
+        logger.addHandler(handler)
+
+        logger.info('one')
+        logger.info('two')
+        logger.info('three\nlines')
+        logger.info('four')
+        handler.flush()
+
+        assert TestBufferedPlatformHandler.sent(mock_internal_libs) == [
+            (LogRequest.INFO, 'one\ntwo'),
+            (LogRequest.INFO, 'three\nlines'),
+            (LogRequest.INFO, 'four')]
+
+    @staticmethod
+    @mock.patch("dlpx.virtualization._engine.libs", create=True)
+    def test_flush_on_error(mock_internal_libs, logger, successful_response):
+        mock_internal_libs.log.return_value = successful_response
+        logger.addHandler(BufferedPlatformHandler())
+
+        logger.info('before')
+        logger.warning('warning')
+        logger.error('error')
+
+        assert TestBufferedPlatformHandler.sent(mock_internal_libs) == [
+            (LogRequest.INFO, 'before'),
+            (LogRequest.ERROR, 'warning\nerror')]
+
+    @staticmethod
+    @mock.patch("dlpx.virtualization._engine.libs", create=True)
+    def test_flush_on_thresholds(mock_internal_libs, logger,
+                                 successful_response):
+        mock_internal_libs.log.return_value = successful_response
+        logger.addHandler(BufferedPlatformHandler(capacity=2, max_bytes=10))
+
+        logger.info('a')
+        logger.info('b')
+        logger.info('0123456789')
+
+        assert TestBufferedPlatformHandler.sent(mock_internal_libs) == [
+            (LogRequest.INFO, 'a\nb'),
+            (LogRequest.INFO, '0123456789')]
+
+    @staticmethod
+    @mock.patch("dlpx.virtualization._engine.libs", create=True)
+    def test_flushing_decorator(mock_internal_libs, logger,
+                                successful_response):
+        mock_internal_libs.log.return_value = successful_response
+        handler = BufferedPlatformHandler()
+        logger.addHandler(handler)
+
+        @handler.flushing
+        def operation(source_connection):
+            logger.info('inside %s', source_connection)
+            raise RuntimeError('failed')
+
+        with pytest.raises(RuntimeError):
+            operation(source_connection='connection')
+
+        assert TestBufferedPlatformHandler.sent(mock_internal_libs) == [
+            (LogRequest.INFO, 'inside connection')]
+
+    @staticmethod
+    @mock.patch("dlpx.virtualization._engine.libs", create=True)
+    @mock.patch("dlpx.virtualization.libs._logging._MAX_CALLBACK_BYTES", 8)
+    def test_splits_large_batches(mock_internal_libs, logger,
+                                  successful_response):
+        mock_internal_libs.log.return_value = successful_response
+        handler = BufferedPlatformHandler()
+        logger.addHandler(handler)
+
+        logger.info('abc')
+        logger.info('def')
+        logger.info(u'é' * 6)
+        handler.close()
+
+        assert TestBufferedPlatformHandler.sent(mock_internal_libs) == [
+            (LogRequest.INFO, 'abc\ndef'),
+            (LogRequest.INFO, u'é' * 4),
+            (LogRequest.INFO, u'é' * 2)]
+
+    @staticmethod
+    @mock.patch("dlpx.virtualization._engine.libs", create=True)
+    def test_failed_flush_keeps_records(mock_internal_libs, logger,
+                                        successful_response):
+        mock_internal_libs.log.side_effect = [successful_response,
+                                              RuntimeError('engine failed'),
+                                              successful_response]
+        handler = BufferedPlatformHandler()
+        handler.handleError = mock.Mock()
+        logger.addHandler(handler)
+
+        logger.info('info')
+        logger.error('error')
+
+        assert handler.handleError.call_count == 1
+        handler.flush()
+
+        assert TestBufferedPlatformHandler.sent(mock_internal_libs) == [
+            (LogRequest.INFO, 'info'),
+            (LogRequest.ERROR, 'error'),
+            (LogRequest.ERROR, 'error')]
+
+    @staticmethod
+    @mock.patch("dlpx.virtualization._engine.libs", create=True)
+    def test_failed_flush_raises(mock_internal_libs, logger,
+                                 successful_response):
+        mock_internal_libs.log.side_effect = [RuntimeError('engine failed'),
+                                              successful_response]
+        handler = BufferedPlatformHandler()
+        logger.addHandler(handler)
+
+        logger.info('info')
+        with pytest.raises(RuntimeError):
+            handler.flush()
+        handler.flush()
+
+        assert TestBufferedPlatformHandler.sent(mock_internal_libs) == [
+            (LogRequest.INFO, 'info'),
+            (LogRequest.INFO, 'info')]
@@ -0,0 +1,118 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import mock
+import pytest
+
+from dlpx.virtualization import libs
+from dlpx.virtualization.libs.exceptions import IncorrectArgumentTypeError
+
+
+@pytest.fixture(autouse=True)
+def login_environment_cache():
+    yield
+    libs.disable_login_environment_cache()
+
+
+@pytest.fixture
+def run_bash(local_run_bash):
+    with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                    side_effect=local_run_bash, create=True) as run_bash:
+        yield run_bash
+
+
+class TestLibsLoginEnvironment:
+    @staticmethod
+    def test_disabled_by_default(local_remote_connection, run_bash):
+        libs.run_bash(local_remote_connection, 'true', use_login_shell=True)
+        libs.run_bash(local_remote_connection, 'true', use_login_shell=True)
+
+        assert [call[0][0].use_login_shell
+                for call in run_bash.call_args_list] == [True, True]
+
+    @staticmethod
+    def test_environment_reused(local_remote_connection, run_bash, tmp_path,
+                                monkeypatch):
+        home = tmp_path / 'home'
+        home.mkdir()
+        (home / '.bash_profile').write_text(
+            u'export FROM_PROFILE="it\'s set"\nexport SID=profile\n')
+        monkeypatch.setenv('HOME', str(home))
+        libs.enable_login_environment_cache()
+
+        first = libs.run_bash(local_remote_connection, 'echo "$SID $EXTRA"',
+                              variables={'SID': 'first', 'EXTRA': 'x'},
+                              use_login_shell=True)
+        second = libs.run_bash(local_remote_connection,
+                               'echo "$FROM_PROFILE $SID ${EXTRA:-unset}"',
+                               variables={'SID': 'second'},
+                               use_login_shell=True, compress_output=True)
+        third = libs.run_bash(local_remote_connection,
+                              'echo "$EXTRA"', variables={'EXTRA': 'y'},
+                              use_login_shell=True)
+        plain = libs.run_bash(local_remote_connection,
+                              'echo "${FROM_PROFILE:-unset}"')
+
+        assert first.stdout == 'profile x\n'
+        assert second.stdout == "it's set profile unset\n"
+        assert third.stdout == 'y\n'
+        assert plain.stdout == 'unset\n'
+        assert [call[0][0].use_login_shell
+                for call in run_bash.call_args_list] == [
+                    True, False, False, False]
+
+    @staticmethod
+    @pytest.mark.parametrize('cached', [False, True])
+    def test_profile_takes_precedence(local_remote_connection, run_bash,
+                                      tmp_path, monkeypatch, cached):
+        home = tmp_path / 'home'
+        home.mkdir()
+        (home / '.bash_profile').write_text(u'export SID=profile\n')
+        monkeypatch.setenv('HOME', str(home))
+        if cached:
+            libs.enable_login_environment_cache()
+
+        first = libs.run_bash(local_remote_connection, 'echo "$SID"',
+                              variables={'SID': 'first'},
+                              use_login_shell=True)
+        second = libs.run_bash(local_remote_connection, 'echo "$SID"',
+                               use_login_shell=True)
+
+        assert first.stdout == 'profile\n'
+        assert second.stdout == 'profile\n'
+
+    @staticmethod
+    def test_enable_negative_ttl():
+        with pytest.raises(IncorrectArgumentTypeError):
+            libs.enable_login_environment_cache(ttl=-1)
+
+        assert not libs._login_env.enabled()
+
+    @staticmethod
+    def test_ttl_and_invalidate(local_remote_connection, run_bash):
+        libs.enable_login_environment_cache(ttl=60)
+
+        with mock.patch('time.time', return_value=1000):
+            libs.run_bash(local_remote_connection, 'true', use_login_shell=True)
+        with mock.patch('time.time', return_value=1059):
+            libs.run_bash(local_remote_connection, 'true', use_login_shell=True)
+        with mock.patch('time.time', return_value=1061):
+            libs.run_bash(local_remote_connection, 'true', use_login_shell=True)
+        libs.invalidate_login_environment(local_remote_connection)
+        libs.run_bash(local_remote_connection, 'true', use_login_shell=True)
+
+        assert [call[0][0].use_login_shell
+                for call in run_bash.call_args_list] == [
+                    True, False, True, True]
+
+    @staticmethod
+    def test_invalidate_bad_remote_connection():
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.invalidate_login_environment('connection')
+
+        assert err_info.value.message == (
+            "The function invalidate_login_environment's argument"
+            " 'remote_connection' was class 'str' but should be of"
+            " class 'dlpx.virtualization.common._common_classes.RemoteConnection'"
+            " if defined.")
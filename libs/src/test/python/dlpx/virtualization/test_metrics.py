@@ -0,0 +1,112 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import mock
+import pytest
+
+from dlpx.virtualization.api import libs_pb2
+from dlpx.virtualization import libs
+from dlpx.virtualization.libs import metrics
+from dlpx.virtualization.libs.exceptions import LibraryError
+
+
+@pytest.fixture(autouse=True)
+def enabled():
+    metrics.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+def run_bash_response(exit_code):
+    response = libs_pb2.RunBashResponse()
+    response.return_value.exit_code = exit_code
+    response.return_value.stdout = 'output'
+    return response
+
+
+class TestMetrics:
+    @staticmethod
+    def test_snapshot(remote_connection):
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=[run_bash_response(0),
+                                     run_bash_response(0),
+                                     run_bash_response(2)], create=True):
+            for _ in range(3):
+                libs.run_bash(remote_connection, 'true')
+
+        entry, = metrics.snapshot()
+        assert entry['operation'] == 'run_bash'
+        assert entry['host'] == remote_connection.environment.host.reference
+        assert entry['count'] == 3
+        assert entry['errors'] == 0
+        assert entry['exit_codes'] == {0: 2, 2: 1}
+        assert entry['request_bytes'] > 0
+        assert entry['response_bytes'] == sum(
+            run_bash_response(code).ByteSize() for code in (0, 0, 2))
+        assert entry['seconds'] >= entry['max_seconds'] >= 0
+
+    @staticmethod
+    def test_snapshot_errors(remote_connection):
+        response = libs_pb2.RunSyncResponse()
+        response.error.actionable_error.id = 1
+        response.error.actionable_error.message = 'failed'
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_sync',
+                        return_value=response, create=True):
+            with pytest.raises(LibraryError):
+                libs.run_sync(remote_connection, '/data')
+        with mock.patch('dlpx.virtualization._engine.libs.run_sync',
+                        side_effect=RuntimeError('engine'), create=True):
+            with pytest.raises(RuntimeError):
+                libs.run_sync(remote_connection, '/data')
+
+        entry, = metrics.snapshot()
+        assert entry['operation'] == 'run_sync'
+        assert entry['count'] == 2
+        assert entry['errors'] == 2
+        assert entry['exit_codes'] == {}
+
+    @staticmethod
+    def test_disabled(remote_connection):
+        metrics.disable()
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        return_value=run_bash_response(0), create=True):
+            libs.run_bash(remote_connection, 'true')
+
+        assert metrics.snapshot() == []
+
+    @staticmethod
+    def test_summarized(remote_connection):
+        @metrics.summarized
+        def operation():
+            libs.run_bash(remote_connection, 'true')
+            return 'result'
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        return_value=run_bash_response(0), create=True):
+            libs.run_bash(remote_connection, 'true')
+            with mock.patch('dlpx.virtualization._engine.libs.log',
+                            return_value=libs_pb2.LogResponse(),
+                            create=True) as log:
+                assert operation() == 'result'
+
+        request, = log.call_args[0]
+        assert request.level == libs_pb2.LogRequest.INFO
+        assert request.message.startswith('Virtualization Libs calls:\n')
+        assert 'run_bash on host {}: 1 calls, 0 failed'.format(
+            remote_connection.environment.host.reference) in request.message
+        assert 'exit codes {0: 1}' in request.message
+        assert [entry['count'] for entry in metrics.snapshot()] == [1, 2]
+
+    @staticmethod
+    def test_summarized_disabled():
+        metrics.disable()
+
+        with mock.patch('dlpx.virtualization.libs.libs._log_request') as log:
+            metrics.summarized(lambda: None)()
+
+        assert not log.called
@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import hashlib
+import os
+
+import mock
+import pytest
+
+from dlpx.virtualization import libs
+from dlpx.virtualization.libs.exceptions import (
+    IncorrectArgumentTypeError, PluginScriptError)
+
+DATA = os.urandom(200000)
+
+
+@pytest.fixture
+def run_bash(local_run_bash):
+    with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                    side_effect=local_run_bash, create=True) as run_bash:
+        yield run_bash
+
+
+class TestLibsPipe:
+    @staticmethod
+    @pytest.mark.parametrize('compress', [False, True])
+    def test_pipe(local_remote_connection, run_bash, tmp_path, compress):
+        source = tmp_path / 'source'
+        source.write_bytes(DATA)
+
+        result = libs.pipe(local_remote_connection,
+                           "cat '{}'; echo warning >&2; exit 3".format(source),
+                           local_remote_connection,
+                           "sha256sum | cut -d' ' -f1",
+                           compress=compress, chunk_size=30000, backlog=2)
+
+        assert result.exit_code == 0
+        assert (result.destination.stdout.strip() ==
+                hashlib.sha256(DATA).hexdigest())
+        assert result.source.exit_code == 3
+        assert result.source.stderr == 'warning\n'
+        assert result.bytes_read == len(DATA)
+        if compress:
+            assert result.bytes_transferred > 0
+        else:
+            assert result.bytes_transferred == len(DATA)
+        assert sorted(os.listdir(str(tmp_path))) == ['source']
+
+    @staticmethod
+    def test_pipe_destination_exits_first(local_remote_connection, run_bash,
+                                          tmp_path):
+        result = libs.pipe(local_remote_connection, 'yes',
+                           local_remote_connection, 'head -c 4',
+                           chunk_size=20000, backlog=2)
+
+        assert result.exit_code == 0
+        assert result.destination.stdout == 'y\ny\n'
+        assert result.source.exit_code is None
+        assert result.bytes_read is None
+        assert os.listdir(str(tmp_path)) == []
+
+    @staticmethod
+    def test_pipe_check(local_remote_connection, run_bash, tmp_path):
+        with pytest.raises(PluginScriptError) as err_info:
+            libs.pipe(local_remote_connection, 'echo data',
+                      local_remote_connection, 'cat >/dev/null; exit 2',
+                      check=True)
+
+        assert err_info.value.message.startswith(
+            'The destination command failed with exit code 2.')
+
+    @staticmethod
+    def test_pipe_bad_backlog(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.pipe(remote_connection, 'echo', remote_connection, 'cat',
+                      backlog='4')
+
+        assert err_info.value.message == (
+            "The function pipe's argument 'backlog' was class 'str' but"
+            " should be of class 'int' if defined.")
+
+    @staticmethod
+    def test_pipe_bad_command(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError):
+            libs.pipe(remote_connection, 'echo', remote_connection, None)
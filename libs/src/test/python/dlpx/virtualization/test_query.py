@@ -0,0 +1,115 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import base64
+import os
+
+import mock
+import pytest
+
+from dlpx.virtualization.api import libs_pb2
+from dlpx.virtualization import libs
+from dlpx.virtualization.libs.exceptions import IncorrectArgumentTypeError
+
+
+@pytest.fixture
+def run_bash(local_run_bash):
+    with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                    side_effect=local_run_bash, create=True) as run_bash:
+        yield run_bash
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / 'data dir' / 'sub').mkdir(parents=True)
+    (tmp_path / 'data dir' / 'a').write_bytes(b'a' * 10)
+    (tmp_path / 'data dir' / 'sub' / 'b').write_bytes(b'b' * 20)
+    (tmp_path / 'data dir' / 'sub' / 'deeper').mkdir()
+    return tmp_path
+
+
+class TestLibsQueryFiles:
+    @staticmethod
+    def test_query_files(local_remote_connection, run_bash, tree):
+        directory = str(tree / 'data dir')
+        file_path = os.path.join(directory, 'a')
+        missing = str(tree / 'missing')
+
+        queries = libs.query_files(local_remote_connection,
+                                   [directory, file_path, missing],
+                                   list_depth=2, disk_usage=True)
+
+        assert run_bash.call_count == 1
+        assert list(queries) == [directory, file_path, missing]
+        assert queries[directory].stat.is_dir
+        assert sorted((os.path.relpath(entry.path, directory), entry.file_type)
+                      for entry in queries[directory].entries) == [
+            ('a', 'file'), ('sub', 'directory'), ('sub/b', 'file'),
+            ('sub/deeper', 'directory')]
+        assert [entry.size for entry in queries[directory].entries
+                if entry.path.endswith('/b')] == [20]
+        assert queries[directory].disk_usage > 0
+        assert queries[file_path].stat.size == 10
+        assert queries[file_path].entries is None
+        assert not queries[missing].exists
+        assert queries[missing].disk_usage is None
+
+    @staticmethod
+    def test_query_files_stat_only(local_remote_connection, run_bash, tree):
+        directory = str(tree / 'data dir')
+
+        query = libs.query_files(local_remote_connection, [directory])[directory]
+
+        assert query.exists
+        assert query.entries is None
+        assert query.disk_usage is None
+
+    @staticmethod
+    def test_query_files_depth(local_remote_connection, run_bash, tree):
+        directory = str(tree / 'data dir')
+
+        query = libs.query_files(local_remote_connection, [directory],
+                                 list_depth=1)[directory]
+
+        assert sorted(os.path.basename(entry.path)
+                      for entry in query.entries) == ['a', 'sub']
+
+    @staticmethod
+    def test_query_files_powershell(remote_connection):
+        listing = u'C:\\data\\a.mdf\0' u'12 1700000000.5 0 regular file\0'
+
+        def run_powershell(request):
+            assert "'C:\\data', 'C:\\missing'" in request.command
+            marker = request.command.split("-f '")[1].split("'")[0]
+            response = libs_pb2.RunPowerShellResponse()
+            response.return_value.stdout = (
+                '{0} stat 0 0 0 0 directory\n'
+                '{0} list 0\n{1}\n'
+                '{0} du 0 12\n'
+                '{0} missing 1\n').format(
+                    marker,
+                    base64.b64encode(listing.encode('utf-8')).decode('ascii'))
+            return response
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_powershell',
+                        side_effect=run_powershell, create=True):
+            queries = libs.query_files(remote_connection,
+                                       ['C:\\data', 'C:\\missing'],
+                                       list_depth=1, disk_usage=True,
+                                       powershell=True)
+
+        assert [entry.path for entry in queries['C:\\data'].entries] == [
+            'C:\\data\\a.mdf']
+        assert queries['C:\\data'].entries[0].size == 12
+        assert queries['C:\\data'].disk_usage == 12
+        assert not queries['C:\\missing'].exists
+
+    @staticmethod
+    def test_query_files_bad_paths(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.query_files(remote_connection, '/data')
+
+        assert err_info.value.message == (
+            "The function query_files's argument 'paths' was class 'str' but"
+            " should be of type 'list of str'.")
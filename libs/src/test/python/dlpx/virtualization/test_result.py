@@ -0,0 +1,69 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import mock
+
+from dlpx.virtualization.api import libs_pb2
+from dlpx.virtualization import libs
+
+
+class TestCommandResult:
+    @staticmethod
+    def test_lazy_decoding(remote_connection):
+        response = libs_pb2.RunBashResponse()
+        response.return_value.exit_code = 3
+        response.return_value.stdout = u'café\n'
+        response.return_value.stderr = 'err'
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        return_value=response, create=True):
+            result = libs.run_bash(remote_connection, 'command')
+
+        assert isinstance(result, libs.CommandResult)
+        assert result.exit_code == 3
+        assert result.stdout_bytes.tobytes() == b'caf\xc3\xa9\n'
+        assert result.stdout == u'café\n'
+        assert result.stderr == 'err'
+
+    @staticmethod
+    def test_bytes_output():
+        result = libs.CommandResult(0, b'caf\xc3\xa9', b'')
+
+        assert isinstance(result.stdout_bytes, memoryview)
+        assert result.stdout == u'café'
+        assert result.stderr == u''
+
+    @staticmethod
+    def test_set_output():
+        result = libs.CommandResult(0, 'abc', '')
+        result.stdout_bytes
+        result.stdout = 'de'
+
+        assert result.stdout == 'de'
+        assert result.stdout_bytes.tobytes() == b'de'
+
+    @staticmethod
+    def test_iter_lines():
+        result = libs.CommandResult(0, 'one\r\ntwo\n\nthree', 'e1\ne2\n')
+
+        assert list(result.iter_lines()) == ['one', 'two', '', 'three']
+        assert list(result.iter_lines(stderr=True)) == ['e1', 'e2']
+        assert list(libs.CommandResult(0, '', '').iter_lines()) == []
+
+    @staticmethod
+    def test_iter_lines_matches_tail():
+        result = libs.CommandResult(0, 'a\r\nb\r', '')
+
+        assert list(result.iter_lines()) == ['a', 'b']
+        assert result.tail(2) == ['a', 'b']
+
+    @staticmethod
+    def test_tail():
+        result = libs.CommandResult(0, 'one\ntwo\nthree\n', 'only')
+
+        assert result.tail(2) == ['two', 'three']
+        assert result.tail(5) == ['one', 'two', 'three']
+        assert result.tail(0) == []
+        assert result.tail(1, stderr=True) == ['only']
+        assert libs.CommandResult(0, '', '').tail(3) == []
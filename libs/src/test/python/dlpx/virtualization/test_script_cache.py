@@ -0,0 +1,128 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import shutil
+
+import mock
+import pytest
+
+from dlpx.virtualization.api import libs_pb2
+from dlpx.virtualization import libs
+from dlpx.virtualization.libs import _script_cache
+from dlpx.virtualization.libs.exceptions import (
+    IncorrectArgumentTypeError, PluginScriptError)
+
+SCRIPT = 'echo "hello $NAME"\nexit 4\n'
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    _script_cache._uploaded.clear()
+    yield
+    _script_cache._uploaded.clear()
+
+
+class TestLibsRunBashCached:
+    @staticmethod
+    def test_run_bash_cached(local_remote_connection, local_run_bash, tmp_path):
+        commands = []
+
+        def run_bash(request):
+            commands.append(request.command)
+            return local_run_bash(request)
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=run_bash, create=True):
+            results = [libs.run_bash_cached(local_remote_connection, SCRIPT,
+                                            variables={'NAME': 'world'})
+                       for _ in range(3)]
+
+        assert [(r.exit_code, r.stdout) for r in results] == [
+            (4, 'hello world\n')] * 3
+        assert len(commands) == 3
+        assert SCRIPT in commands[0]
+        assert all(SCRIPT not in command for command in commands[1:])
+        assert len(list(tmp_path.glob('.dlpx-script-cache/*/*.sh'))) == 1
+
+    @staticmethod
+    def test_run_bash_cached_reuploads_missing_script(local_remote_connection,
+                                                      local_run_bash, tmp_path):
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True) as run_bash:
+            libs.run_bash_cached(local_remote_connection, SCRIPT)
+            shutil.rmtree(str(tmp_path / '.dlpx-script-cache'))
+            result = libs.run_bash_cached(local_remote_connection, SCRIPT)
+
+        assert run_bash.call_count == 3
+        assert result.stdout == 'hello \n'
+        assert len(list(tmp_path.glob('.dlpx-script-cache/*/*.sh'))) == 1
+
+    @staticmethod
+    def test_run_bash_cached_check(local_remote_connection, local_run_bash):
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True):
+            with pytest.raises(PluginScriptError) as info:
+                libs.run_bash_cached(local_remote_connection, SCRIPT,
+                                     check=True)
+
+        assert info.value.message == (
+            'The script failed with exit code 4.'
+            ' stdout : hello \n and  stderr : ')
+
+    @staticmethod
+    def test_run_bash_cached_bad_command(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.run_bash_cached(remote_connection, 10)
+
+        assert err_info.value.message == (
+            "The function run_bash_cached's argument 'command' was"
+            " class 'int' but should be of class 'str'.")
+
+
+class TestLibsRunPowerShellCached:
+    @staticmethod
+    def test_run_powershell_cached(remote_connection):
+        responses = []
+
+        def run_powershell(request):
+            response = libs_pb2.RunPowerShellResponse()
+            if len(responses) == 1:
+                # The cached copy has gone missing on the second call.
+                response.return_value.exit_code = 197
+                response.return_value.stderr = 'DLPX_SCRIPT_CACHE_MISS\n'
+            responses.append(request.command)
+            return response
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_powershell',
+                        side_effect=run_powershell, create=True):
+            for _ in range(3):
+                result = libs.run_powershell_cached(remote_connection,
+                                                    'Write-Output 1')
+                assert result.exit_code == 0
+
+        uploads = ['FromBase64String' in command for command in responses]
+        assert uploads == [True, False, True, False]
+
+
+class TestLibsRunExpectCached:
+    @staticmethod
+    def test_run_expect_cached(remote_connection):
+        expect_response = libs_pb2.RunExpectResponse()
+        expect_response.return_value.stdout = 'done'
+        bash_response = libs_pb2.RunBashResponse()
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_expect',
+                        return_value=expect_response, create=True) as expect:
+            with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                            return_value=bash_response, create=True) as bash:
+                for _ in range(2):
+                    result = libs.run_expect_cached(remote_connection,
+                                                    'puts done')
+                    assert result.stdout == 'done'
+
+        assert bash.call_count == 1
+        assert 'puts done' in bash.call_args[0][0].command
+        assert expect.call_count == 2
+        assert all('puts done' not in call[0][0].command
+                   for call in expect.call_args_list)
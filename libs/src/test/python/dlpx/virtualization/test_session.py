@@ -0,0 +1,124 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import mock
+import pytest
+
+from dlpx.virtualization.api import libs_pb2
+from dlpx.virtualization import libs
+from dlpx.virtualization.libs.exceptions import (
+    IncorrectArgumentTypeError, PluginScriptError)
+
+
+class TestLibsSession:
+    @staticmethod
+    def test_session_carries_state(local_remote_connection, local_run_bash,
+                                   tmp_path):
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True):
+            with libs.session(local_remote_connection) as s:
+                first = s.run('cd {}; export GREETING="it\'s"; echo one'
+                              .format(tmp_path))
+                second = s.run('echo "$GREETING $NAME"; pwd',
+                               variables={'NAME': 'x y'})
+                third = s.run('echo "$NAME"; exit 5')
+
+        assert first.exit_code == 0
+        assert first.stdout == 'one\n'
+        assert second.stdout == "it's x y\n{}\n".format(tmp_path)
+        assert third.exit_code == 5
+        assert third.stdout == 'x y\n'
+        assert not s.active
+
+    @staticmethod
+    def test_session_login_shell_only_once(local_remote_connection,
+                                           local_run_bash):
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True) as run_bash:
+            with libs.session(local_remote_connection, login=True) as s:
+                s.run('true')
+                s.run('true')
+                s.run('true')
+
+        assert [call[0][0].use_login_shell
+                for call in run_bash.call_args_list] == [True, False, False]
+
+    @staticmethod
+    def test_session_idle_timeout(local_remote_connection, local_run_bash):
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True):
+            s = libs.session(local_remote_connection, idle_timeout=60)
+            s.run('export A=1')
+            assert s.active
+            with mock.patch('time.time', return_value=10 ** 12):
+                assert not s.active
+                result = s.run('echo "${A:-unset}"')
+
+        assert result.stdout == 'unset\n'
+
+    @staticmethod
+    def test_session_recreated_after_lost_state(remote_connection):
+        responses = []
+
+        def run_bash(request):
+            responses.append(request)
+            response = libs_pb2.RunBashResponse()
+            response.return_value.exit_code = 137
+            response.return_value.stdout = 'partial'
+            return response
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=run_bash, create=True):
+            s = libs.session(remote_connection, login=True)
+            result = s.run('long running')
+            s.run('again')
+
+        assert result.stdout == 'partial'
+        assert not s.active
+        assert all(r.use_login_shell for r in responses)
+
+    @staticmethod
+    def test_session_check(local_remote_connection, local_run_bash):
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True):
+            s = libs.session(local_remote_connection)
+            with pytest.raises(PluginScriptError) as info:
+                s.run('echo out; echo err >&2; false', check=True)
+
+        assert info.value.message == (
+            'The script failed with exit code 1.'
+            ' stdout : out\n and  stderr : err\n')
+
+    @staticmethod
+    def test_powershell_session(remote_connection):
+        commands = []
+
+        def run_powershell(request):
+            commands.append(request.command)
+            marker = request.command.split("-f\n        '")[1].split("'")[0]
+            response = libs_pb2.RunPowerShellResponse()
+            response.return_value.stdout = (
+                'output\n\n{0} state\nQQ== Yg==\n{0} cwd\nC:\\data\n'.format(
+                    marker))
+            return response
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_powershell',
+                        side_effect=run_powershell, create=True):
+            s = libs.session(remote_connection, powershell=True)
+            first = s.run('Set-Location C:\\data')
+            s.run('Write-Output $env:A')
+
+        assert first.stdout == 'output\n'
+        assert "SetEnvironmentVariable('A', 'b')" in commands[1]
+        assert "Set-Location -LiteralPath 'C:\\data'" in commands[1]
+
+    @staticmethod
+    def test_session_bad_remote_connection():
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.session('BadRemoteConnection')
+
+        assert err_info.value.message == (
+            "The function session's argument 'remote_connection' was"
+            " class 'str' but should be of"
+            " class 'dlpx.virtualization.common._common_classes.RemoteConnection'.")
@@ -0,0 +1,127 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import os
+
+import mock
+import pytest
+
+from dlpx.virtualization import libs
+from dlpx.virtualization.libs.exceptions import (
+    IncorrectArgumentTypeError, PluginScriptError)
+
+
+class TestLibsRunBashStream:
+    @staticmethod
+    def test_run_bash_stream(local_remote_connection, local_run_bash, tmp_path):
+        command = 'seq 1 2000; echo "$SUFFIX"; echo warning >&2; exit 3'
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True) as run_bash:
+            stream = libs.run_bash_stream(local_remote_connection, command,
+                                          variables={'SUFFIX': 'end'},
+                                          chunk_size=1000)
+            chunks = list(stream)
+
+        expected = ''.join('{}\n'.format(i) for i in range(1, 2001)) + 'end\n'
+        assert b''.join(chunks).decode('utf-8') == expected
+        assert all(len(chunk) <= 1000 for chunk in chunks)
+        assert run_bash.call_count > len(expected) // 1000
+        assert stream.exit_code == 3
+        assert stream.stderr == 'warning\n'
+        assert stream.bytes_read == len(expected)
+        assert os.listdir(str(tmp_path)) == []
+
+    @staticmethod
+    def test_run_bash_stream_iter_lines(local_remote_connection,
+                                        local_run_bash):
+        command = u'printf "caf\\303\\251\\nline two\\nno newline"'
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True):
+            stream = libs.run_bash_stream(local_remote_connection, command,
+                                          chunk_size=4)
+            lines = list(stream.iter_lines())
+
+        assert lines == [u'caf\xe9', u'line two', u'no newline']
+        assert stream.exit_code == 0
+
+    @staticmethod
+    def test_run_bash_stream_check(local_remote_connection, local_run_bash):
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True):
+            stream = libs.run_bash_stream(local_remote_connection,
+                                          'echo bad >&2; exit 1', check=True)
+            with pytest.raises(PluginScriptError) as info:
+                list(stream)
+
+        assert info.value.message == (
+            'The script failed with exit code 1.'
+            ' stdout : <streamed> and  stderr : bad\n')
+
+    @staticmethod
+    def test_run_bash_stream_close(local_remote_connection, local_run_bash,
+                                   tmp_path):
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True):
+            with libs.run_bash_stream(local_remote_connection,
+                                      'echo first; sleep 30',
+                                      wait=0) as stream:
+                for chunk in stream:
+                    assert chunk == b'first\n'
+                    break
+
+        assert stream.exit_code is None
+        assert os.listdir(str(tmp_path)) == []
+
+    @staticmethod
+    def test_run_bash_stream_sleeps_without_wait(local_remote_connection,
+                                                 local_run_bash):
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=local_run_bash, create=True), \
+                mock.patch('time.sleep') as sleep:
+            stream = libs.run_bash_stream(local_remote_connection,
+                                          'sleep 0.5; echo done', wait=0)
+            chunks = list(stream)
+
+        assert b''.join(chunks) == b'done\n'
+        assert sleep.call_count >= 1
+        assert all(call[0][0] == 1 for call in sleep.call_args_list)
+
+    @staticmethod
+    def test_run_bash_stream_close_after_read_failure(local_remote_connection,
+                                                      local_run_bash,
+                                                      tmp_path):
+        def run_bash(request):
+            if '__dlpx_b64' in request.command and 'tail -c' in request.command:
+                return local_run_bash(type(request)(command='exit 137'))
+            return local_run_bash(request)
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                        side_effect=run_bash, create=True):
+            with pytest.raises(PluginScriptError):
+                with libs.run_bash_stream(local_remote_connection,
+                                          'sleep 30') as stream:
+                    list(stream)
+
+        assert stream.exit_code is None
+        assert os.listdir(str(tmp_path)) == []
+
+    @staticmethod
+    def test_run_bash_stream_bad_poll_interval(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.run_bash_stream(remote_connection, 'true', poll_interval=-1)
+
+        assert err_info.value.message == (
+            "The function run_bash_stream's argument 'poll_interval' was"
+            " class 'int' but should be of class 'float' if defined.")
+
+    @staticmethod
+    def test_run_bash_stream_bad_command(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.run_bash_stream(remote_connection, 10)
+
+        assert err_info.value.message == (
+            "The function run_bash_stream's argument 'command' was"
+            " class 'int' but should be of class 'str'.")
@@ -0,0 +1,157 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+import json
+import os
+import threading
+import time
+
+import mock
+import pytest
+
+from dlpx.virtualization.api import libs_pb2
+from dlpx.virtualization import libs
+from dlpx.virtualization.libs.exceptions import (
+    IncorrectArgumentTypeError, LibraryError)
+
+
+@pytest.fixture
+def run_bash(local_run_bash):
+    with mock.patch('dlpx.virtualization._engine.libs.run_bash',
+                    side_effect=local_run_bash, create=True) as run_bash:
+        yield run_bash
+
+
+@pytest.fixture
+def run_sync():
+    with mock.patch('dlpx.virtualization._engine.libs.run_sync',
+                    return_value=libs_pb2.RunSyncResponse(),
+                    create=True) as run_sync:
+        yield run_sync
+
+
+@pytest.fixture
+def directories(tmp_path):
+    first = tmp_path / 'first'
+    second = tmp_path / 'second dir'
+    (first / 'sub').mkdir(parents=True)
+    second.mkdir()
+    (first / 'a').write_text('a')
+    (first / 'sub' / 'b c').write_text('bc')
+    (first / 'logs').mkdir()
+    (first / 'logs' / 'log').write_text('log')
+    (second / 'd').write_text('dddd')
+    return [str(first), str(second)]
+
+
+def synced_directories(run_sync):
+    return sorted(call[0][0].source_directory
+                  for call in run_sync.call_args_list)
+
+
+class TestLibsRunSyncMany:
+    @staticmethod
+    def test_run_sync_many(local_remote_connection, run_bash, run_sync,
+                           directories):
+        manifest = libs.run_sync_many(local_remote_connection, directories,
+                                      exclude_paths=['logs'])
+
+        assert run_bash.call_count == 1
+        assert synced_directories(run_sync) == sorted(directories)
+        assert manifest.synced == directories
+        assert manifest.skipped == []
+        assert [entry[:2] for entry in manifest.files(directories[0])] == [
+            ('a', 1), ('sub/b c', 2)]
+        assert [entry[:2] for entry in manifest.files(directories[1])] == [
+            ('d', 4)]
+        assert all(entry[3] is None for entry in manifest.files(directories[0]))
+
+    @staticmethod
+    def test_run_sync_many_skips_unchanged(local_remote_connection, run_bash,
+                                           run_sync, directories):
+        previous = libs.run_sync_many(local_remote_connection, directories,
+                                      checksum=True)
+        previous = json.loads(json.dumps(previous.to_dict()))
+        run_sync.reset_mock()
+
+        path = os.path.join(directories[1], 'd')
+        with open(path, 'w') as f:
+            f.write('eeee')
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        manifest = libs.run_sync_many(local_remote_connection, directories,
+                                      previous_manifest=previous,
+                                      checksum=True)
+
+        assert synced_directories(run_sync) == [directories[1]]
+        assert manifest.synced == [directories[1]]
+        assert manifest.skipped == [directories[0]]
+        assert len(manifest.files(directories[1])[0][3]) == 64
+
+    @staticmethod
+    def test_run_sync_many_missing_directory(local_remote_connection, run_bash,
+                                             run_sync, directories, tmp_path):
+        missing = str(tmp_path / 'missing')
+        previous = libs.run_sync_many(local_remote_connection, directories)
+
+        manifest = libs.run_sync_many(local_remote_connection,
+                                      directories + [missing],
+                                      previous_manifest=previous)
+
+        assert manifest.synced == [missing]
+        assert manifest.directories == directories
+
+    @staticmethod
+    def test_run_sync_many_parallelism(local_remote_connection, run_bash,
+                                       directories, tmp_path):
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def mock_run_sync(request):
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+            time.sleep(0.1)
+            with lock:
+                active[0] -= 1
+            return libs_pb2.RunSyncResponse()
+
+        for index in range(4):
+            (tmp_path / str(index)).mkdir()
+        sources = directories + [str(tmp_path / str(i)) for i in range(4)]
+        with mock.patch('dlpx.virtualization._engine.libs.run_sync',
+                        side_effect=mock_run_sync, create=True):
+            libs.run_sync_many(local_remote_connection, sources, max_workers=2)
+
+        assert active[1] == 2
+
+    @staticmethod
+    def test_run_sync_many_error(local_remote_connection, run_bash,
+                                 directories):
+        response = libs_pb2.RunSyncResponse()
+        response.error.actionable_error.id = 1
+        response.error.actionable_error.message = 'sync failed'
+
+        with mock.patch('dlpx.virtualization._engine.libs.run_sync',
+                        return_value=response, create=True):
+            with pytest.raises(LibraryError) as err_info:
+                libs.run_sync_many(local_remote_connection, directories)
+
+        assert err_info.value.message == 'sync failed'
+
+    @staticmethod
+    def test_run_sync_many_bad_max_workers(remote_connection):
+        with pytest.raises(IncorrectArgumentTypeError) as err_info:
+            libs.run_sync_many(remote_connection, ['/dir'], max_workers='2')
+
+        assert err_info.value.message == (
+            "The function run_sync_many's argument 'max_workers' was class"
+            " 'str' but should be of class 'int' if defined.")
+
+    @staticmethod
+    def test_run_sync_many_bad_manifest(remote_connection):
+        with pytest.raises(ValueError):
+            libs.run_sync_many(remote_connection, ['/dir'],
+                               previous_manifest={'version': 0})
@@ -7,6 +7,7 @@ __path__ = __import__('pkgutil').extend_path(__path__, __name__)
 from dlpx.virtualization.platform.validation_util import *  # noqa
 from dlpx.virtualization.platform.migration_helper import *  # noqa
 from dlpx.virtualization.platform._plugin_classes import *  # noqa
+from dlpx.virtualization.platform._definitions import *  # noqa
 from dlpx.virtualization.platform._discovery import *  # noqa
 from dlpx.virtualization.platform._linked import *  # noqa
 from dlpx.virtualization.platform._upgrade import *  # noqa
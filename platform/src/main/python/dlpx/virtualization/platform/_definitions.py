@@ -0,0 +1,192 @@
+#
+# Copyright (c) 2026 by Delphix. All rights reserved.
+#
+
+"""Deserialization of the plugin defined objects in operation requests.
+
+The operation wrappers turn the JSON of every repository, source config,
+linked or virtual source and snapshot in a request into an instance of the
+plugin's generated definition class. The same repository or source config is
+sent with every status, start, stop and snapshot request, so once the cache
+is enabled with enable_definition_cache, the definitions built from a JSON
+text are kept and later requests with the same text reuse them.
+
+Generated definitions can be modified by plugin code, so every caller gets
+its own deep copy of the cached definition and changes made by one operation
+are never seen by another.
+
+Once lazy definitions are enabled with enable_lazy_definitions, operations
+receive proxies that keep the JSON text and only build the definition when
+one of its attributes is first used, so the definitions an operation does
+not look at are never parsed.
+"""
+
+import collections
+import copy
+import hashlib
+import json
+import threading
+
+import six
+from dlpx.virtualization.common.exceptions import IncorrectTypeError
+
+__all__ = [
+    "enable_definition_cache",
+    "disable_definition_cache",
+    "enable_lazy_definitions",
+    "disable_lazy_definitions"
+]
+
+_lock = threading.Lock()
+_entries = collections.OrderedDict()
+_max_size = 0
+_lazy = False
+
+
+class _LazyDefinition(object):
+    """A stand-in for a generated definition that builds the definition from
+    its JSON when one of its attributes is first used, and from then on
+    forwards every attribute access to it.
+
+    isinstance() checks against the definition class succeed without building
+    the definition, but type() returns this class.
+    """
+    __slots__ = ('__definition_class', '__json', '__definition')
+
+    def __init__(self, definition_class, parameters_json):
+        object.__setattr__(self, '_LazyDefinition__definition_class',
+                           definition_class)
+        object.__setattr__(self, '_LazyDefinition__json', parameters_json)
+        object.__setattr__(self, '_LazyDefinition__definition', None)
+
+    def __load(self):
+        definition = self.__definition
+        if definition is None:
+            definition = _build(self.__definition_class, self.__json)
+            object.__setattr__(self, '_LazyDefinition__definition', definition)
+        return definition
+
+    @property
+    def __class__(self):
+        return self.__definition_class
+
+    def __getattr__(self, name):
+        return getattr(self.__load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.__load(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self.__load(), name)
+
+    def __dir__(self):
+        return dir(self.__load())
+
+    def __eq__(self, other):
+        if isinstance(other, _LazyDefinition):
+            other = other.__load()
+        return self.__load() == other
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.__load())
+
+    def __repr__(self):
+        return repr(self.__load())
+
+    def __copy__(self):
+        return copy.copy(self.__load())
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self.__load(), memo)
+
+
+def _build(definition_class, parameters_json):
+    """Returns definition_class.from_dict(json.loads(parameters_json)), from
+    the cache if it is enabled."""
+    if not _max_size:
+        return definition_class.from_dict(json.loads(parameters_json))
+
+    key = (definition_class,
+           hashlib.sha256(parameters_json.encode('utf-8')).digest())
+    with _lock:
+        definition = _entries.get(key)
+        if definition is not None:
+            _entries.move_to_end(key)
+    if definition is None:
+        definition = definition_class.from_dict(json.loads(parameters_json))
+        with _lock:
+            _entries[key] = definition
+            _entries.move_to_end(key)
+            while len(_entries) > _max_size:
+                _entries.popitem(last=False)
+    return copy.deepcopy(definition)
+
+
+def from_json(definition_class, parameters_json):
+    """Returns the definition of class definition_class for the JSON of a
+    plugin defined object, or a lazy proxy for it if lazy definitions are
+    enabled.
+
+    Args:
+        definition_class: The generated definition class.
+        parameters_json (str): The JSON of a plugin defined object.
+    """
+    if _lazy:
+        return _LazyDefinition(definition_class, parameters_json)
+    return _build(definition_class, parameters_json)
+
+
+def enable_definition_cache(max_size=128):
+    """Enables caching of the definitions that operation wrappers build from
+    the plugin defined objects in requests.
+
+    When the cache holds max_size definitions, the least recently used one is
+    evicted. Enabling an enabled cache changes its size and keeps the cached
+    definitions, trimmed to the new size.
+
+    Args:
+        max_size (int): Maximum number of definitions to cache. Must not be
+        negative; 0 caches nothing.
+    """
+    global _max_size
+
+    if (not isinstance(max_size, six.integer_types) or
+            isinstance(max_size, bool) or max_size < 0):
+        raise IncorrectTypeError(
+            enable_definition_cache, 'max_size', type(max_size), int)
+
+    with _lock:
+        _max_size = max_size
+        while len(_entries) > _max_size:
+            _entries.popitem(last=False)
+
+
+def disable_definition_cache():
+    """Disables the definition cache and drops all cached definitions."""
+    global _max_size
+
+    with _lock:
+        _max_size = 0
+        _entries.clear()
+
+
+def enable_lazy_definitions():
+    """Makes operation wrappers pass plugin operations proxies for their
+    definitions, which only parse and build the definition when one of its
+    attributes is first used.
+
+    Errors in the JSON of a definition are then raised when the plugin first
+    uses the definition, rather than before the operation is called.
+    """
+    global _lazy
+    _lazy = True
+
+
+def disable_lazy_definitions():
+    """Makes operation wrappers build definitions before calling plugin
+    operations again."""
+    global _lazy
+    _lazy = False
@@ -10,6 +10,7 @@ import json
 
 from dlpx.virtualization.api import common_pb2, platform_pb2
 from dlpx.virtualization.common import RemoteConnection
+from dlpx.virtualization.platform import _definitions
 from dlpx.virtualization.platform import validation_util as v
 from dlpx.virtualization.platform.exceptions import (
     IncorrectReturnTypeError, OperationAlreadyDefinedError,
@@ -132,8 +133,8 @@ class DiscoveryOperations(object):
         if not self.source_config_impl:
             raise OperationNotDefinedError(Op.DISCOVERY_SOURCE_CONFIG)
 
-        repository_definition = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
+        repository_definition = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
 
         source_configs = self.source_config_impl(
             source_connection=RemoteConnection.from_proto(
@@ -14,6 +14,7 @@ from dlpx.virtualization.common.exceptions import PluginRuntimeError
 from dlpx.virtualization.platform import (DirectSource, Mount,
                                           MountSpecification, StagedSource,
                                           Status)
+from dlpx.virtualization.platform import _definitions
 from dlpx.virtualization.platform import validation_util as v
 from dlpx.virtualization.platform.exceptions import (
     IncorrectReturnTypeError, OperationAlreadyDefinedError,
@@ -165,18 +166,18 @@ class LinkedOperations(object):
         if not self.pre_snapshot_impl:
             raise OperationNotDefinedError(Op.LINKED_PRE_SNAPSHOT)
 
-        direct_source_definition = LinkedSourceDefinition.from_dict(
-            json.loads(request.direct_source.linked_source.parameters.json))
+        direct_source_definition = _definitions.from_json(
+            LinkedSourceDefinition, request.direct_source.linked_source.parameters.json)
         direct_source = DirectSource(
             guid=request.direct_source.linked_source.guid,
             connection=RemoteConnection.from_proto(
                 request.direct_source.connection),
             parameters=direct_source_definition)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
         snap_params = json.loads(request.snapshot_parameters.parameters.json)
         #
         # The snapshot_parameters object should be set to None if the json from
@@ -232,18 +233,18 @@ class LinkedOperations(object):
         if not self.post_snapshot_impl:
             raise OperationNotDefinedError(Op.LINKED_POST_SNAPSHOT)
 
-        direct_source_definition = LinkedSourceDefinition.from_dict(
-            json.loads(request.direct_source.linked_source.parameters.json))
+        direct_source_definition = _definitions.from_json(
+            LinkedSourceDefinition, request.direct_source.linked_source.parameters.json)
         direct_source = DirectSource(
             guid=request.direct_source.linked_source.guid,
             connection=RemoteConnection.from_proto(
                 request.direct_source.connection),
             parameters=direct_source_definition)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
         snap_params = json.loads(request.snapshot_parameters.parameters.json)
         #
         # The snapshot_parameters object should be set to None if the json from
@@ -300,18 +301,18 @@ class LinkedOperations(object):
         if not self.source_size_impl:
             raise OperationNotDefinedError(Op.LINKED_SOURCE_SIZE)
 
-        direct_source_definition = LinkedSourceDefinition.from_dict(
-            json.loads(request.direct_source.linked_source.parameters.json))
+        direct_source_definition = _definitions.from_json(
+            LinkedSourceDefinition, request.direct_source.linked_source.parameters.json)
         direct_source = DirectSource(
             guid=request.direct_source.linked_source.guid,
             connection=RemoteConnection.from_proto(
                 request.direct_source.connection),
             parameters=direct_source_definition)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
 
         source_size = self.source_size_impl(
             direct_source=direct_source,
@@ -353,8 +354,8 @@ class LinkedOperations(object):
             raise OperationNotDefinedError(Op.LINKED_PRE_SNAPSHOT)
 
         linked_source = request.staged_source.linked_source
-        staged_source_definition = (LinkedSourceDefinition.from_dict(
-            json.loads(linked_source.parameters.json)))
+        staged_source_definition = (_definitions.from_json(
+            LinkedSourceDefinition, linked_source.parameters.json))
         staged_mount, mounts = LinkedOperations._get_mounts_from_request(request)
         staged_source = StagedSource(
             guid=linked_source.guid,
@@ -366,10 +367,10 @@ class LinkedOperations(object):
                 request.staged_source.staged_connection),
             mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
         snap_params = json.loads(request.snapshot_parameters.parameters.json)
         #
         # The snapshot_parameters object should be set to None if the json from
@@ -425,8 +426,8 @@ class LinkedOperations(object):
         if not self.post_snapshot_impl:
             raise OperationNotDefinedError(Op.LINKED_POST_SNAPSHOT)
 
-        staged_source_definition = LinkedSourceDefinition.from_dict(
-            json.loads(request.staged_source.linked_source.parameters.json))
+        staged_source_definition = _definitions.from_json(
+            LinkedSourceDefinition, request.staged_source.linked_source.parameters.json)
         staged_mount, mounts = LinkedOperations._get_mounts_from_request(request)
         staged_source = StagedSource(
             guid=request.staged_source.linked_source.guid,
@@ -438,10 +439,10 @@ class LinkedOperations(object):
                 request.staged_source.staged_connection),
             mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
         snap_params = json.loads(request.snapshot_parameters.parameters.json)
         #
         # The snapshot_parameters object should be set to None if the json from
@@ -496,8 +497,8 @@ class LinkedOperations(object):
         if not self.start_staging_impl:
             raise OperationNotDefinedError(Op.LINKED_START_STAGING)
 
-        staged_source_definition = LinkedSourceDefinition.from_dict(
-            json.loads(request.staged_source.linked_source.parameters.json))
+        staged_source_definition = _definitions.from_json(
+            LinkedSourceDefinition, request.staged_source.linked_source.parameters.json)
         staged_mount, mounts = LinkedOperations._get_mounts_from_request(request)
         staged_source = StagedSource(
             guid=request.staged_source.linked_source.guid,
@@ -509,10 +510,10 @@ class LinkedOperations(object):
                 request.staged_source.staged_connection),
             mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
 
         self.start_staging_impl(staged_source=staged_source,
                                 repository=repository,
@@ -552,8 +553,8 @@ class LinkedOperations(object):
         if not self.stop_staging_impl:
             raise OperationNotDefinedError(Op.LINKED_STOP_STAGING)
 
-        staged_source_definition = LinkedSourceDefinition.from_dict(
-            json.loads(request.staged_source.linked_source.parameters.json))
+        staged_source_definition = _definitions.from_json(
+            LinkedSourceDefinition, request.staged_source.linked_source.parameters.json)
         staged_mount, mounts = LinkedOperations._get_mounts_from_request(request)
         staged_source = StagedSource(
             guid=request.staged_source.linked_source.guid,
@@ -565,10 +566,10 @@ class LinkedOperations(object):
                 request.staged_source.staged_connection),
             mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
 
         self.stop_staging_impl(staged_source=staged_source,
                                repository=repository,
@@ -608,8 +609,8 @@ class LinkedOperations(object):
         if not self.status_impl:
             raise OperationNotDefinedError(Op.LINKED_STATUS)
 
-        staged_source_definition = LinkedSourceDefinition.from_dict(
-            json.loads(request.staged_source.linked_source.parameters.json))
+        staged_source_definition = _definitions.from_json(
+            LinkedSourceDefinition, request.staged_source.linked_source.parameters.json)
         staged_mount, mounts = LinkedOperations._get_mounts_from_request(request)
         staged_source = StagedSource(
             guid=request.staged_source.linked_source.guid,
@@ -621,10 +622,10 @@ class LinkedOperations(object):
                 request.staged_source.staged_connection),
             mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
 
         status = self.status_impl(staged_source=staged_source,
                                   repository=repository,
@@ -668,8 +669,8 @@ class LinkedOperations(object):
         if not self.worker_impl:
             raise OperationNotDefinedError(Op.LINKED_WORKER)
 
-        staged_source_definition = LinkedSourceDefinition.from_dict(
-            json.loads(request.staged_source.linked_source.parameters.json))
+        staged_source_definition = _definitions.from_json(
+            LinkedSourceDefinition, request.staged_source.linked_source.parameters.json)
         staged_mount, mounts = LinkedOperations._get_mounts_from_request(request)
         staged_source = StagedSource(
             guid=request.staged_source.linked_source.guid,
@@ -681,10 +682,10 @@ class LinkedOperations(object):
                 request.staged_source.staged_connection),
             mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
 
         self.worker_impl(staged_source=staged_source,
                          repository=repository,
@@ -748,8 +749,8 @@ class LinkedOperations(object):
         if not self.mount_specification_impl:
             raise OperationNotDefinedError(Op.LINKED_MOUNT_SPEC)
 
-        staged_source_definition = LinkedSourceDefinition.from_dict(
-            json.loads(request.staged_source.linked_source.parameters.json))
+        staged_source_definition = _definitions.from_json(
+            LinkedSourceDefinition, request.staged_source.linked_source.parameters.json)
         staged_mount, mounts = LinkedOperations._get_mounts_from_request(request)
         staged_source = StagedSource(
             guid=request.staged_source.linked_source.guid,
@@ -761,8 +762,8 @@ class LinkedOperations(object):
                 request.staged_source.staged_connection),
             mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
 
         mount_spec = self.mount_specification_impl(staged_source=staged_source,
                                                    repository=repository)
@@ -825,8 +826,8 @@ class LinkedOperations(object):
         if not self.source_size_impl:
             raise OperationNotDefinedError(Op.LINKED_SOURCE_SIZE)
 
-        staged_source_definition = LinkedSourceDefinition.from_dict(
-            json.loads(request.staged_source.linked_source.parameters.json))
+        staged_source_definition = _definitions.from_json(
+            LinkedSourceDefinition, request.staged_source.linked_source.parameters.json)
         staged_mount, mounts = LinkedOperations._get_mounts_from_request(request)
         staged_source = StagedSource(
             guid=request.staged_source.linked_source.guid,
@@ -838,10 +839,10 @@ class LinkedOperations(object):
                 request.staged_source.staged_connection),
             mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
 
         source_size = self.source_size_impl(
             staged_source=staged_source,
@@ -12,6 +12,7 @@ from dlpx.virtualization.api import common_pb2, platform_pb2
 from dlpx.virtualization.common import RemoteConnection, RemoteEnvironment
 from dlpx.virtualization.platform import (Mount, MountSpecification, Status,
                                           VirtualSource)
+from dlpx.virtualization.platform import _definitions
 from dlpx.virtualization.platform import validation_util as v
 from dlpx.virtualization.platform.exceptions import (
     IncorrectReturnTypeError, OperationAlreadyDefinedError,
@@ -191,8 +192,8 @@ class VirtualOperations(object):
         if not self.configure_impl:
             raise OperationNotDefinedError(Op.VIRTUAL_CONFIGURE)
 
-        virtual_source_definition = VirtualSourceDefinition.from_dict(
-            json.loads(request.virtual_source.parameters.json))
+        virtual_source_definition = _definitions.from_json(
+            VirtualSourceDefinition, request.virtual_source.parameters.json)
         mounts = [
             VirtualOperations._from_protobuf_single_subset_mount(m)
             for m in request.virtual_source.mounts
@@ -204,10 +205,10 @@ class VirtualOperations(object):
                                        parameters=virtual_source_definition,
                                        mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        snapshot = SnapshotDefinition.from_dict(
-            json.loads(request.snapshot.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        snapshot = _definitions.from_json(
+            SnapshotDefinition, request.snapshot.parameters.json)
 
         config = self.configure_impl(virtual_source=virtual_source,
                                      repository=repository,
@@ -250,8 +251,8 @@ class VirtualOperations(object):
         if not self.unconfigure_impl:
             raise OperationNotDefinedError(Op.VIRTUAL_UNCONFIGURE)
 
-        virtual_source_definition = VirtualSourceDefinition.from_dict(
-            json.loads(request.virtual_source.parameters.json))
+        virtual_source_definition = _definitions.from_json(
+            VirtualSourceDefinition, request.virtual_source.parameters.json)
         mounts = [
             VirtualOperations._from_protobuf_single_subset_mount(m)
             for m in request.virtual_source.mounts
@@ -263,10 +264,10 @@ class VirtualOperations(object):
                                        parameters=virtual_source_definition,
                                        mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
 
         self.unconfigure_impl(repository=repository,
                               source_config=source_config,
@@ -302,8 +303,8 @@ class VirtualOperations(object):
         if not self.cleanup_impl:
             raise OperationNotDefinedError(Op.VIRTUAL_CLEANUP)
 
-        virtual_source_definition = VirtualSourceDefinition.from_dict(
-            json.loads(request.virtual_source.parameters.json))
+        virtual_source_definition = _definitions.from_json(
+            VirtualSourceDefinition, request.virtual_source.parameters.json)
         mounts = [
             VirtualOperations._from_protobuf_single_subset_mount(m)
             for m in request.virtual_source.mounts
@@ -315,10 +316,10 @@ class VirtualOperations(object):
                                        parameters=virtual_source_definition,
                                        mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
 
         self.cleanup_impl(
             repository=repository, source_config=source_config,
@@ -351,8 +352,8 @@ class VirtualOperations(object):
         if not self.reconfigure_impl:
             raise OperationNotDefinedError(Op.VIRTUAL_RECONFIGURE)
 
-        virtual_source_definition = VirtualSourceDefinition.from_dict(
-            json.loads(request.virtual_source.parameters.json))
+        virtual_source_definition = _definitions.from_json(
+            VirtualSourceDefinition, request.virtual_source.parameters.json)
         mounts = [
             VirtualOperations._from_protobuf_single_subset_mount(m)
             for m in request.virtual_source.mounts
@@ -363,12 +364,12 @@ class VirtualOperations(object):
                                        parameters=virtual_source_definition,
                                        mounts=mounts)
 
-        snapshot = SnapshotDefinition.from_dict(
-            json.loads(request.snapshot.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
+        snapshot = _definitions.from_json(
+            SnapshotDefinition, request.snapshot.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
 
         config = self.reconfigure_impl(snapshot=snapshot,
                                        repository=repository,
@@ -411,8 +412,8 @@ class VirtualOperations(object):
         if not self.start_impl:
             raise OperationNotDefinedError(Op.VIRTUAL_START)
 
-        virtual_source_definition = VirtualSourceDefinition.from_dict(
-            json.loads(request.virtual_source.parameters.json))
+        virtual_source_definition = _definitions.from_json(
+            VirtualSourceDefinition, request.virtual_source.parameters.json)
         mounts = [
             VirtualOperations._from_protobuf_single_subset_mount(m)
             for m in request.virtual_source.mounts
@@ -423,10 +424,10 @@ class VirtualOperations(object):
                                        parameters=virtual_source_definition,
                                        mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
 
         self.start_impl(repository=repository,
                         source_config=source_config,
@@ -460,8 +461,8 @@ class VirtualOperations(object):
         if not self.stop_impl:
             raise OperationNotDefinedError(Op.VIRTUAL_STOP)
 
-        virtual_source_definition = VirtualSourceDefinition.from_dict(
-            json.loads(request.virtual_source.parameters.json))
+        virtual_source_definition = _definitions.from_json(
+            VirtualSourceDefinition, request.virtual_source.parameters.json)
         mounts = [
             VirtualOperations._from_protobuf_single_subset_mount(m)
             for m in request.virtual_source.mounts
@@ -472,10 +473,10 @@ class VirtualOperations(object):
                                        parameters=virtual_source_definition,
                                        mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
 
         self.stop_impl(repository=repository,
                        source_config=source_config,
@@ -514,8 +515,8 @@ class VirtualOperations(object):
         if not self.pre_snapshot_impl:
             raise OperationNotDefinedError(Op.VIRTUAL_PRE_SNAPSHOT)
 
-        virtual_source_definition = VirtualSourceDefinition.from_dict(
-            json.loads(request.virtual_source.parameters.json))
+        virtual_source_definition = _definitions.from_json(
+            VirtualSourceDefinition, request.virtual_source.parameters.json)
         mounts = [
             VirtualOperations._from_protobuf_single_subset_mount(m)
             for m in request.virtual_source.mounts
@@ -526,10 +527,10 @@ class VirtualOperations(object):
                                        parameters=virtual_source_definition,
                                        mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
 
         self.pre_snapshot_impl(repository=repository,
                                source_config=source_config,
@@ -574,8 +575,8 @@ class VirtualOperations(object):
         if not self.post_snapshot_impl:
             raise OperationNotDefinedError(Op.VIRTUAL_POST_SNAPSHOT)
 
-        virtual_source_definition = VirtualSourceDefinition.from_dict(
-            json.loads(request.virtual_source.parameters.json))
+        virtual_source_definition = _definitions.from_json(
+            VirtualSourceDefinition, request.virtual_source.parameters.json)
         mounts = [
             VirtualOperations._from_protobuf_single_subset_mount(m)
             for m in request.virtual_source.mounts
@@ -586,10 +587,10 @@ class VirtualOperations(object):
                                        parameters=virtual_source_definition,
                                        mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
 
         snapshot = self.post_snapshot_impl(repository=repository,
                                            source_config=source_config,
@@ -633,8 +634,8 @@ class VirtualOperations(object):
         if not self.status_impl:
             raise OperationNotDefinedError(Op.VIRTUAL_STATUS)
 
-        virtual_source_definition = VirtualSourceDefinition.from_dict(
-            json.loads(request.virtual_source.parameters.json))
+        virtual_source_definition = _definitions.from_json(
+            VirtualSourceDefinition, request.virtual_source.parameters.json)
         mounts = [
             VirtualOperations._from_protobuf_single_subset_mount(m)
             for m in request.virtual_source.mounts
@@ -645,10 +646,10 @@ class VirtualOperations(object):
                                        parameters=virtual_source_definition,
                                        mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
 
         virtual_status = self.status_impl(repository=repository,
                                           source_config=source_config,
@@ -686,8 +687,8 @@ class VirtualOperations(object):
         if not self.initialize_impl:
             raise OperationNotDefinedError(Op.VIRTUAL_INITIALIZE)
 
-        virtual_source_definition = VirtualSourceDefinition.from_dict(
-            json.loads(request.virtual_source.parameters.json))
+        virtual_source_definition = _definitions.from_json(
+            VirtualSourceDefinition, request.virtual_source.parameters.json)
         mounts = [
             VirtualOperations._from_protobuf_single_subset_mount(m)
             for m in request.virtual_source.mounts
@@ -698,8 +699,8 @@ class VirtualOperations(object):
                                        parameters=virtual_source_definition,
                                        mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
 
         config = self.initialize_impl(
             repository=repository, virtual_source=virtual_source)
@@ -757,8 +758,8 @@ class VirtualOperations(object):
         if not self.mount_specification_impl:
             raise OperationNotDefinedError(Op.VIRTUAL_MOUNT_SPEC)
 
-        virtual_source_definition = VirtualSourceDefinition.from_dict(
-            json.loads(request.virtual_source.parameters.json))
+        virtual_source_definition = _definitions.from_json(
+            VirtualSourceDefinition, request.virtual_source.parameters.json)
         mounts = [
             VirtualOperations._from_protobuf_single_subset_mount(m)
             for m in request.virtual_source.mounts
@@ -769,8 +770,8 @@ class VirtualOperations(object):
                                        parameters=virtual_source_definition,
                                        mounts=mounts)
 
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
 
         virtual_mount_spec = self.mount_specification_impl(
             repository=repository, virtual_source=virtual_source)
@@ -823,8 +824,8 @@ class VirtualOperations(object):
         if not self.source_size_impl:
             raise OperationNotDefinedError(Op.VIRTUAL_SOURCE_SIZE)
 
-        virtual_source_definition = VirtualSourceDefinition.from_dict(
-            json.loads(request.virtual_source.parameters.json))
+        virtual_source_definition = _definitions.from_json(
+            VirtualSourceDefinition, request.virtual_source.parameters.json)
         mounts = [
             VirtualOperations._from_protobuf_single_subset_mount(m)
             for m in request.virtual_source.mounts
@@ -834,10 +835,10 @@ class VirtualOperations(object):
                                            request.virtual_source.connection),
                                        parameters=virtual_source_definition,
                                        mounts=mounts)
-        repository = RepositoryDefinition.from_dict(
-            json.loads(request.repository.parameters.json))
-        source_config = SourceConfigDefinition.from_dict(
-            json.loads(request.source_config.parameters.json))
+        repository = _definitions.from_json(
+            RepositoryDefinition, request.repository.parameters.json)
+        source_config = _definitions.from_json(
+            SourceConfigDefinition, request.source_config.parameters.json)
 
         source_size = self.source_size_impl(
             virtual_source=virtual_source,
@@ -683,6 +683,113 @@ class TestPlugin:
 
         assert virtual_status_response.return_value.status == expected_status
 
+    @staticmethod
+    def test_virtual_status_definition_cache(my_plugin, virtual_source,
+                                             repository, source_config):
+        from dlpx.virtualization.platform import (Status,
+                                                  disable_definition_cache,
+                                                  enable_definition_cache)
+        names = []
+
+        @my_plugin.virtual.status()
+        def virtual_status_impl(virtual_source, repository, source_config):
+            names.append(repository.name)
+            repository._name = 'changed'
+            return Status.ACTIVE
+
+        virtual_status_request = platform_pb2.VirtualStatusRequest()
+        TestPlugin.setup_request(request=virtual_status_request,
+                                 virtual_source=virtual_source,
+                                 repository=repository,
+                                 source_config=source_config)
+
+        enable_definition_cache()
+        try:
+            with patch.object(RepositoryDefinition, 'from_dict',
+                              side_effect=RepositoryDefinition.from_dict
+                              ) as from_dict:
+                my_plugin.virtual._internal_status(virtual_status_request)
+                my_plugin.virtual._internal_status(virtual_status_request)
+        finally:
+            disable_definition_cache()
+
+        assert from_dict.call_count == 1
+        assert names == [TEST_REPOSITORY, TEST_REPOSITORY]
+
+    @staticmethod
+    def test_enable_definition_cache_negative_size():
+        from dlpx.virtualization.common.exceptions import IncorrectTypeError
+        from dlpx.virtualization.platform import (_definitions,
+                                                  enable_definition_cache)
+
+        with pytest.raises(IncorrectTypeError):
+            enable_definition_cache(-1)
+
+        assert _definitions._max_size == 0
+
+    @staticmethod
+    def test_virtual_status_lazy_definitions(my_plugin, virtual_source,
+                                             repository, source_config):
+        from dlpx.virtualization.platform import (Status,
+                                                  disable_lazy_definitions,
+                                                  enable_lazy_definitions)
+
+        @my_plugin.virtual.status()
+        def virtual_status_impl(virtual_source, repository, source_config):
+            assert isinstance(source_config, SourceConfigDefinition)
+            assert repository.name == TEST_REPOSITORY
+            return Status.ACTIVE
+
+        virtual_status_request = platform_pb2.VirtualStatusRequest()
+        TestPlugin.setup_request(request=virtual_status_request,
+                                 virtual_source=virtual_source,
+                                 repository=repository,
+                                 source_config=source_config)
+
+        enable_lazy_definitions()
+        try:
+            with patch.object(RepositoryDefinition, 'from_dict',
+                              side_effect=RepositoryDefinition.from_dict
+                              ) as repository_from_dict, \
+                    patch.object(SourceConfigDefinition, 'from_dict',
+                                 side_effect=SourceConfigDefinition.from_dict
+                                 ) as source_config_from_dict:
+                my_plugin.virtual._internal_status(virtual_status_request)
+        finally:
+            disable_lazy_definitions()
+
+        assert repository_from_dict.call_count == 1
+        assert source_config_from_dict.call_count == 0
+
+    @staticmethod
+    def test_virtual_reconfigure_lazy_definitions(my_plugin, virtual_source,
+                                                  repository, source_config,
+                                                  snapshot):
+        from dlpx.virtualization.platform import (disable_lazy_definitions,
+                                                  enable_lazy_definitions)
+
+        @my_plugin.virtual.reconfigure()
+        def virtual_reconfigure_impl(virtual_source, repository,
+                                     source_config, snapshot):
+            return source_config
+
+        reconfigure_request = platform_pb2.ReconfigureRequest()
+        TestPlugin.setup_request(request=reconfigure_request,
+                                 virtual_source=virtual_source,
+                                 repository=repository,
+                                 source_config=source_config,
+                                 snapshot=snapshot)
+
+        enable_lazy_definitions()
+        try:
+            reconfigure_response = my_plugin.virtual._internal_reconfigure(
+                reconfigure_request)
+        finally:
+            disable_lazy_definitions()
+
+        assert (json.loads(reconfigure_response.return_value.source_config
+                           .parameters.json) == {'name': TEST_SOURCE_CONFIG})
+
     @staticmethod
     def test_virtual_initialize(my_plugin, virtual_source, repository,
                                 source_config):